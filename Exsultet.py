@@ -2,137 +2,151 @@
 A module to print the text of Exsultet, a liturgical proclamation at the conclusion of the Liturgy of Light in the Easter Vigil.
 """
 
-def Exsultet(deacon = True):
+def ExsultetText(deacon = True) -> str:
     """
-    This function prints the text of Exsultet, a liturgical proclamation at the conclusion of the Liturgy of Light in the Easter Vigil.
+    This function returns the text of Exsultet, a liturgical proclamation at the conclusion of the Liturgy of Light in the Easter Vigil.
     
     Args:
-        deacon (bool): Whether to print the deacon's part. Default is True.
+        deacon (bool): Whether to include the deacon's part. Default is True.
+    
+    Returns:
+        str: The text of Exsultet.
     """
-    print("EXULT, let them exult, the hosts of heaven,")
-    print("exult, let Angel ministers of God exult,")
-    print("let the trumpet of salvation")
-    print("sound aloud our mighty King's triumph!")
-
-    print("\nBe glad, let earth be glad, as glory floods her,")
-    print("ablaze with light from her eternal King,")
-    print("let all corners of the earth be glad,")
-    print("knowing an end to gloom and darkness.")
-
-    print("\nRejoice, let Mother Church also rejoice,")
-    print("arrayed with the lightning of His glory,")
-    print("let this holy building shake with joy,")
-    print("filled with the mighty voices of the peoples.")
+    lines = []
+    lines.append("EXULT, let them exult, the hosts of heaven,")
+    lines.append("exult, let Angel ministers of God exult,")
+    lines.append("let the trumpet of salvation")
+    lines.append("sound aloud our mighty King's triumph!")
+
+    lines.append("\nBe glad, let earth be glad, as glory floods her,")
+    lines.append("ablaze with light from her eternal King,")
+    lines.append("let all corners of the earth be glad,")
+    lines.append("knowing an end to gloom and darkness.")
+
+    lines.append("\nRejoice, let Mother Church also rejoice,")
+    lines.append("arrayed with the lightning of His glory,")
+    lines.append("let this holy building shake with joy,")
+    lines.append("filled with the mighty voices of the peoples.")
 
     if deacon:
-        print("\nTherefore, dearest friends,")
-        print("standing in the awesome glory of this holy light,")
-        print("invoke with me, I ask you,")
-        print("the mercy of God almighty,")
-        print("that He, who has been pleased to number me,")
-        print("though unworthy, among the Levites,")
-        print("may pour into me His light unshadowed,")
-        print("that I may sing this candle's perfect praises.")
+        lines.append("\nTherefore, dearest friends,")
+        lines.append("standing in the awesome glory of this holy light,")
+        lines.append("invoke with me, I ask you,")
+        lines.append("the mercy of God almighty,")
+        lines.append("that He, who has been pleased to number me,")
+        lines.append("though unworthy, among the Levites,")
+        lines.append("may pour into me His light unshadowed,")
+        lines.append("that I may sing this candle's perfect praises.")
                 
-        print("\nDeacon: The Lord be with you.")
-        print("People: And with your spirit.")
-        print("Deacon: Lift up your hearts.")
-        print("People: We lift them up to the Lord.")
-        print("Deacon: Let us give thanks to the Lord our God.")
-        print("People: It is right and just.")
-
-    print("\nIt is truly right and just,")
-    print("with ardent love of mind and heart")
-    print("and with devoted service of our voice,")
-    print("to acclaim our God invisible, the almighty Father,")
-    print("and Jesus Christ, our Lord, His Son, His Only Begotten.")
-
-    print("\nWho for our sake paid Adam's debt to the eternal Father,")
-    print("and, pouring out His own dear Blood,")
-    print("wiped clean the record of our ancient sinfulness.")
-
-    print("\nThese, then, are the feasts of Passover,")
-    print("in which is slain the Lamb, the one true Lamb,")
-    print("whose Blood anoints the doorposts of believers.")
-
-    print("\nThis is the night,")
-    print("when once You led our forebears, Israel's children,")
-    print("from slavery in Egypt")
-    print("and made them pass dry-shod through the Red Sea.")
-
-    print("\nThis is the night")
-    print("that with a pillar of fire")
-    print("banished the darkness of sin.")
-
-    print("\nThis is the night")
-    print("that even now throughout the world,")
-    print("sets Christian believers apart from worldly vices")
-    print("and from the gloom of sin,")
-    print("leading them to grace")
-    print("and joining them to His holy ones.")
-
-    print("\nThis is the night")
-    print("when Christ broke the prison-bars of death")
-    print("and rose victorious from the underworld.")
-
-    print("\nOur birth would have been no gain,")
-    print("had we not been redeemed.")
-    print("O wonder of Your humble care for us!")
-    print("O love, O charity beyond all telling,")
-    print("to ransom a slave You gave away Your Son!")
-
-    print("\nO truly necessary sin of Adam,")
-    print("destroyed completely by the Death of Christ!")
+        lines.append("\nDeacon: The Lord be with you.")
+        lines.append("People: And with your spirit.")
+        lines.append("Deacon: Lift up your hearts.")
+        lines.append("People: We lift them up to the Lord.")
+        lines.append("Deacon: Let us give thanks to the Lord our God.")
+        lines.append("People: It is right and just.")
+
+    lines.append("\nIt is truly right and just,")
+    lines.append("with ardent love of mind and heart")
+    lines.append("and with devoted service of our voice,")
+    lines.append("to acclaim our God invisible, the almighty Father,")
+    lines.append("and Jesus Christ, our Lord, His Son, His Only Begotten.")
+
+    lines.append("\nWho for our sake paid Adam's debt to the eternal Father,")
+    lines.append("and, pouring out His own dear Blood,")
+    lines.append("wiped clean the record of our ancient sinfulness.")
+
+    lines.append("\nThese, then, are the feasts of Passover,")
+    lines.append("in which is slain the Lamb, the one true Lamb,")
+    lines.append("whose Blood anoints the doorposts of believers.")
+
+    lines.append("\nThis is the night,")
+    lines.append("when once You led our forebears, Israel's children,")
+    lines.append("from slavery in Egypt")
+    lines.append("and made them pass dry-shod through the Red Sea.")
+
+    lines.append("\nThis is the night")
+    lines.append("that with a pillar of fire")
+    lines.append("banished the darkness of sin.")
+
+    lines.append("\nThis is the night")
+    lines.append("that even now throughout the world,")
+    lines.append("sets Christian believers apart from worldly vices")
+    lines.append("and from the gloom of sin,")
+    lines.append("leading them to grace")
+    lines.append("and joining them to His holy ones.")
+
+    lines.append("\nThis is the night")
+    lines.append("when Christ broke the prison-bars of death")
+    lines.append("and rose victorious from the underworld.")
+
+    lines.append("\nOur birth would have been no gain,")
+    lines.append("had we not been redeemed.")
+    lines.append("O wonder of Your humble care for us!")
+    lines.append("O love, O charity beyond all telling,")
+    lines.append("to ransom a slave You gave away Your Son!")
+
+    lines.append("\nO truly necessary sin of Adam,")
+    lines.append("destroyed completely by the Death of Christ!")
         
-    print("\nO happy fault")
-    print("that earned for us so great, so glorious a Redeemer!")
-
-    print("\nO truly blessed night,")
-    print("worthy alone to know the time and hour")
-    print("when Christ rose from the underworld!")
-
-    print("\nThis is the night")
-    print("of which it is written:")
-    print("The night shall be as bright as day,")
-    print("dazzling is the night for me, and full of gladness.")
-
-    print("\nThe sanctifying power of this night")
-    print("dispels wickedness, washes faults away,")
-    print("restores innocence to the fallen, and joy to mourners,")
-    print("drives out hatred, fosters concord, and brings down the mighty.")
-
-    print("\nOn this, Your night of grace, O holy Father,")
-    print("accept this candle, a solemn offering,")
-    print("the work of bees and of Your servants' hands,")
-    print("an evening sacrifice of praise,")
-    print("this gift from Your most holy Church.")
-
-    print("\nBut now we know the praises of this pillar,")
-    print("which glowing fire ignites for God's honor,")
-    print("a fire into many flames divided,")
-    print("yet never dimmed by sharing of its light,")
-    print("for it is fed by melting wax,")
-    print("drawn out by mother bees")
-    print("to build a torch so precious.")
-
-    print("\nO truly blessed night,")
-    print("when things of heaven are wed to those of earth,")
-    print("and divine to the human.")
-
-    print("\nTherefore, O Lord,")
-    print("we pray You that this candle,")
-    print("hallowed to the honour of Your name,")
-    print("may persevere undimmed,")
-    print("to overcome the darkness of this night.")
-    print("Receive it as a pleasing fragrance,")
-    print("and let it mingle with the lights of heaven.")
-    print("May this flame be found still burning")
-    print("by the Morning Star:")
-    print("the one Morning Star who never sets,")
-    print("Christ Your Son,")
-    print("who, coming back from death's domain,")
-    print("has shed His peaceful light on humanity,")
-    print("and lives and reigns for ever and ever. Amen.")
+    lines.append("\nO happy fault")
+    lines.append("that earned for us so great, so glorious a Redeemer!")
+
+    lines.append("\nO truly blessed night,")
+    lines.append("worthy alone to know the time and hour")
+    lines.append("when Christ rose from the underworld!")
+
+    lines.append("\nThis is the night")
+    lines.append("of which it is written:")
+    lines.append("The night shall be as bright as day,")
+    lines.append("dazzling is the night for me, and full of gladness.")
+
+    lines.append("\nThe sanctifying power of this night")
+    lines.append("dispels wickedness, washes faults away,")
+    lines.append("restores innocence to the fallen, and joy to mourners,")
+    lines.append("drives out hatred, fosters concord, and brings down the mighty.")
+
+    lines.append("\nOn this, Your night of grace, O holy Father,")
+    lines.append("accept this candle, a solemn offering,")
+    lines.append("the work of bees and of Your servants' hands,")
+    lines.append("an evening sacrifice of praise,")
+    lines.append("this gift from Your most holy Church.")
+
+    lines.append("\nBut now we know the praises of this pillar,")
+    lines.append("which glowing fire ignites for God's honor,")
+    lines.append("a fire into many flames divided,")
+    lines.append("yet never dimmed by sharing of its light,")
+    lines.append("for it is fed by melting wax,")
+    lines.append("drawn out by mother bees")
+    lines.append("to build a torch so precious.")
+
+    lines.append("\nO truly blessed night,")
+    lines.append("when things of heaven are wed to those of earth,")
+    lines.append("and divine to the human.")
+
+    lines.append("\nTherefore, O Lord,")
+    lines.append("we pray You that this candle,")
+    lines.append("hallowed to the honour of Your name,")
+    lines.append("may persevere undimmed,")
+    lines.append("to overcome the darkness of this night.")
+    lines.append("Receive it as a pleasing fragrance,")
+    lines.append("and let it mingle with the lights of heaven.")
+    lines.append("May this flame be found still burning")
+    lines.append("by the Morning Star:")
+    lines.append("the one Morning Star who never sets,")
+    lines.append("Christ Your Son,")
+    lines.append("who, coming back from death's domain,")
+    lines.append("has shed His peaceful light on humanity,")
+    lines.append("and lives and reigns for ever and ever. Amen.")
+    return "\n".join(lines)
+
+def Exsultet(deacon = True):
+    """
+    This function prints the text of Exsultet, a liturgical proclamation at the conclusion of the Liturgy of Light in the Easter Vigil.
+    
+    Args:
+        deacon (bool): Whether to print the deacon's part. Default is True.
+    """
+    print(ExsultetText(deacon))
     
 if __name__ == "__main__":
     Exsultet()
\ No newline at end of file
@@ -2,9 +2,11 @@
 A python module to print the text of the Proclamation of the Nativity of the Lord (from Roman Martyrology) to be read on Midnight Mass.
 """
 
+from epact import REFORMYEAR, moonage
+
 def ChristmasMoon(year) -> int:
     """
-    Calculating the moon of Christmas Day. Based on Knuthian Computus Algorithm.
+    Calculating the moon of Christmas Day. Looked up in the lunar table of the Kalendarium (see `epact.py`), Gregorian from Christmas 1582.
     
     Args:
         year (int): The year to calculate the moon of Christmas Day for.
@@ -12,18 +14,7 @@ def ChristmasMoon(year) -> int:
     Returns:
         int: The moon of Christmas Day.
     """
-    golden_number = year % 19 + 1
-    epact1582 = (11 * golden_number - 10) % 30
-    if year >= 1582:
-        century = year // 100 + 1
-        solar_correction = (3 * century) // 4 - 12
-        lunar_correction = (8 * century + 5) // 25 - 5
-        epact = (epact1582 - solar_correction + lunar_correction) % 30
-    else:
-        epact = (epact1582 + 7) % 30
-    moon = (epact + 4) % 30 + 1
-    if epact == 25 and golden_number > 11: moon -= 1
-    return moon
+    return moonage(year, 12, 25, year >= REFORMYEAR)
 
 def OrdinalMoon(moon) -> str:
     """
@@ -78,37 +69,45 @@ class Kalenda:
         self.year = year
         self.moon = ChristmasMoon(self.year)
         self.ordinal_moon = OrdinalMoon(self.moon)
+    @property
+    def text(self) -> str:
+        """
+        This property returns the text of the Proclamation of the Nativity of the Lord (from Roman Martyrology) to be read on Midnight Mass.
+        """
+        lines = []
+        lines.append(f"THE Eighth Kalends of January, the {self.ordinal_moon} day of the moon.") # The Eighth Kalends of January means December 25.
+        lines.append(f"In the year 5199 since the world was created,")
+        lines.append(f"when ages beyond number had run their course from the creation of the world,")
+        lines.append(f"when God in the beginning created heaven and earth,")
+        lines.append(f"and formed man in His own likeness;")
+        lines.append(f"2957 years after the Flood,")
+        lines.append(f"when century upon century had passed")
+        lines.append(f"since the Almighty set His bow in the clouds after the Great Flood,")
+        lines.append(f"as a sign of covenant and peace;")
+        lines.append(f"2015 years since Abraham's birth;")
+        lines.append(f"In the twenty-first century since Abraham, our father in faith,")
+        lines.append(f"came out of Ur of the Chaldees;")
+        lines.append(f"1510 years since the People of Israel")
+        lines.append(f"were led by Moses in the Exodus from Egypt;")
+        lines.append(f"1032 years since David was anointed king of Israel;")
+        lines.append(f"In the 65th week of the prophecy of Daniel;")
+        lines.append(f"In the 194th Olympiad;")
+        lines.append(f"In the year 752 since the founding of Rome;") # AUC 752 = 2 BC
+        lines.append(f"and in the 42nd year of the rule of Caesar Octavian Augustus,")
+        lines.append(f"the whole world being at peace,")
+        lines.append(f"--------------------------------")
+        lines.append(f"JESUS CHRIST, eternal God and Son of the eternal Father,")
+        lines.append(f"desiring to consecrate the world by His most loving presence,")
+        lines.append(f"was conceived by the Holy Spirit,")
+        lines.append(f"and when nine months had passed since His conception,")
+        lines.append(f"was born of the Virgin Mary in Bethlehem of Judah, and was made man:")
+        lines.append(f"THE NATIVITY OF OUR LORD JESUS CHRIST ACCORDING TO THE FLESH.")
+        return "\n".join(lines)
     def Proclamation(self):
         """
         This property prints the text of the Proclamation of the Nativity of the Lord (from Roman Martyrology) to be read on Midnight Mass.
         """
-        print(f"THE Eighth Kalends of January, the {self.ordinal_moon} day of the moon.") # The Eighth Kalends of January means December 25.
-        print(f"In the year 5199 since the world was created,")
-        print(f"when ages beyond number had run their course from the creation of the world,")
-        print(f"when God in the beginning created heaven and earth,")
-        print(f"and formed man in His own likeness;")
-        print(f"2957 years after the Flood,")
-        print(f"when century upon century had passed")
-        print(f"since the Almighty set His bow in the clouds after the Great Flood,")
-        print(f"as a sign of covenant and peace;")
-        print(f"2015 years since Abraham's birth;")
-        print(f"In the twenty-first century since Abraham, our father in faith,")
-        print(f"came out of Ur of the Chaldees;")
-        print(f"1510 years since the People of Israel")
-        print(f"were led by Moses in the Exodus from Egypt;")
-        print(f"1032 years since David was anointed king of Israel;")
-        print(f"In the 65th week of the prophecy of Daniel;")
-        print(f"In the 194th Olympiad;")
-        print(f"In the year 752 since the founding of Rome;") # AUC 752 = 2 BC
-        print(f"and in the 42nd year of the rule of Caesar Octavian Augustus,")
-        print(f"the whole world being at peace,")
-        print(f"--------------------------------")
-        print(f"JESUS CHRIST, eternal God and Son of the eternal Father,")
-        print(f"desiring to consecrate the world by His most loving presence,")
-        print(f"was conceived by the Holy Spirit,")
-        print(f"and when nine months had passed since His conception,")
-        print(f"was born of the Virgin Mary in Bethlehem of Judah, and was made man:")
-        print(f"THE NATIVITY OF OUR LORD JESUS CHRIST ACCORDING TO THE FLESH.")
+        print(self.text)
         
 if __name__ == "__main__":
     # Testing Kalenda text for any given year.
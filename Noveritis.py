@@ -26,9 +26,9 @@ class Noveritis:
         self.AscensionThursday = AscensionThursday
         self.CorpusChristiThursday = CorpusChristiThursday
     @property
-    def Noveritis(self):
+    def text(self) -> str:
         """
-        This property prints the text of the Noveritis for any given year.
+        This property returns the text of the Noveritis for any given year.
         """
         ashwednesday = Lent(self.year, self.calendar).AshWednesday
         easter = Eastertide(self.year, self.calendar).EasterSunday
@@ -37,20 +37,28 @@ class Noveritis:
         corpus = SolemnitiesoftheLord(self.year, self.calendar, corpusChristionThursday = self.CorpusChristiThursday).CorpusChristi
         advent = Advent(self.year + 1).firstSunday # The first Sunday of the next liturgical year is the first Sunday of Advent of this calendar year.
         # After the Gospel of Epiphany Day (Matthew 2:1-12) by the deacon, the Noveritis is announced by the same deacon, as follows:
-        print(f"KNOW, dear brothers and sisters,")
-        print(f"that, as we have rejoiced at the Nativity of our Lord Jesus Christ,")
-        print(f"so by leave of God's mercy")
-        print(f"we announce to you also the joy of His Resurrection,")
-        print(f"who is our Savior.")
-        print(f"- On {ashwednesday.strftime('%B %d')} will fall Ash Wednesday,") # Ash Wednesday is the first day of Lent, 46 days before Easter.
-        print(f"and the beginning of the Season of Lent.")
-        print(f"- On {easter.strftime('%B %d')} you will celebrate with joy Easter Day,") # Easter Sunday is the Sunday after the Paschal Full Moon.
-        print(f"the Paschal feast of our Lord Jesus Christ.")
-        print(f"- On {ascension.strftime('%B %d')} will be the Ascension of our Lord Jesus Christ.") # Ascension is the 40th or 43th day after Easter Sunday, dependent of boolean flag AscensionThursday.
-        print(f"- On {pentecost.strftime('%B %d')}, the feast of Pentecost.") # Pentecost is the 50th day after Easter Sunday.
-        print(f"- On {corpus.strftime('%B %d')}, the Feast of the Most Holy Body and Blood of Christ,") # Corpus Christi is 60 or 63 days after Easter Sunday, dependent of boolean flag CorpusChristiThursday.
-        print(f"- On {advent.strftime('%B %d')}, the First Sunday of the Advent of our Lord Jesus Christ,") # Advent is the first Sunday of the next liturgical year. In this case the first Sunday of the next liturgical year is the first Sunday of Advent of this calendar year.
-        print(f"to Whom is honor and glory forever and ever. Amen.")
+        lines = []
+        lines.append(f"KNOW, dear brothers and sisters,")
+        lines.append(f"that, as we have rejoiced at the Nativity of our Lord Jesus Christ,")
+        lines.append(f"so by leave of God's mercy")
+        lines.append(f"we announce to you also the joy of His Resurrection,")
+        lines.append(f"who is our Savior.")
+        lines.append(f"- On {ashwednesday.strftime('%B %d')} will fall Ash Wednesday,") # Ash Wednesday is the first day of Lent, 46 days before Easter.
+        lines.append(f"and the beginning of the Season of Lent.")
+        lines.append(f"- On {easter.strftime('%B %d')} you will celebrate with joy Easter Day,") # Easter Sunday is the Sunday after the Paschal Full Moon.
+        lines.append(f"the Paschal feast of our Lord Jesus Christ.")
+        lines.append(f"- On {ascension.strftime('%B %d')} will be the Ascension of our Lord Jesus Christ.") # Ascension is the 40th or 43th day after Easter Sunday, dependent of boolean flag AscensionThursday.
+        lines.append(f"- On {pentecost.strftime('%B %d')}, the feast of Pentecost.") # Pentecost is the 50th day after Easter Sunday.
+        lines.append(f"- On {corpus.strftime('%B %d')}, the Feast of the Most Holy Body and Blood of Christ,") # Corpus Christi is 60 or 63 days after Easter Sunday, dependent of boolean flag CorpusChristiThursday.
+        lines.append(f"- On {advent.strftime('%B %d')}, the First Sunday of the Advent of our Lord Jesus Christ,") # Advent is the first Sunday of the next liturgical year. In this case the first Sunday of the next liturgical year is the first Sunday of Advent of this calendar year.
+        lines.append(f"to Whom is honor and glory forever and ever. Amen.")
+        return "\n".join(lines)
+    @property
+    def Noveritis(self):
+        """
+        This property prints the text of the Noveritis for any given year.
+        """
+        print(self.text)
         # After the Noveritis, the homily is given as usual.
         
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ A Python module to print the information of a given year.
 """
 
 from easter import easter # Insert nominal date of Easter from easter.py to calculate the boundary key.
+import weekday # Weekday engine with the precomputed 400-year Gregorian and 28-year Julian cycles.
+import epact # Epact engine with Clavius's precomputed tables of epacts and moons.
 
 def weekdaystring(weekday) -> str:
     """
@@ -51,15 +53,7 @@ class YearInfo:
         The epact is the age of the moon on the day before first day of the year.
         It is used to calculate the date of Easter.
         """
-        epact1582 = (11 * self.golden_number - 10) % 30
-        if self.year > 1582:
-            century = self.year // 100 + 1
-            solar_correction = (3 * century) // 4 - 12
-            lunar_correction = (8 * century + 5) // 25 - 5
-            ep = (epact1582 - solar_correction + lunar_correction) % 30
-        else:
-            ep = (epact1582 + 7) % 30
-        return ep
+        return epact.epact(self.year)
     @property
     def epactstring(self) -> str:
         """
@@ -92,19 +86,15 @@ class YearInfo:
         """
         This property calculates the martyrology letter of a given year.
         """
-        return ["P", "a", "b", "c", "d", "e", "f", "g", "h", "i", "k", "l", "m", "n", "p", "q", "r", "s", "t", "u", "A", "B", "C", "D", "E", "F", "G", "H", "M", "N"][self.Epact]
+        return epact.martyrologyletter(self.year)
     @property
     def paschalfullmoon(self) -> int:
         """
         This property calculates the paschal full moon of a given year.
         The paschal full moon is the first full moon after the vernal equinox.
         """
-        if (self.Epact == 25 and self.golden_number > 11) or self.Epact == 24: self.Epact += 1
-        fullmoon = 44 - self.Epact if self.Epact < 24 else 74 - self.Epact
-        march = fullmoon
-        april = fullmoon - 31
-        if march > 31: return f"April {april}"
-        else: return f"March {march}"
+        month, day = epact.paschalfullmoon(self.year)
+        return f"{'March' if month == 3 else 'April'} {day}"
     @property
     def solarcycle(self) -> int:
         """
@@ -115,19 +105,13 @@ class YearInfo:
     @property
     def doomsday(self) -> int:
         """
-        This property calculates the doomsday of a given year. Based on Conway's Doomsday Algorithm.
+        This property calculates the doomsday of a given year. Looked up from the Gregorian (after 1582) or Julian (until 1582) cycle tables of `weekday.py`, giving the same results as Conway's Doomsday Algorithm.
         The doomsday is the anchor day of a given year, e.g. the last day of February, March 14, April 4, May 9, June 6, July 11, August 8, September 5, October 10, November 7, December 12.
         
         Returns:
             int: The doomsday of the given year (0 = Sunday, 1 = Monday, 2 = Tuesday, 3 = Wednesday, 4 = Thursday, 5 = Friday, 6 = Saturday).
         """
-        k = self.year // 100
-        d = (5 * (k % 4) + 2) % 7 if self.year > 1582 else 6 * k % 7 # Century anchor
-        t = self.year % 100 # Last 2 digits
-        a = t // 12
-        b = t % 12
-        c = b // 4
-        return (a + b + c + d) % 7
+        return weekday.doomsday(self.year)
     @property
     def doomsdaystring(self) -> str:
         """
@@ -176,16 +160,12 @@ class YearInfo:
     def dominicalletter(self) -> str:
         """
         This property calculates the dominical letter of a given year.
-        The dominical letter is the letter of the week on which the first Sunday of the year falls. Based on the Doomsday Algorithm.
+        The dominical letter is the letter of the week on which the first Sunday of the year falls. Looked up from the cycle tables of `weekday.py`.
         e.g. 2024 was a leap year, so the dominical letter was GF since the doomsday was 4 (Thursday).
         2025 is a common year, so the dominical letter is E since the doomsday is 5 (Friday).
+        Note: 1582 was the year of the Gregorian calendar reform, so the dominical letter was GC coz of the omission of 5-14 October 1582.
         """
-        if isleapyear(self.year):
-            return ["DC", "CB", "BA", "AG", "GF", "FE", "ED"][self.doomsday]
-        elif self.year == 1582:
-            return "GC" # 1582 was the year of the Gregorian calendar reform, so the dominical letter was GC coz of the omission of 5-14 October 1582.
-        else:
-            return ["C", "B", "A", "G", "F", "E", "D"][self.doomsday]
+        return weekday.dominicalletter(self.year)
     @property
     def boundarykey(self) -> int:
         """
@@ -198,6 +178,21 @@ class YearInfo:
         day = day - 22 # Subtract 22 to get the boundary key.
         boundarykey = ['А', 'Б', 'В', 'Г', 'Д', 'Е', 'Ж', 'Ѕ', 'З', 'И', 'І', 'К', 'Л', 'М', 'Н', 'О', 'П', 'Р', 'С', 'Т', 'У', 'Ф', 'Х', 'Ѿ', 'Ц', 'Ч', 'Ш', 'Щ', 'Ъ', 'Ы', 'Ь', 'Ѣ', 'Ю', 'Ѫ', 'Я']
         return boundarykey[day]
+    def asdict(self) -> dict:
+        """
+        This method returns the information of the given year as a dictionary of display strings, in the order of the Computus Data panel of `CALENDAR.html`.
+        """
+        return {
+            "Indiction": str(self.indiction),
+            "Golden Number": str(self.golden_number),
+            "Epact": self.epactstring,
+            "Martyrology Letter": self.martyrology,
+            "Solar Cycle": str(self.solarcycle),
+            "Doomsday": self.doomsdaystring,
+            "Dominical Letter": self.dominicalletter,
+            "Paschal Full Moon": self.paschalfullmoon,
+            "Chinese Zodiac": str(self.chinesezodiac),
+        }
         
     
 if __name__ == "__main__": # Testing program, testing all the information of a given year.
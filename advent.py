@@ -9,6 +9,7 @@ Originally written on Black Friday, 28 November 2025, 34th Friday of Ordinary Ti
 """
 
 from datetime import date, timedelta
+from daynumber import rd, todate, weekday, sunday
 
 def getSunday(date):
     """
@@ -38,8 +39,18 @@ class Advent:
             year (int): The year to calculate the Advent dates for. Note that the input year is for liturgical year, since the liturgical year always starts on the first Sunday of Advent of the previous calendar year.
         """
         self.year = year 
+        self.days = adventrd(year) # The day numbers of the dates, see `adventrd`.
         # The input year is the input year for liturgical year, since the liturgical year always starts on the first Sunday of Advent of the previous calendar year.
         # e.g. if the input year is 2025, then the liturgical year starts on the first Sunday of Advent of 2024.
+    def dualdates(self, country = "rome") -> dict:
+        """
+        This method returns the dates of the Advent alongside their historical civil dates in a country, see `reform.dualdays`.
+
+        Returns:
+            dict: name of the date in `self.days` -> (proleptic Gregorian date, civil date).
+        """
+        from reform import dualdays # reform.py imports this module through liturgicalyear.py.
+        return dualdays(self.days, country)
     @property
     def firstSunday(self) -> date:
         """
@@ -53,7 +64,7 @@ class Advent:
         Returns:
             date: The first Sunday of Advent.
         """
-        return getSunday(date(self.year - 1, 11, 27)) 
+        return todate(self.days["firstSunday"]) 
         # The first Sunday of Advent is the Sunday following the 26th of November of the previous year.
     @property
     def secondSunday(self) -> date:
@@ -68,7 +79,7 @@ class Advent:
         Returns:
             date: The second Sunday of Advent.
         """
-        return getSunday(date(self.year - 1, 12, 4))
+        return todate(self.days["secondSunday"])
         # The second Sunday of Advent is the Sunday following the 4th of December of the previous year.
     @property
     def thirdSunday(self) -> date:
@@ -83,7 +94,7 @@ class Advent:
         Returns:
             date: The third Sunday of Advent.
         """
-        return getSunday(date(self.year - 1, 12, 11))
+        return todate(self.days["thirdSunday"])
         # The third Sunday of Advent is the Sunday following the 11th of December of the previous year.    
     @property
     def fourthSunday(self) -> date:
@@ -148,7 +159,7 @@ class Advent:
         Returns:
             date: The fourth Sunday of Advent.
         """
-        return getSunday(date(self.year - 1, 12, 18))
+        return todate(self.days["fourthSunday"])
         # The fourth Sunday of Advent is the Sunday following the 18th of December of the previous year.
     @property
     def ImmaculateConception(self) -> date:
@@ -160,7 +171,7 @@ class Advent:
         Returns:
             date: The date of the Immaculate Conception. Should it falls on a Sunday, then the feast is celebrated on the following day. 
         """
-        return date(self.year-1, 12, 8) if date(self.year-1, 12, 8).weekday() != 6 else date(self.year-1, 12, 9)
+        return todate(immaculaterd(self.year))
         # The Immaculate Conception is celebrated on the 8th of December. Should it falls on a Sunday (weekday = 6), viz. the 2nd Sunday of Advent, then the feast is celebrated on the following day.
     
 class Christmastide:
@@ -231,7 +242,7 @@ class Christmastide:
         Returns:
             date: The date of the Holy Family. Should Christmas falls on a Sunday, then the feast is celebrated on Friday, December 30, since the Sunday after Christmas is January 1 of the next calendar year.
         """
-        return getSunday(date(self.year-1, 12, 26)) if self.ChristmasDay.weekday() != 6 else date(self.year-1, 12, 30)
+        return todate(holyfamilyrd(self.year))
         # The Holy Family is celebrated on the Sunday after Christmas Day.
         # But if it falls on a Sunday, then the feast is celebrated on Friday, December 30, since the Sunday after Christmas is January 1 of the next calendar year.
     @property
@@ -260,7 +271,7 @@ class Christmastide:
         Returns:
             date: The date of Epiphany.
         """
-        return date(self.year, 1, 6) if self.epiphany_on_jan6th else getSunday(date(self.year, 1, 2))
+        return todate(epiphanyrd(self.year, self.epiphany_on_jan6th))
     
     @property
     def SecondSundayAfterChristmas(self) -> date:
@@ -272,7 +283,7 @@ class Christmastide:
         Returns:
             date: The date of the Second Sunday after Christmas.
         """
-        return getSunday(date(self.year, 1, 2)) if (self.epiphany_on_jan6th and not self.Epiphany.weekday() in [4, 5, 6]) else None
+        return todate(secondsundayafterchristmasrd(self.year, self.epiphany_on_jan6th))
     
     @property
     def BaptismOfTheLord(self) -> date:
@@ -288,12 +299,76 @@ class Christmastide:
         Returns:
             date: The date of the Baptism of the Lord.
         """
-        if self.epiphany_on_jan6th: return getSunday(date(self.year, 1, 7))
-        # In case where Epiphany is transferred into Sunday after January 1:
-        elif self.Epiphany == date(self.year, 1, 7): return date(self.year, 1, 8) # Baptism on Monday, Jan 8 if Epiphany Sunday falls on January 7
-        elif self.Epiphany == date(self.year, 1, 8): return date(self.year, 1, 9) # Baptism on Monday, Jan 9 if Epiphany Sunday falls on January 8
-        else: return self.Epiphany + timedelta(days = 7) # Baptism on Sunday 7 days after Epiphany Sunday
-        
+        return todate(baptismrd(self.year, self.epiphany_on_jan6th))
+
+def immaculaterd(year) -> int:
+    """
+    This function calculates the day number (Rata Die) of the Immaculate Conception of a given liturgical year, see `Advent.ImmaculateConception`.
+    """
+    immaculate = rd(year - 1, 12, 8)
+    return immaculate if weekday(immaculate) != 6 else immaculate + 1
+
+def holyfamilyrd(year) -> int:
+    """
+    This function calculates the day number (Rata Die) of the Holy Family of a given liturgical year, see `Christmastide.holyFamily`.
+    """
+    christmas = rd(year - 1, 12, 25)
+    return sunday(christmas + 1) if weekday(christmas) != 6 else rd(year - 1, 12, 30)
+
+def epiphanyrd(year, epiphany_on_jan6th = False) -> int:
+    """
+    This function calculates the day number (Rata Die) of Epiphany of a given liturgical year, see `Christmastide.Epiphany`.
+    """
+    return rd(year, 1, 6) if epiphany_on_jan6th else sunday(rd(year, 1, 2))
+
+def secondsundayafterchristmasrd(year, epiphany_on_jan6th = False) -> int:
+    """
+    This function calculates the day number (Rata Die) of the Second Sunday after Christmas of a given liturgical year, or None if it is not celebrated, see `Christmastide.SecondSundayAfterChristmas`.
+    """
+    return sunday(rd(year, 1, 2)) if (epiphany_on_jan6th and not weekday(rd(year, 1, 6)) in [4, 5, 6]) else None
+
+def baptismrd(year, epiphany_on_jan6th = False) -> int:
+    """
+    This function calculates the day number (Rata Die) of the Baptism of the Lord of a given liturgical year, see `Christmastide.BaptismOfTheLord`.
+    """
+    if epiphany_on_jan6th: return sunday(rd(year, 1, 7))
+    # In case where Epiphany is transferred into Sunday after January 1:
+    epiphany = epiphanyrd(year)
+    if epiphany == rd(year, 1, 7): return rd(year, 1, 8) # Baptism on Monday, Jan 8 if Epiphany Sunday falls on January 7
+    elif epiphany == rd(year, 1, 8): return rd(year, 1, 9) # Baptism on Monday, Jan 9 if Epiphany Sunday falls on January 8
+    else: return epiphany + 7 # Baptism on Sunday 7 days after Epiphany Sunday
+
+def adventrd(year) -> dict:
+    """
+    This function calculates the day numbers (Rata Die) of the Advent season of a given liturgical year for any year, see `Advent`.
+
+    Returns:
+        dict: The Rata Die of every property of `Advent` by name.
+    """
+    return {
+        "firstSunday": sunday(rd(year - 1, 11, 27)),
+        "secondSunday": sunday(rd(year - 1, 12, 4)),
+        "thirdSunday": sunday(rd(year - 1, 12, 11)),
+        "fourthSunday": sunday(rd(year - 1, 12, 18)),
+        "ImmaculateConception": immaculaterd(year),
+    }
+
+def christmastiderd(year, epiphany_on_jan6th = False) -> dict:
+    """
+    This function calculates the day numbers (Rata Die) of the Christmastide of a given liturgical year for any year, see `Christmastide`.
+
+    Returns:
+        dict: The Rata Die of every property of `Christmastide` by name (SecondSundayAfterChristmas may be None).
+    """
+    return {
+        "ChristmasDay": rd(year - 1, 12, 25),
+        "holyFamily": holyfamilyrd(year),
+        "NewYear": rd(year, 1, 1),
+        "Epiphany": epiphanyrd(year, epiphany_on_jan6th),
+        "SecondSundayAfterChristmas": secondsundayafterchristmasrd(year, epiphany_on_jan6th),
+        "BaptismOfTheLord": baptismrd(year, epiphany_on_jan6th),
+    }
+
 if __name__ == "__main__":
     # Testing program, testing all the dates of the Advent and Christmastide for any proleptic Gregorian calendar year.
     year = 2025
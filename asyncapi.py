@@ -0,0 +1,160 @@
+"""
+A Python module to serve the calendar, the year information and the proclamations to asyncio code (e.g. an async web service) without blocking the event loop.
+
+Every request is computed in an executor, never on the event loop:
+- A lookup of one year (`calendar`, `yearinfo`, `proclamation`) runs in a thread pool.
+- A bulk job over many years (`calendars`, `yearinfos`) runs in a process pool, since it is CPU-bound.
+Concurrent requests for the same thing (e.g. everyone opening this year's calendar on Epiphany) are coalesced: the first one computes, the others await its result, and the last results are kept in a small LRU cache.
+Every caller gets its own copy of the shared result, so changing it does not change what the other callers get.
+A cancelled request does not cancel the shared computation of the others.
+
+Usage:
+    service = CalendarService()
+    celebrations = await service.calendar(2025, "gregorian-ascension")
+"""
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from liturgicalyear import LiturgicalYear, PROFILES
+from YearInfo import YearInfo
+from Noveritis import Noveritis
+from Kalenda import Kalenda
+from Exsultet import ExsultetText
+
+PROCLAMATIONS = ["noveritis", "kalenda", "exsultet"]
+
+def calendarsync(year, profile = "gregorian") -> list:
+    """
+    This function lists the celebrations of a calendar year of a profile, see `LiturgicalYear.celebrations`.
+    """
+    return LiturgicalYear(year, **PROFILES[profile]).celebrations
+
+def yearinfosync(year, calendar = True) -> dict:
+    """
+    This function returns the information of a year, see `YearInfo.asdict`.
+    """
+    return YearInfo(year, calendar).asdict()
+
+def proclamationsync(kind, year, profile = "gregorian") -> str:
+    """
+    This function renders a proclamation of a year: "noveritis" (with the Ascension and Corpus Christi of the profile), "kalenda" or "exsultet" (the year is ignored).
+    """
+    if kind == "noveritis":
+        flags = PROFILES[profile]
+        return Noveritis(year, flags["calendar"], flags["ascensionThursday"], flags["corpusChristionThursday"]).text
+    elif kind == "kalenda": return Kalenda(year).text
+    elif kind == "exsultet": return ExsultetText()
+    raise ValueError(f"Unknown proclamation {kind!r}, expected one of {', '.join(PROCLAMATIONS)}")
+
+def calendarssync(years, profile = "gregorian") -> dict:
+    """
+    This function lists the celebrations of many calendar years of a profile, as year -> celebrations.
+    """
+    return {year: calendarsync(year, profile) for year in years}
+
+def yearinfossync(years, calendar = True) -> dict:
+    """
+    This function returns the information of many years, as year -> information.
+    """
+    return {year: yearinfosync(year, calendar) for year in years}
+
+class CalendarService:
+    """
+    This class serves the calendar to asyncio code, coalescing concurrent identical requests. It must be used from a single event loop.
+    """
+    def __init__(self, threads = None, processes = None, cachesize = 128):
+        """
+        This method initializes the CalendarService class.
+
+        Args:
+            threads (Executor): The executor of the lookups of one year. Default is a new thread pool.
+            processes (Executor): The executor of the bulk jobs. Default is a new process pool, created on the first bulk job.
+            cachesize (int): The number of results kept after completion. Default is 128 (0 disables the cache).
+        """
+        self.threads = threads or ThreadPoolExecutor(thread_name_prefix = "calendar")
+        self.processes = processes
+        self.cachesize = cachesize
+        self.cache = OrderedDict() # key -> result, least recently used first
+        self.inflight = {} # key -> future of the computation
+        self.computed = 0 # Number of computations started, for monitoring the coalescing.
+    async def _get(self, key, executor, function, *args):
+        """
+        This method returns the result of a request, from the cache, from a running computation of the same key, or by starting a computation in an executor.
+        """
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        future = self.inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(executor, function, *args)
+            self.inflight[key] = future
+            self.computed += 1
+            future.add_done_callback(lambda done: self._done(key, done))
+        return await asyncio.shield(future) # The computation survives the cancellation of any one awaiter.
+    def _done(self, key, future):
+        """
+        This method removes a finished computation from the running ones and caches its result (errors are not cached).
+        """
+        self.inflight.pop(key, None)
+        if self.cachesize and not future.cancelled() and future.exception() is None:
+            self.cache[key] = future.result()
+            while len(self.cache) > self.cachesize: self.cache.popitem(last = False)
+    def _processes(self):
+        """
+        This method returns the process pool of the bulk jobs, creating it if needed.
+        """
+        if self.processes is None: self.processes = ProcessPoolExecutor()
+        return self.processes
+    async def calendar(self, year, profile = "gregorian") -> list:
+        """
+        This method lists the celebrations of a calendar year of a profile, see `LiturgicalYear.celebrations`.
+        """
+        if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r}")
+        return list(await self._get(("calendar", year, profile), self.threads, calendarsync, year, profile))
+    async def yearinfo(self, year, calendar = True) -> dict:
+        """
+        This method returns the information of a year, see `YearInfo.asdict`.
+        """
+        return dict(await self._get(("yearinfo", year, calendar), self.threads, yearinfosync, year, calendar))
+    async def proclamation(self, kind, year, profile = "gregorian") -> str:
+        """
+        This method renders a proclamation of a year, see `proclamationsync`.
+        """
+        if kind not in PROCLAMATIONS: raise ValueError(f"Unknown proclamation {kind!r}, expected one of {', '.join(PROCLAMATIONS)}")
+        if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r}")
+        return await self._get(("proclamation", kind, year, profile), self.threads, proclamationsync, kind, year, profile)
+    async def calendars(self, years, profile = "gregorian") -> dict:
+        """
+        This method lists the celebrations of many calendar years of a profile in the process pool, as year -> celebrations.
+        """
+        if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r}")
+        years = years if isinstance(years, range) else tuple(years) # Ranges are compared by their years, step included.
+        if not years: return {}
+        result = await self._get(("calendars", years, profile), self._processes(), calendarssync, years, profile)
+        return {year: list(celebrations) for year, celebrations in result.items()}
+    async def yearinfos(self, years, calendar = True) -> dict:
+        """
+        This method returns the information of many years in the process pool, as year -> information.
+        """
+        years = years if isinstance(years, range) else tuple(years) # Ranges are compared by their years, step included.
+        if not years: return {}
+        result = await self._get(("yearinfos", years, calendar), self._processes(), yearinfossync, years, calendar)
+        return {year: dict(info) for year, info in result.items()}
+    def close(self):
+        """
+        This method shuts the executors down.
+        """
+        self.threads.shutdown()
+        if self.processes is not None: self.processes.shutdown()
+
+if __name__ == "__main__":
+    # Testing program, a burst of identical requests computed once.
+    async def main():
+        service = CalendarService()
+        results = await asyncio.gather(*[service.calendar(2025) for _ in range(1000)], service.proclamation("noveritis", 2025), service.yearinfos(range(2020, 2030)))
+        print(f"{len(results) - 2} identical requests, {service.computed} computations")
+        print(results[-2])
+        print(results[-1][2025])
+        service.close()
+    asyncio.run(main())
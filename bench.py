@@ -0,0 +1,150 @@
+"""
+A Python module to benchmark the library and to compare two benchmark runs for regressions.
+
+Every benchmark runs in a fresh worker process, and reports:
+- seconds: The best wall time of one call over the repeats (and mean, the mean wall time).
+- allocated: The peak memory allocated by one call, traced by `tracemalloc`.
+- peakrss: The peak resident set size of the worker process in KiB (None where the `resource` module is missing, e.g. on Windows).
+
+Usage:
+    python bench.py run --out baseline.json
+    python bench.py compare baseline.json current.json --threshold 0.1
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+try:
+    import resource
+except ImportError: # Windows has no peak RSS.
+    resource = None
+import numpy as np
+from easter import easterdate
+from easterstats import easterdates
+from liturgicalyear import LiturgicalYear
+from colors import colorarray
+from YearInfo import YearInfo
+from Noveritis import Noveritis
+from Kalenda import Kalenda
+from Exsultet import ExsultetText
+
+def coldstart():
+    """
+    This function imports the main modules in a fresh interpreter.
+    """
+    subprocess.run([sys.executable, "-c", "import liturgicalyear, YearInfo, Noveritis, Kalenda, Exsultet"], check = True)
+
+# Name -> (function, number of calls per repeat).
+BENCHMARKS = {
+    "easterdate": (lambda: easterdate(2025), 10000),
+    "easterdate-1-9999": (lambda: [easterdate(year) for year in range(1, 10000)], 1),
+    "easterdates-1-9999": (lambda: easterdates(np.arange(1, 10000)), 10),
+    "liturgicalyear": (lambda: LiturgicalYear(2025).celebrations, 100),
+    "colorarray": (lambda: colorarray(2025), 100),
+    "yearinfo-1583-2582": (lambda: [YearInfo(year).asdict() for year in range(1583, 2583)], 1),
+    "noveritis": (lambda: Noveritis(2025).text, 1000),
+    "kalenda": (lambda: Kalenda(2025).text, 1000),
+    "exsultet": (lambda: ExsultetText(), 1000),
+    "coldstart": (coldstart, 1),
+}
+METRICS = ["seconds", "allocated", "peakrss"]
+
+def _run(task) -> dict:
+    """
+    This function runs one benchmark in a worker process.
+    """
+    name, repeat = task
+    function, number = BENCHMARKS[name]
+    function() # Warm up.
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number): function()
+        times.append((time.perf_counter() - start) / number)
+    tracemalloc.start()
+    function()
+    allocated = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    peakrss = None
+    if resource is not None:
+        peakrss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+        if sys.platform == "darwin": peakrss //= 1024 # Bytes on macOS, KiB elsewhere.
+    return {"seconds": min(times), "mean": sum(times) / repeat, "number": number, "repeat": repeat, "allocated": allocated, "peakrss": peakrss}
+
+def run(names = None, repeat = 5) -> dict:
+    """
+    This function runs the benchmarks, each in a fresh worker process.
+
+    Args:
+        names (list of str): The benchmarks to run, see `BENCHMARKS`. Default is all benchmarks.
+        repeat (int): The number of repeats of every benchmark. Default is 5.
+
+    Returns:
+        dict: meta (the Python version, platform and time of the run) and results (name -> metrics).
+    """
+    names = list(BENCHMARKS) if names is None else names
+    results = {}
+    for name in names:
+        with ProcessPoolExecutor(max_workers = 1, mp_context = get_context("spawn")) as executor:
+            results[name] = executor.submit(_run, (name, repeat)).result()
+    return {
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), "time": datetime.now().isoformat(timespec = "seconds")},
+        "results": results,
+    }
+
+def compare(old, new, threshold = 0.1) -> list:
+    """
+    This function compares two benchmark runs.
+
+    Args:
+        old (dict): The baseline run, see `run`.
+        new (dict): The current run.
+        threshold (float): The relative increase of a metric counted as a regression. Default is 0.1 (10%).
+
+    Returns:
+        list: (name, metric, old value, new value, ratio, regression) rows for every metric of every benchmark of both runs.
+    """
+    rows = []
+    for name, metrics in new["results"].items():
+        baseline = old["results"].get(name)
+        if baseline is None: continue
+        for metric in METRICS:
+            before, after = baseline.get(metric), metrics.get(metric)
+            if not before or after is None: continue
+            ratio = after / before
+            rows.append((name, metric, before, after, ratio, ratio > 1 + threshold))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Benchmark the library and compare runs.")
+    commands = parser.add_subparsers(dest = "command", required = True)
+    runparser = commands.add_parser("run", help = "run the benchmarks")
+    runparser.add_argument("--out", default = None, help = "JSON file to save the results to (default: print only)")
+    runparser.add_argument("--only", default = None, help = f"comma-separated benchmarks (available: {', '.join(BENCHMARKS)})")
+    runparser.add_argument("--repeat", type = int, default = 5, help = "number of repeats (default: 5)")
+    compareparser = commands.add_parser("compare", help = "compare two saved runs")
+    compareparser.add_argument("old", help = "baseline JSON file")
+    compareparser.add_argument("new", help = "current JSON file")
+    compareparser.add_argument("--threshold", type = float, default = 0.1, help = "relative increase flagged as a regression (default: 0.1)")
+    args = parser.parse_args()
+    if args.command == "run":
+        result = run(None if args.only is None else args.only.split(","), args.repeat)
+        for name, metrics in result["results"].items():
+            print(f"{name:<22}{metrics['seconds'] * 1e6:>14.2f} us{metrics['allocated'] / 1024:>12.1f} KiB{metrics['peakrss'] or 0:>10} KiB RSS")
+        if args.out is not None:
+            with open(args.out, "w", encoding = "utf-8") as file:
+                json.dump(result, file, indent = 1)
+    else:
+        with open(args.old, encoding = "utf-8") as file: old = json.load(file)
+        with open(args.new, encoding = "utf-8") as file: new = json.load(file)
+        rows = compare(old, new, args.threshold)
+        for name, metric, before, after, ratio, regression in rows:
+            print(f"{name:<22}{metric:<10}{before:>16.6g}{after:>16.6g}{ratio:>8.2f}x{'  REGRESSION' if regression else ''}")
+        sys.exit(1 if any(row[5] for row in rows) else 0)
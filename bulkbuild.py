@@ -0,0 +1,241 @@
+"""
+A Python module to build the daily calendar of many years and all profiles in parallel, into one shared memory block that many processes can then read without copying.
+
+The block holds the arrays of `store.CalendarStore` (season, week, celebration, color and rank, one row per profile), a header describing the years and profiles, and one "done" flag per chunk:
+- The years are split into chunks of `chunkyears` years, and every (profile, chunk) is computed by a worker of a process pool with `store.computedays`, directly into its slice of the block. Only the (profile, chunk) numbers are pickled, never the results.
+- A chunk is flagged as done once written, so an interrupted build is resumed by running it again with the same name: the block is attached and only the missing chunks are computed.
+- A finished block is attached read-only with `BulkCalendar.attach(name)` by any number of processes, and is read through the same `store.Day` views as a `CalendarStore`.
+The block outlives the process that built it (until `unlink`), so a build can be served by other processes.
+
+Usage:
+    python bulkbuild.py build --years 1-9998 --name liturgicalcalendar
+    calendar = BulkCalendar.attach("liturgicalcalendar")
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory, resource_tracker
+import numpy as np
+from daynumber import rd
+from liturgicalyear import PROFILES, yearrange
+from store import FIELDS, NAMES, Day, computedays
+
+DEFAULTNAME = "liturgicalcalendar"
+MAGIC = 0x4C495455 # "LITU"
+HEADER = 5 + len(PROFILES) # int64: magic, first, last, chunkyears, number of profiles, then the index of every profile in PROFILES.
+ALIGNMENT = 8
+UNTRACKED = sys.version_info >= (3, 13) # Whether SharedMemory takes track = False.
+
+def _open(name, size = 0):
+    """
+    This function creates (size > 0) or attaches (size = 0) a shared memory block that is not deleted when the process exits.
+    Before Python 3.13, the block is kept out of the resource tracker by not registering it at all, rather than registering and unregistering it: the workers share the tracker of the parent, and their register/unregister pairs of the same name race in it (KeyError tracebacks of the tracker).
+    """
+    create = size > 0
+    if UNTRACKED: return shared_memory.SharedMemory(name = name, create = create, size = size, track = False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None # Otherwise the block is deleted when the process exits.
+    try:
+        return shared_memory.SharedMemory(name = name, create = create, size = size)
+    finally:
+        resource_tracker.register = register
+
+def layout(first, last, profiles, chunkyears) -> tuple:
+    """
+    This function calculates the layout of a block.
+
+    Returns:
+        tuple: (dict of name -> (offset, dtype, shape) of the header, the fields of `FIELDS` and the done flags, the size of the block in bytes).
+    """
+    days = rd(last + 1, 1, 1) - rd(first, 1, 1)
+    chunks = -(-(last - first + 1) // chunkyears)
+    arrays = {"header": (np.int64, (HEADER,))}
+    arrays.update({field: (dtype, (len(profiles), days)) for field, dtype in FIELDS.items()})
+    arrays["done"] = (np.uint8, (len(profiles), chunks))
+    result = {}
+    offset = 0
+    for name, (dtype, shape) in arrays.items():
+        result[name] = (offset, dtype, shape)
+        offset += -(-int(np.prod(shape)) * np.dtype(dtype).itemsize // ALIGNMENT) * ALIGNMENT
+    return result, offset
+
+class BulkCalendar:
+    """
+    This class is a daily calendar of many years and profiles in a shared memory block, with the attributes of a `store.CalendarStore` (so `store.Day` views work on it).
+    """
+    def __init__(self, block, first, last, profiles, chunkyears, readonly = False):
+        """
+        This method initializes the BulkCalendar class on a shared memory block, see `create` and `attach`.
+        """
+        self.block = block
+        self.name = block.name
+        self.first = first
+        self.last = last
+        self.profiles = profiles
+        self.rows = {profile: row for row, profile in enumerate(profiles)}
+        self.chunkyears = chunkyears
+        self.start = rd(first, 1, 1)
+        self.days = rd(last + 1, 1, 1) - self.start
+        self.names = NAMES
+        arrays, size = layout(first, last, profiles, chunkyears)
+        for name, (offset, dtype, shape) in arrays.items():
+            array = np.ndarray(shape, dtype = dtype, buffer = block.buf, offset = offset)
+            if readonly: array.flags.writeable = False
+            setattr(self, name, array)
+    @classmethod
+    def create(cls, first, last, profiles = None, chunkyears = 100, name = DEFAULTNAME):
+        """
+        This method creates a new empty block.
+
+        Args:
+            first (int): The first calendar year (from 1).
+            last (int): The last calendar year (included, up to 9998).
+            profiles (list of str): The profiles, see `liturgicalyear.PROFILES`. Default is all profiles.
+            chunkyears (int): The number of years computed by one task. Default is 100.
+            name (str): The name of the block. Default is "liturgicalcalendar".
+        """
+        profiles = list(PROFILES) if profiles is None else list(profiles)
+        block = _open(name, layout(first, last, profiles, chunkyears)[1])
+        calendar = cls(block, first, last, profiles, chunkyears)
+        calendar.header[:5] = [MAGIC, first, last, chunkyears, len(profiles)]
+        calendar.header[5:5 + len(profiles)] = [list(PROFILES).index(profile) for profile in profiles]
+        return calendar
+    @classmethod
+    def attach(cls, name = DEFAULTNAME, readonly = True):
+        """
+        This method attaches an existing block, read-only by default.
+        """
+        block = _open(name)
+        header = np.ndarray((HEADER,), dtype = np.int64, buffer = block.buf)
+        if header[0] != MAGIC:
+            block.close()
+            raise ValueError(f"The shared memory block {name!r} is not a calendar")
+        first, last, chunkyears, count = (int(value) for value in header[1:5])
+        profiles = [list(PROFILES)[index] for index in header[5:5 + count]]
+        return cls(block, first, last, profiles, chunkyears, readonly)
+    def chunk(self, index) -> tuple:
+        """
+        This method returns the first and last years of a chunk.
+        """
+        first = self.first + index * self.chunkyears
+        return first, min(first + self.chunkyears - 1, self.last)
+    def missing(self) -> list:
+        """
+        This method lists the (row, chunk) tasks not done yet.
+        """
+        return [(int(row), int(chunk)) for row, chunk in zip(*np.nonzero(self.done == 0))]
+    @property
+    def complete(self) -> bool:
+        """
+        This property checks if every chunk is done.
+        """
+        return bool(self.done.all())
+    @property
+    def nbytes(self) -> int:
+        """
+        This property returns the memory used by the arrays of `FIELDS`.
+        """
+        return sum(getattr(self, field).nbytes for field in FIELDS)
+    def day(self, day, profile = "gregorian") -> Day:
+        """
+        This method returns the view of a day of a profile, see `store.CalendarStore.day`.
+        """
+        index = day.toordinal() - self.start
+        if not 0 <= index < self.days: raise ValueError(f"{day} is not in the years {self.first} to {self.last}")
+        return Day(self, self.rows[profile], index)
+    def close(self):
+        """
+        This method detaches the block (the block itself is kept for the other processes).
+        """
+        for name in ["header", "done", *FIELDS]: delattr(self, name) # The arrays must be released before the buffer.
+        self.block.close()
+    def unlink(self):
+        """
+        This method deletes the block, once every process has closed it.
+        """
+        if not UNTRACKED: resource_tracker.register(self.block._name, "shared_memory") # unlink unregisters it.
+        self.block.unlink()
+
+def _buildchunk(task) -> tuple:
+    """
+    This function computes one (profile, chunk) in a worker process, directly into the shared memory block.
+
+    Args:
+        task (tuple): (name of the block, row of the profile, chunk).
+
+    Returns:
+        tuple: (row, chunk).
+    """
+    name, row, chunk = task
+    calendar = BulkCalendar.attach(name, readonly = False)
+    try:
+        first, last = calendar.chunk(chunk)
+        begin = rd(first, 1, 1) - calendar.start
+        end = rd(last + 1, 1, 1) - calendar.start
+        computedays(first, last, PROFILES[calendar.profiles[row]], {field: getattr(calendar, field)[row, begin:end] for field in FIELDS})
+        calendar.done[row, chunk] = 1
+    finally:
+        calendar.close()
+    return row, chunk
+
+def _report(done, total, start):
+    """
+    This function prints the progress of a build on the standard error.
+    """
+    print(f"\r{done}/{total} chunks ({time.perf_counter() - start:.1f} s)", end = "\n" if done == total else "", file = sys.stderr, flush = True)
+
+def build(first, last, profiles = None, chunkyears = 100, name = DEFAULTNAME, workers = None, progress = _report) -> BulkCalendar:
+    """
+    This function builds (or resumes the build of) the daily calendar of a range of years and profiles in a shared memory block.
+
+    Args:
+        first (int): The first calendar year (from 1).
+        last (int): The last calendar year (included, up to 9998).
+        profiles (list of str): The profiles, see `liturgicalyear.PROFILES`. Default is all profiles.
+        chunkyears (int): The number of years computed by one task. Default is 100.
+        name (str): The name of the block. Default is "liturgicalcalendar".
+        workers (int): The number of worker processes. Default is the number of CPUs.
+        progress (function): Called with (done, total, start time) after every chunk, or None. Default prints to the standard error.
+
+    Returns:
+        BulkCalendar: The finished calendar, writable (the caller should `close` it).
+    """
+    profiles = list(PROFILES) if profiles is None else list(profiles)
+    try:
+        calendar = BulkCalendar.attach(name, readonly = False)
+        if (calendar.first, calendar.last, calendar.profiles, calendar.chunkyears) != (first, last, profiles, chunkyears):
+            calendar.close()
+            raise ValueError(f"The shared memory block {name!r} holds another build ({calendar.first}-{calendar.last}, {len(calendar.profiles)} profiles), unlink it first")
+    except FileNotFoundError:
+        calendar = BulkCalendar.create(first, last, profiles, chunkyears, name)
+    tasks = calendar.missing()
+    total = calendar.done.size
+    done = total - len(tasks)
+    start = time.perf_counter()
+    if progress is not None: progress(done, total, start)
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        for future in as_completed([executor.submit(_buildchunk, (name, row, chunk)) for row, chunk in tasks]):
+            future.result()
+            done += 1
+            if progress is not None: progress(done, total, start)
+    return calendar
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Build the daily calendar of many years and profiles in a shared memory block.")
+    parser.add_argument("command", choices = ["build", "status", "unlink"], help = "build: build or resume, status: count the chunks done, unlink: delete the block")
+    parser.add_argument("--years", type = yearrange, default = yearrange("1-9998"), help = "year range (default: 1-9998)")
+    parser.add_argument("--profiles", default = "all", help = f"comma-separated profiles or 'all' (available: {', '.join(PROFILES)})")
+    parser.add_argument("--chunkyears", type = int, default = 100, help = "number of years computed by one task (default: 100)")
+    parser.add_argument("--name", default = DEFAULTNAME, help = f"name of the shared memory block (default: {DEFAULTNAME})")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+    if args.command == "build":
+        profiles = None if args.profiles == "all" else args.profiles.split(",")
+        calendar = build(args.years[0], args.years[-1], profiles, args.chunkyears, args.name, args.workers)
+    else:
+        calendar = BulkCalendar.attach(args.name)
+    print(f"{calendar.name}: {calendar.first}-{calendar.last}, {len(calendar.profiles)} profiles, {int(calendar.done.sum())}/{calendar.done.size} chunks done, {calendar.nbytes} bytes")
+    calendar.close()
+    if args.command == "unlink": calendar.unlink()
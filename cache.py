@@ -0,0 +1,248 @@
+"""
+A Python module to keep the generated calendars, year information and proclamation texts in a persistent SQLite cache shared by many processes.
+
+Every entry is keyed by (engine, year, profile, version):
+- engine: What is cached, see `ENGINES` (e.g. "calendar" for `LiturgicalYear.celebrations`, "kalenda" for the text of the Kalenda).
+- profile: The profile, see `liturgicalyear.PROFILES` ("julian" or "gregorian" for the engines depending on the computus only, "" for the engines depending on the year only).
+- version: The hash of the source of the library modules, so the cache is invalidated automatically whenever the library changes.
+The entries of other versions are kept, so the processes of two versions (e.g. during a rolling deploy) never delete each other's entries. Every version records when a process last used it, and `purge` deletes the versions unused for longer than a retention window.
+The database is in WAL mode, so readers never block the writer, and a busy writer is waited for (busy timeout) instead of failing. The values are stored as JSON.
+
+Usage:
+    python cache.py warm --years 1583-2082 --profiles all
+    python cache.py purge --retention 7
+    celebrations = Cache().get("calendar", 2025, "gregorian-ascension")
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from asyncapi import calendarsync, yearinfosync, proclamationsync
+from liturgicalyear import PROFILES, profilename, yearrange
+
+DEFAULTPATH = "calendarcache.sqlite"
+RETENTION = 7 * 86400 # Seconds a version unused by any process is kept, see `Cache.purge`.
+# The modules the cached values are computed from.
+SOURCES = ["easter", "lent", "advent", "ordinarytime", "daynumber", "weekday", "liturgicalyear", "epact", "YearInfo", "Noveritis", "Kalenda", "Exsultet", "asyncapi"]
+
+def _decodecalendar(value) -> list:
+    """
+    This function decodes the celebrations of a cached calendar, as (date, name, season) tuples.
+    """
+    return [(date.fromisoformat(day), name, season) for day, name, season in value]
+
+# Engine -> (function of the year and profile, what the profile is reduced to: "profile", "calendar" or "year", decoder of the JSON value or None).
+ENGINES = {
+    "calendar": (calendarsync, "profile", _decodecalendar),
+    "yearinfo": (lambda year, profile: yearinfosync(year, PROFILES[profile]["calendar"]), "calendar", None),
+    "noveritis": (lambda year, profile: proclamationsync("noveritis", year, profile), "profile", None),
+    "kalenda": (lambda year, profile: proclamationsync("kalenda", year), "year", None),
+    "exsultet": (lambda year, profile: proclamationsync("exsultet", year), "year", None),
+}
+
+def sourceversion() -> str:
+    """
+    This function returns the version of the library: the hash of the source of the modules of `SOURCES`.
+    """
+    digest = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for module in SOURCES:
+        with open(os.path.join(directory, f"{module}.py"), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+def cacheprofile(engine, profile) -> str:
+    """
+    This function reduces a profile to what an engine depends on, e.g. "gregorian-ascension" to "gregorian" for "yearinfo" and to "" for "kalenda".
+    """
+    if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r}")
+    reduced = ENGINES[engine][1]
+    if reduced == "profile": return profile
+    elif reduced == "calendar": return profilename(PROFILES[profile]["calendar"])
+    return ""
+
+def _encode(value) -> str:
+    """
+    This function encodes a value as JSON, dates as ISO strings.
+    """
+    return json.dumps(value, default = date.isoformat, ensure_ascii = False)
+
+def _computechunk(task) -> list:
+    """
+    This function computes the entries of a chunk of years in a worker process.
+
+    Args:
+        task (tuple): (keys, version), where keys are (engine, year, profile).
+
+    Returns:
+        list: (engine, year, cached profile, version, JSON value) rows.
+    """
+    keys, version = task
+    return [(engine, year, cacheprofile(engine, profile), version, _encode(ENGINES[engine][0](year, profile))) for engine, year, profile in keys]
+
+class Cache:
+    """
+    This class is a persistent cache of the generated calendars in an SQLite database, safe to use from many processes at once (one connection per process).
+    """
+    def __init__(self, path = DEFAULTPATH, version = None, timeout = 30.0):
+        """
+        This method initializes the Cache class, creating the database if needed and recording that its version is in use.
+
+        Args:
+            path (str): The path of the database. Default is "calendarcache.sqlite".
+            version (str): The version of the entries. Default is `sourceversion()`.
+            timeout (float): The number of seconds to wait for a busy writer. Default is 30.
+        """
+        self.path = path
+        self.version = version or sourceversion()
+        self.connection = sqlite3.connect(path, timeout = timeout, isolation_level = None) # Autocommit, transactions are explicit.
+        self.connection.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)}")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL") # Safe in WAL mode, a crash may only lose the last transactions.
+        self.connection.execute("CREATE TABLE IF NOT EXISTS entries (engine TEXT, year INTEGER, profile TEXT, version TEXT, value TEXT, PRIMARY KEY (engine, year, profile, version)) WITHOUT ROWID")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS versions (version TEXT PRIMARY KEY, used REAL)")
+        self._touch()
+        self.hits = 0
+        self.misses = 0
+    def _touch(self):
+        """
+        This method records that the version of the cache is in use now.
+        """
+        self.connection.execute("INSERT OR REPLACE INTO versions VALUES (?, ?)", (self.version, time.time()))
+    def lookup(self, engine, year, profile = "gregorian"):
+        """
+        This method returns a cached value, or None if it is not cached.
+        """
+        row = self.connection.execute("SELECT value FROM entries WHERE engine = ? AND year = ? AND profile = ? AND version = ?", (engine, year, cacheprofile(engine, profile), self.version)).fetchone()
+        if row is None: return None
+        value = json.loads(row[0])
+        decoder = ENGINES[engine][2]
+        return value if decoder is None else decoder(value)
+    def get(self, engine, year, profile = "gregorian"):
+        """
+        This method returns a value from the cache, computing and storing it on a miss.
+
+        Args:
+            engine (str): What to get, see `ENGINES`.
+            year (int): The year.
+            profile (str): The profile, see `liturgicalyear.PROFILES`. Default is "gregorian".
+        """
+        value = self.lookup(engine, year, profile)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = ENGINES[engine][0](year, profile)
+        self.connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", (engine, year, cacheprofile(engine, profile), self.version, _encode(value)))
+        self._touch()
+        return value
+    def missing(self, years, profiles = None, engines = None) -> list:
+        """
+        This method lists the (engine, year, profile) keys that are not cached yet, one per cached profile.
+        """
+        profiles = list(PROFILES) if profiles is None else profiles
+        engines = list(ENGINES) if engines is None else engines
+        cached = set(self.connection.execute("SELECT engine, year, profile FROM entries WHERE version = ?", (self.version,)))
+        keys = {}
+        for engine in engines:
+            for profile in profiles:
+                for year in years:
+                    key = (engine, year, cacheprofile(engine, profile))
+                    if key not in cached and key not in keys: keys[key] = (engine, year, profile)
+        return list(keys.values())
+    def warm(self, years, profiles = None, engines = None, workers = None, chunksize = 500) -> dict:
+        """
+        This method pre-populates the cache for many years, computing the missing entries in a process pool and writing every chunk in one transaction.
+
+        Args:
+            years (iterable of int): The years (1 to 9998).
+            profiles (list of str): The profiles. Default is all profiles.
+            engines (list of str): The engines. Default is all engines.
+            workers (int): The number of worker processes. Default is the number of CPUs.
+            chunksize (int): The number of entries computed by one task and written in one transaction. Default is 500.
+
+        Returns:
+            dict: The statistics of the warm-up: written and seconds.
+        """
+        start = time.perf_counter()
+        keys = self.missing(list(years), profiles, engines)
+        tasks = [(keys[index:index + chunksize], self.version) for index in range(0, len(keys), chunksize)]
+        written = 0
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+            for rows in executor.map(_computechunk, tasks):
+                self.connection.execute("BEGIN IMMEDIATE")
+                try:
+                    self.connection.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)", rows)
+                    self._touch()
+                    self.connection.execute("COMMIT")
+                except BaseException:
+                    self.connection.execute("ROLLBACK")
+                    raise
+                written += len(rows)
+        return {"written": written, "seconds": round(time.perf_counter() - start, 3)}
+    def stats(self) -> dict:
+        """
+        This method returns the number of cached entries by engine.
+        """
+        return dict(self.connection.execute("SELECT engine, COUNT(*) FROM entries WHERE version = ? GROUP BY engine", (self.version,)).fetchall())
+    def purge(self, retention = RETENTION) -> int:
+        """
+        This method deletes the entries of the other versions not used by any process for longer than a retention window (the version of this cache is always kept).
+
+        Args:
+            retention (float): The number of seconds an unused version is kept. Default is 7 days.
+
+        Returns:
+            int: The number of deleted entries.
+        """
+        self._touch()
+        cutoff = time.time() - retention
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            # Versions without a record (from before the versions table) count as unused.
+            stale = "version != ? AND version NOT IN (SELECT version FROM versions WHERE used >= ?)"
+            deleted = self.connection.execute(f"DELETE FROM entries WHERE {stale}", (self.version, cutoff)).rowcount
+            self.connection.execute("DELETE FROM versions WHERE version != ? AND used < ?", (self.version, cutoff))
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        return deleted
+    def clear(self):
+        """
+        This method deletes every entry.
+        """
+        self.connection.execute("DELETE FROM entries")
+        self.connection.execute("DELETE FROM versions WHERE version != ?", (self.version,))
+    def close(self):
+        """
+        This method closes the database.
+        """
+        self.connection.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Manage the persistent cache of the generated calendars.")
+    parser.add_argument("command", choices = ["warm", "stats", "purge", "clear"], help = "warm: pre-populate a year range, stats: count the entries, purge: delete the versions unused for the retention window, clear: delete every entry")
+    parser.add_argument("--db", default = DEFAULTPATH, help = f"path of the database (default: {DEFAULTPATH})")
+    parser.add_argument("--years", type = yearrange, default = yearrange(str(date.today().year)), help = "year or year range to warm up (default: this year)")
+    parser.add_argument("--profiles", default = "all", help = f"comma-separated profiles or 'all' (available: {', '.join(PROFILES)})")
+    parser.add_argument("--engines", default = "all", help = f"comma-separated engines or 'all' (available: {', '.join(ENGINES)})")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default: number of CPUs)")
+    parser.add_argument("--retention", type = float, default = RETENTION / 86400, help = f"days an unused version is kept by purge (default: {RETENTION // 86400})")
+    args = parser.parse_args()
+    cache = Cache(args.db)
+    if args.command == "warm":
+        profiles = None if args.profiles == "all" else args.profiles.split(",")
+        engines = None if args.engines == "all" else args.engines.split(",")
+        print(cache.warm(args.years, profiles, engines, args.workers))
+    elif args.command == "purge":
+        print(f"{cache.purge(args.retention * 86400)} entries of unused versions deleted")
+    elif args.command == "clear":
+        cache.clear()
+    print(f"Version {cache.version}: {cache.stats()}")
+    cache.close()
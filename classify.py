@@ -0,0 +1,140 @@
+"""
+A Python module to classify columns of dates (NumPy `datetime64` arrays, pandas Series or DatetimeIndex) by liturgical year, season and week, without any per-row Python.
+
+The liturgical year N starts on the first Sunday of Advent of the calendar year N - 1 (as in `advent.Advent`), and is cut into seasons:
+- advent: From the first Sunday of Advent, weeks 1 to 4.
+- christmas: From Christmas Day to the Baptism of the Lord, not numbered (week 0).
+- ordinary: From the day after the Baptism of the Lord to the day before Ash Wednesday, and from the day after Pentecost to the day before Advent, numbered as in `ordinarytime.sundayrd` (the week of a Sunday and the days after it, 1 to 34).
+- lent: From Ash Wednesday to the day before Maundy Thursday, week 0 for Ash Wednesday and the days after it, then weeks 1 to 5 and 6 for Holy Week.
+- triduum: From Maundy Thursday to Holy Saturday, not numbered (week 0).
+- easter: From Easter Sunday to Pentecost Sunday, weeks 1 to 7 (and 8 for Pentecost Sunday).
+The first days of the seasons of every liturgical year in the column are computed once per unique year with the day-number functions of the season modules (`lentrd`, `adventrd`, `christmastiderd`, ...) into one sorted array, so every date is classified by one `searchsorted` into it.
+
+Usage:
+    seasons, weeks, years = classify(df["date"].to_numpy())
+"""
+
+import numpy as np
+from daynumber import rd, sunday
+from lent import lentrd, eastertiderd
+from advent import adventrd, christmastiderd
+
+# Season codes.
+ADVENT = 0
+CHRISTMAS = 1
+ORDINARY = 2
+LENT = 3
+TRIDUUM = 4
+EASTER = 5
+NOSEASON = -1 # NaT.
+
+SEASONS = ["advent", "christmas", "ordinary", "lent", "triduum", "easter"]
+EPOCH = rd(1970, 1, 1) # Rata Die of day 0 of `datetime64`.
+
+def todaynumbers(dates) -> tuple:
+    """
+    This function converts a column of dates to Rata Die.
+
+    Returns:
+        tuple: (the int64 Rata Die, the mask of NaT).
+    """
+    days = np.asarray(dates, dtype = "datetime64[D]")
+    missing = np.isnat(days)
+    return days.astype(np.int64) + EPOCH, missing
+
+def segments(year, calendar = True, epiphany_on_jan6th = False) -> list:
+    """
+    This function lists the seasons of a liturgical year in order.
+
+    Args:
+        year (int): The liturgical year, starting on the first Sunday of Advent of the calendar year year - 1.
+        calendar (bool): Whether to use the Gregorian computus. Default is True (Gregorian calendar, but Julian Easter if before 1583).
+        epiphany_on_jan6th (bool): Whether Epiphany is celebrated on 6 January. Default is False.
+
+    Returns:
+        list: (Rata Die of the first day, season code, Rata Die of the Sunday starting week 0 or None if the weeks of the season are not numbered) of every season.
+    """
+    advent = adventrd(year)["firstSunday"]
+    christmas = christmastiderd(year, epiphany_on_jan6th)
+    lent = lentrd(year, calendar)
+    easter = lent["EasterSunday"]
+    return [
+        (advent, ADVENT, advent - 7),
+        (christmas["ChristmasDay"], CHRISTMAS, None),
+        (christmas["BaptismOfTheLord"] + 1, ORDINARY, sunday(rd(year - 1, 12, 31))),
+        (lent["AshWednesday"], LENT, lent["AshWednesday"] - 3), # Week 0 until the first Sunday of Lent.
+        (lent["MaundyThursday"], TRIDUUM, None),
+        (easter, EASTER, easter - 7),
+        (eastertiderd(year, calendar)["pentecost"] + 1, ORDINARY, sunday(rd(year, 3, 27))),
+    ]
+
+def boundaries(years, calendar = True, epiphany_on_jan6th = False) -> dict:
+    """
+    This function builds the sorted boundary arrays of many liturgical years, once per year.
+
+    Args:
+        years (iterable of int): The liturgical years, in increasing order.
+        calendar, epiphany_on_jan6th (bool): See `segments`.
+
+    Returns:
+        dict: "start", "season", "anchor" (start of week 0, or the start of the season if it has no numbered weeks), "numbered" and "year" arrays, one entry per season.
+    """
+    rows = [(start, season, start if anchor is None else anchor, anchor is not None, year) for year in years for start, season, anchor in segments(year, calendar, epiphany_on_jan6th)]
+    start, season, anchor, numbered, year = zip(*rows)
+    return {
+        "start": np.array(start, dtype = np.int64),
+        "season": np.array(season, dtype = np.int8),
+        "anchor": np.array(anchor, dtype = np.int64),
+        "numbered": np.array(numbered, dtype = bool),
+        "year": np.array(year, dtype = np.int64),
+    }
+
+def classify(dates, calendar = True, epiphany_on_jan6th = False) -> tuple:
+    """
+    This function classifies a column of dates by season, week and liturgical year.
+
+    Args:
+        dates (array-like of datetime64): The dates, e.g. a `datetime64` array or a pandas Series or DatetimeIndex (without time zone). NaT is allowed.
+        calendar (bool): Whether to use the Gregorian computus. Default is True (Gregorian calendar, but Julian Easter if before 1583).
+        epiphany_on_jan6th (bool): Whether Epiphany is celebrated on 6 January. Default is False.
+
+    Returns:
+        tuple: (int8 season codes, int8 weeks, int64 liturgical years), parallel to the dates. NaT has season NOSEASON, week -1 and year -1.
+    """
+    days = np.asarray(dates, dtype = "datetime64[D]")
+    numbers, missing = todaynumbers(days)
+    valid = numbers[~missing]
+    seasons = np.full(numbers.shape, NOSEASON, dtype = np.int8)
+    weeks = np.full(numbers.shape, -1, dtype = np.int8)
+    years = np.full(numbers.shape, -1, dtype = np.int64)
+    if valid.size == 0: return seasons, weeks, years
+    calendaryears = np.unique(days[~missing].astype("datetime64[Y]").astype(np.int64) + 1970)
+    liturgicalyears = np.union1d(calendaryears, calendaryears + 1) # A date is in the liturgical year of its calendar year, or of the next one after Advent.
+    table = boundaries(liturgicalyears.tolist(), calendar, epiphany_on_jan6th)
+    index = np.searchsorted(table["start"], valid, side = "right") - 1
+    seasons[~missing] = table["season"][index]
+    weeks[~missing] = np.where(table["numbered"][index], (valid - table["anchor"][index]) // 7, 0)
+    years[~missing] = table["year"][index]
+    return seasons, weeks, years
+
+def seasonnames(codes) -> np.ndarray:
+    """
+    This function converts season codes to season names (an empty string for NOSEASON).
+    """
+    names = np.array(SEASONS + [""])
+    return names[np.asarray(codes)]
+
+def weekdays(dates) -> np.ndarray:
+    """
+    This function returns the weekday of every date of a column, numbered as `date.weekday()` (0 = Monday, ..., 6 = Sunday), -1 for NaT.
+    """
+    numbers, missing = todaynumbers(dates)
+    return np.where(missing, -1, (numbers - 1) % 7).astype(np.int8)
+
+if __name__ == "__main__":
+    # Testing program, classifying every day of a few years and printing the first day of every season.
+    days = np.arange("2024-11-25", "2026-01-05", dtype = "datetime64[D]")
+    seasons, weeks, years = classify(days)
+    changes = np.flatnonzero(np.diff(seasons, prepend = np.int8(NOSEASON)))
+    for index in changes:
+        print(f"{days[index]}: {SEASONS[seasons[index]]} (liturgical year {years[index]}, week {weeks[index]})")
@@ -0,0 +1,250 @@
+"""
+A Python module to calculate the liturgical colors of every day of a given year, and to render many years of liturgical colors as SVG/PNG color strips at once.
+
+The colors and their hex values follow `Calendar Prompt.txt`:
+- Green (#008000) - Ordinary Time
+- Violet (#800080) - Advent and Lent, All Souls
+- Rose (#FF0080) - 3rd Sunday of Advent and 4th Sunday of Lent
+- White (#FFFFFF) - Christmastide and Eastertide, Maundy Thursday, Feasts of the Lord, all confessors, Saint John the Evangelist
+- Red (#DA251D) - Feasts of the Passion of the Lord (Palm Sunday, Good Friday, Exaltation of the Cross), Pentecost, Martyrs, Apostles
+- Black (#000000) - Holy Saturday proper
+- Yellow (#FFFF00) - Easter Vigil and Easter Octave
+- Blue (#3399FF) - Feasts of the Virgin Mary, New Year's Day
+- Red+Green - Christmas Octave (except 26-28 December falling on weekdays)
+
+Every day is stored as one uint8 color code, so a year is a single 365/366-byte NumPy array and many years are a single 2-D array (one row per year).
+"""
+
+import os
+import struct
+import zlib
+from datetime import date
+import numpy as np
+from lent import Lent, Eastertide, SolemnitiesoftheLord, LentenEastertide_Holidays
+from advent import Advent, Christmastide
+from ordinarytime import OrdinaryTime
+
+# Color codes of the color arrays.
+GREEN = 0
+VIOLET = 1
+ROSE = 2
+WHITE = 3
+RED = 4
+BLACK = 5
+YELLOW = 6
+BLUE = 7
+REDGREEN = 8
+NONE = 255 # Padding for the 366th day of a common year in 2-D color arrays.
+
+COLORNAMES = ["Green", "Violet", "Rose", "White", "Red", "Black", "Yellow", "Blue", "Red+Green"]
+COLORHEX = ["#008000", "#800080", "#FF0080", "#FFFFFF", "#DA251D", "#000000", "#FFFF00", "#3399FF", "#DA251D"]
+PADDINGHEX = "#D3D3D3" # Light grey for the padding day.
+
+# Fixed feasts of Ordinary Time, only colored if they fall on a green day (so they never override a season).
+FIXEDFEASTS = [
+    (2, 2, WHITE), # Presentation of the Lord (Candlemas)
+    (6, 29, RED), # Ss Peter and Paul
+    (8, 6, WHITE), # Transfiguration
+    (8, 15, BLUE), # Assumption of the Blessed Virgin Mary
+    (9, 14, RED), # Exaltation of the Holy Cross
+    (11, 1, WHITE), # All Saints
+    (11, 2, VIOLET), # All Souls
+    (11, 9, WHITE), # Dedication of the Lateran Archbasilica
+]
+
+def colorarray(year, calendar = True, ascensionThursday = False, corpusChristionThursday = False, epiphany_on_jan6th = False) -> np.ndarray:
+    """
+    This function calculates the liturgical color of every day of a given calendar year (1 January to 31 December).
+    The colors are derived from the season classes: Christmastide and Advent of the liturgical years starting and ending in this calendar year, Lent, Eastertide, Solemnities of the Lord and Ordinary Time.
+
+    Args:
+        year (int): The calendar year to calculate the colors for.
+        calendar (bool): Whether to return the date in the Gregorian calendar. Default is True (Gregorian calendar, but Julian Easter if before 1583).
+        ascensionThursday (bool): Whether Ascension is celebrated on Thursday. Default is False.
+        corpusChristionThursday (bool): Whether Corpus Christi is celebrated on Thursday. Default is False.
+        epiphany_on_jan6th (bool): Whether Epiphany is celebrated on 6 January. Default is False.
+
+    Returns:
+        np.ndarray: The uint8 color codes of the year, index 0 is 1 January.
+    """
+    newyear = date(year, 1, 1).toordinal()
+    def day(d):
+        return d.toordinal() - newyear # Index of the date in the array.
+    colors = np.full(366 if date(year, 12, 31).timetuple().tm_yday == 366 else 365, GREEN, dtype = np.uint8)
+    # Christmastide of this calendar year, until the Baptism of the Lord.
+    christmastide = Christmastide(year, epiphany_on_jan6th)
+    colors[:day(christmastide.BaptismOfTheLord) + 1] = WHITE
+    colors[0] = BLUE # Solemnity of Mary, Mother of God (New Year's Day)
+    # Fixed feasts of Ordinary Time, before the seasons that override them.
+    for month, dom, color in FIXEDFEASTS:
+        colors[day(date(year, month, dom))] = color
+    colors[day(OrdinaryTime(year, calendar).ChristtheKing)] = WHITE
+    # Lent and the Paschal Triduum.
+    lent = Lent(year, calendar)
+    colors[day(lent.AshWednesday):day(lent.HolySaturday) + 1] = VIOLET
+    colors[day(lent.FourthSunday)] = ROSE # Laetare Sunday
+    colors[day(lent.PalmSunday)] = RED
+    colors[day(lent.MaundyThursday)] = WHITE
+    colors[day(lent.GoodFriday)] = RED
+    colors[day(lent.HolySaturday)] = BLACK
+    # Eastertide: the Easter Octave, then white until Pentecost.
+    eastertide = Eastertide(year, calendar, ascensionThursday)
+    colors[day(eastertide.EasterSunday):day(eastertide.pentecost)] = WHITE
+    colors[day(eastertide.EasterSunday):day(eastertide.secondSunday) + 1] = YELLOW
+    colors[day(eastertide.pentecost)] = RED
+    # Solemnities of the Lord after Pentecost.
+    solemnities = SolemnitiesoftheLord(year, calendar, corpusChristionThursday)
+    colors[day(solemnities.Trinity)] = WHITE
+    colors[day(solemnities.CorpusChristi)] = WHITE
+    colors[day(solemnities.SacredHeart)] = WHITE
+    # Saint Joseph and the Annunciation.
+    holidays = LentenEastertide_Holidays(year, calendar)
+    colors[day(holidays.SaintJoseph)] = WHITE
+    colors[day(holidays.Annunciation)] = BLUE
+    # Advent of the next liturgical year.
+    advent = Advent(year + 1)
+    colors[day(advent.firstSunday):day(date(year, 12, 24)) + 1] = VIOLET
+    colors[day(advent.thirdSunday)] = ROSE # Gaudete Sunday
+    colors[day(advent.ImmaculateConception)] = BLUE
+    # Christmas Day and the Christmas Octave of the next liturgical year.
+    nextchristmastide = Christmastide(year + 1, epiphany_on_jan6th)
+    colors[day(nextchristmastide.ChristmasDay)] = WHITE
+    colors[day(date(year, 12, 26)):] = REDGREEN
+    for dom, color in [(26, RED), (27, WHITE), (28, RED)]: # St Stephen, St John the Evangelist, Holy Innocents
+        if date(year, 12, dom).weekday() != 6: colors[day(date(year, 12, dom))] = color
+    colors[day(nextchristmastide.holyFamily)] = WHITE
+    return colors
+
+def colorarrays(years, calendar = True, ascensionThursday = False, corpusChristionThursday = False, epiphany_on_jan6th = False) -> np.ndarray:
+    """
+    This function calculates the liturgical colors of many years at once.
+
+    Args:
+        years (iterable of int): The calendar years to calculate the colors for.
+        calendar, ascensionThursday, corpusChristionThursday, epiphany_on_jan6th: See `colorarray`.
+
+    Returns:
+        np.ndarray: A (len(years), 366) uint8 array, one row per year. The 366th day of a common year is NONE.
+    """
+    years = list(years)
+    colors = np.full((len(years), 366), NONE, dtype = np.uint8)
+    for row, year in enumerate(years):
+        yearcolors = colorarray(year, calendar, ascensionThursday, corpusChristionThursday, epiphany_on_jan6th)
+        colors[row, :len(yearcolors)] = yearcolors
+    return colors
+
+def _palette():
+    """
+    This function returns the PNG palette index and lookup tables of the color codes.
+    Red+Green is drawn as red on the upper half and green on the lower half of the day.
+    """
+    upper = np.arange(256, dtype = np.uint8)
+    upper[REDGREEN] = RED
+    upper[NONE] = len(COLORHEX)
+    lower = upper.copy()
+    lower[REDGREEN] = GREEN
+    hexes = COLORHEX + [PADDINGHEX]
+    palette = b"".join(bytes.fromhex(h[1:]) for h in hexes)
+    return palette, upper, lower
+
+def strippng(colors, daywidth = 2, rowheight = 16) -> bytes:
+    """
+    This function renders a 2-D color array as a palette PNG image, one horizontal strip per row (year) and one column per day.
+    The whole image is built with NumPy indexing, without any per-day Python objects.
+
+    Args:
+        colors (np.ndarray): The color array, 1-D (one year) or 2-D (one row per year).
+        daywidth (int): The width of a day in pixels. Default is 2.
+        rowheight (int): The height of a year in pixels. Default is 16.
+
+    Returns:
+        bytes: The PNG file.
+    """
+    colors = np.atleast_2d(colors)
+    palette, upper, lower = _palette()
+    half = rowheight // 2
+    rows = np.concatenate([np.repeat(upper[colors][:, None, :], half, axis = 1), np.repeat(lower[colors][:, None, :], rowheight - half, axis = 1)], axis = 1)
+    pixels = np.repeat(rows.reshape(-1, colors.shape[1]), daywidth, axis = 1)
+    height, width = pixels.shape
+    raw = np.zeros((height, width + 1), dtype = np.uint8) # The first byte of every scanline is the filter type (0 = None).
+    raw[:, 1:] = pixels
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+    return (b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)) # 8-bit palette image
+        + chunk(b"PLTE", palette)
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 9))
+        + chunk(b"IEND", b""))
+
+def stripsvg(colors, daywidth = 2, rowheight = 16) -> str:
+    """
+    This function renders a 2-D color array as an SVG image, one horizontal strip per row (year) and one column per day.
+    Consecutive days of the same color are merged into one rectangle, the runs are found with NumPy.
+
+    Args:
+        colors (np.ndarray): The color array, 1-D (one year) or 2-D (one row per year).
+        daywidth (int): The width of a day in pixels. Default is 2.
+        rowheight (int): The height of a year in pixels. Default is 16.
+
+    Returns:
+        str: The SVG document.
+    """
+    colors = np.atleast_2d(colors)
+    height = colors.shape[0] * rowheight
+    width = colors.shape[1] * daywidth
+    half = rowheight / 2
+    rects = []
+    for row, yearcolors in enumerate(colors):
+        starts = np.flatnonzero(np.diff(yearcolors, prepend = np.int16(-1))) # Start index of every run of equal colors.
+        ends = np.append(starts[1:], len(yearcolors))
+        y = row * rowheight
+        for start, end, color in zip(starts.tolist(), ends.tolist(), yearcolors[starts].tolist()):
+            x, w = start * daywidth, (end - start) * daywidth
+            if color == NONE: continue
+            elif color == REDGREEN:
+                rects.append(f'<rect x="{x}" y="{y}" width="{w}" height="{half:g}" fill="{COLORHEX[RED]}"/>')
+                rects.append(f'<rect x="{x}" y="{y + half:g}" width="{w}" height="{half:g}" fill="{COLORHEX[GREEN]}"/>')
+            else:
+                rects.append(f'<rect x="{x}" y="{y}" width="{w}" height="{rowheight}" fill="{COLORHEX[color]}"/>')
+    return f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" shape-rendering="crispEdges">\n' + "\n".join(rects) + "\n</svg>\n"
+
+def renderstrips(years, directory, formats = ("svg", "png"), sheet = False, daywidth = 2, rowheight = 16, **profile) -> list:
+    """
+    This function renders the color strips of many years in one batch. The colors of all years are computed once into a single 2-D array, and every strip is sliced from it.
+
+    Args:
+        years (iterable of int): The calendar years to render.
+        directory (str): The directory to write the files to.
+        formats (tuple of str): The file formats to write, "svg" and/or "png". Default is both.
+        sheet (bool): Whether to write all years into one file (`strips.svg`/`strips.png`) instead of one file per year (`2025.svg`/`2025.png`). Default is False.
+        daywidth (int): The width of a day in pixels. Default is 2.
+        rowheight (int): The height of a year in pixels. Default is 16.
+        **profile: The calendar, ascensionThursday, corpusChristionThursday and epiphany_on_jan6th flags, see `colorarray`.
+
+    Returns:
+        list: The paths of the written files.
+    """
+    years = list(years)
+    colors = colorarrays(years, **profile)
+    renderers = {"svg": lambda c: stripsvg(c, daywidth, rowheight).encode(), "png": lambda c: strippng(c, daywidth, rowheight)}
+    os.makedirs(directory, exist_ok = True)
+    jobs = [("strips", colors)] if sheet else [(str(year), colors[row]) for row, year in enumerate(years)]
+    paths = []
+    for name, strip in jobs:
+        for fmt in formats:
+            path = os.path.join(directory, f"{name}.{fmt}")
+            with open(path, "wb") as file:
+                file.write(renderers[fmt](strip))
+            paths.append(path)
+    return paths
+
+if __name__ == "__main__":
+    # Testing program, printing the colors of the notable days of a given year.
+    year = 2025
+    colors = colorarray(year)
+    newyear = date(year, 1, 1).toordinal()
+    previous = None
+    for index, color in enumerate(colors.tolist()):
+        if color != previous:
+            print(f"{date.fromordinal(newyear + index)}: {COLORNAMES[color]}")
+            previous = color
@@ -0,0 +1,91 @@
+"""
+A Python module to count days as integers (Rata Die) in the proleptic Gregorian calendar, for any year.
+
+The Rata Die (RD) of a date is its number of days since 31 December 1 BC, so RD 1 is 1 January 1 (a Monday), and it is the same number as `date.toordinal()` within the years 1 to 9999 of the `datetime` module.
+The season modules (`easter.py`, `lent.py`, `advent.py`, `ordinarytime.py`) do their date arithmetic on day numbers and only create `date` objects at the edges, so their `...rd` functions work for any year (including years before 1 and after 9999) and run faster in bulk.
+The Julian Day Number (JDN, the astronomical day count from 1 January 4713 BC in the Julian calendar) of a date is its RD + JDNOFFSET.
+"""
+
+from datetime import date
+
+JDNOFFSET = 1721425 # JDN of a date = RD + JDNOFFSET (RD 1 = JDN 1721426).
+
+def isleap(year) -> bool:
+    """
+    This function checks if a given year is a leap year in the proleptic Gregorian calendar.
+    """
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+def rd(year, month, day) -> int:
+    """
+    This function returns the Rata Die of a date in the proleptic Gregorian calendar.
+
+    Args:
+        year (int): The year, any integer (0 is 1 BC, -1 is 2 BC, etc.).
+        month (int): The month (1 to 12).
+        day (int): The day of the month.
+
+    Returns:
+        int: The Rata Die of the date.
+    """
+    y = year - 1
+    correction = 0 if month <= 2 else (-1 if isleap(year) else -2) # February is 30 days short of the (367 * month - 362) // 12 approximation.
+    return 365 * y + y // 4 - y // 100 + y // 400 + (367 * month - 362) // 12 + correction + day
+
+def fromrd(number) -> tuple:
+    """
+    This function converts a Rata Die to a date in the proleptic Gregorian calendar.
+
+    Args:
+        number (int): The Rata Die.
+
+    Returns:
+        tuple: (year, month, day).
+    """
+    d0 = number - 1
+    n400, d1 = divmod(d0, 146097)
+    n100, d2 = divmod(d1, 36524)
+    n4, d3 = divmod(d2, 1461)
+    n1 = d3 // 365
+    year = 400 * n400 + 100 * n100 + 4 * n4 + n1
+    if n100 != 4 and n1 != 4: year += 1 # Otherwise, the day is 31 December of a leap year.
+    priordays = number - rd(year, 1, 1)
+    correction = 0 if number < rd(year, 3, 1) else (1 if isleap(year) else 2)
+    month = (12 * (priordays + correction) + 373) // 367
+    return (year, month, number - rd(year, month, 1) + 1)
+
+def todate(number) -> date:
+    """
+    This function converts a Rata Die to a `date` (raising ValueError outside the years 1 to 9999), or None if the day number is None.
+    """
+    return None if number is None else date.fromordinal(number)
+
+def weekday(number) -> int:
+    """
+    This function returns the weekday of a Rata Die, numbered as `date.weekday()` (0 = Monday, ..., 6 = Sunday).
+    """
+    return (number - 1) % 7
+
+def sunday(number) -> int:
+    """
+    This function returns the Rata Die of the Sunday following or coinciding with a Rata Die, as `advent.getSunday` does for dates.
+    """
+    return number + 6 - weekday(number)
+
+def jdn(number) -> int:
+    """
+    This function converts a Rata Die to a Julian Day Number.
+    """
+    return number + JDNOFFSET
+
+def fromjdn(number) -> int:
+    """
+    This function converts a Julian Day Number to a Rata Die.
+    """
+    return number - JDNOFFSET
+
+if __name__ == "__main__":
+    # Testing program, printing the day numbers of a few dates outside the range of the datetime module.
+    for year, month, day in [(2025, 4, 20), (-4713, 11, 24), (10000, 1, 1), (123456, 12, 25)]:
+        number = rd(year, month, day)
+        print(f"{year}-{month:02d}-{day:02d}: RD {number}, JDN {jdn(number)}, weekday {weekday(number)}, back to {fromrd(number)}")
@@ -0,0 +1,210 @@
+"""
+A Python module to compare the daily calendar of two configurations over a range of years, reporting only the days that differ, e.g. before and after changing a profile flag or upgrading the library.
+
+A side of the comparison is a profile (see `liturgicalyear.PROFILES`) taken from a source:
+- "gregorian": Computed now by this version of the library, with `store.computedays`, chunk by chunk in a process pool.
+- "gregorian@calendar.npz": Read from a snapshot saved by `snapshot` (e.g. by an earlier version of the library, whose `cache.sourceversion` it records).
+- "gregorian@shm:liturgicalcalendar": Read from a shared memory block built by `bulkbuild.build`.
+The profile selects the computus (the `calendar` flag: Gregorian or Julian Easter) and the transfer flags.
+Every side is one set of columnar arrays of `store.FIELDS` (one value per day), so the days that differ are found with one vectorized comparison per field, and consecutive days with the same change are merged into one run of the report.
+
+Usage:
+    python diff.py compare gregorian julian --years 1-9998
+    python diff.py snapshot gregorian --output before.npz
+    python diff.py compare gregorian@before.npz gregorian
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from daynumber import rd, todate
+from liturgicalyear import PROFILES, yearrange
+from store import FIELDS, NAMES, computedays
+from classify import SEASONS, EPOCH
+from colors import COLORNAMES
+from cache import sourceversion
+
+# Field -> function formatting a value of the field.
+FORMATS = {
+    "season": lambda value: SEASONS[value],
+    "week": str,
+    "celebration": lambda value: NAMES[value] or "-",
+    "color": lambda value: COLORNAMES[value],
+    "rank": str,
+}
+
+def _computechunk(task) -> dict:
+    """
+    This function computes the daily calendar of a chunk of years of a profile in a worker process.
+
+    Args:
+        task (tuple): (first year, last year, profile).
+    """
+    first, last, profile = task
+    days = rd(last + 1, 1, 1) - rd(first, 1, 1)
+    out = {field: np.zeros(days, dtype = dtype) for field, dtype in FIELDS.items()}
+    computedays(first, last, PROFILES[profile], out)
+    return out
+
+def compute(first, last, profile = "gregorian", workers = None, chunkyears = 500) -> dict:
+    """
+    This function computes the daily calendar of a range of years of a profile with this version of the library.
+
+    Args:
+        first (int): The first calendar year (from 1).
+        last (int): The last calendar year (included, up to 9998).
+        profile (str): The profile, see `liturgicalyear.PROFILES`. Default is "gregorian".
+        workers (int): The number of worker processes. Default is the number of CPUs.
+        chunkyears (int): The number of years computed by one task. Default is 500.
+
+    Returns:
+        dict: field of `store.FIELDS` -> 1-D array of the days from 1 January of the first year.
+    """
+    if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+    tasks = [(year, min(year + chunkyears - 1, last), profile) for year in range(first, last + 1, chunkyears)]
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        chunks = list(executor.map(_computechunk, tasks))
+    return {field: np.concatenate([chunk[field] for chunk in chunks]) for field in FIELDS}
+
+def snapshot(path, first, last, profile = "gregorian", workers = None):
+    """
+    This function saves the daily calendar of a range of years of a profile to a compressed NumPy file, with the version of the library, to be compared later (see `load`).
+
+    Args:
+        path (str): The path of the .npz file.
+        first (int): The first calendar year (from 1).
+        last (int): The last calendar year (included, up to 9998).
+        profile (str): The profile, see `liturgicalyear.PROFILES`. Default is "gregorian".
+        workers (int): The number of worker processes. Default is the number of CPUs.
+    """
+    arrays = compute(first, last, profile, workers)
+    np.savez_compressed(path, years = np.array([first, last], dtype = np.int64), profile = np.array(profile), version = np.array(sourceversion()), **arrays)
+
+def load(side, first, last, workers = None) -> tuple:
+    """
+    This function loads the daily calendar of a side of a comparison over a range of years.
+
+    Args:
+        side (str): "profile", "profile@path.npz" (a snapshot) or "profile@shm:name" (a shared memory block of `bulkbuild`).
+        first (int): The first calendar year (from 1).
+        last (int): The last calendar year (included, up to 9998).
+        workers (int): The number of worker processes, when the side is computed. Default is the number of CPUs.
+
+    Returns:
+        tuple: (the description of the side, dict of field of `store.FIELDS` -> 1-D array of the days from 1 January of the first year).
+    """
+    profile, _, source = side.partition("@")
+    if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+    if not source: return f"{profile} (version {sourceversion()})", compute(first, last, profile, workers)
+    if source.startswith("shm:"):
+        from bulkbuild import BulkCalendar # Only needed for shared memory blocks.
+        calendar = BulkCalendar.attach(source[4:])
+        try:
+            if not (calendar.first <= first and last <= calendar.last and calendar.complete and profile in calendar.profiles):
+                raise ValueError(f"The shared memory block {source[4:]!r} does not hold a complete build of {profile} for the years {first} to {last}")
+            begin = rd(first, 1, 1) - calendar.start
+            end = rd(last + 1, 1, 1) - calendar.start
+            arrays = {field: getattr(calendar, field)[calendar.rows[profile], begin:end].copy() for field in FIELDS}
+        finally:
+            calendar.close()
+        return f"{profile} (shared memory {source[4:]})", arrays
+    with np.load(source) as file:
+        saved, (savedfirst, savedlast) = str(file["profile"]), (int(year) for year in file["years"])
+        if saved != profile: raise ValueError(f"The snapshot {source!r} holds {saved}, not {profile}")
+        if not (savedfirst <= first and last <= savedlast): raise ValueError(f"The snapshot {source!r} holds the years {savedfirst} to {savedlast}, not {first} to {last}")
+        begin = rd(first, 1, 1) - rd(savedfirst, 1, 1)
+        end = rd(last + 1, 1, 1) - rd(savedfirst, 1, 1)
+        return f"{profile} (version {file['version']}, {source})", {field: file[field][begin:end] for field in FIELDS}
+
+def diff(first, last, left, right, fields = None, workers = None) -> dict:
+    """
+    This function finds the days of a range of years whose daily calendar differs between two sides (see `load`).
+
+    Args:
+        first (int): The first calendar year (from 1).
+        last (int): The last calendar year (included, up to 9998).
+        left, right (str): The sides, e.g. "gregorian" and "julian", or "gregorian@before.npz" and "gregorian".
+        fields (list of str): The fields compared, see `store.FIELDS`. Default is all fields.
+        workers (int): The number of worker processes, when a side is computed. Default is the number of CPUs.
+
+    Returns:
+        dict: "left", "right": the descriptions of the sides, "numbers": the Rata Die of the days that differ, and for every field compared: (the values of the left side, the values of the right side) of those days.
+    """
+    fields = list(FIELDS) if fields is None else list(fields)
+    leftname, leftarrays = load(left, first, last, workers)
+    rightname, rightarrays = load(right, first, last, workers)
+    changed = np.zeros(len(leftarrays[fields[0]]), dtype = bool)
+    for field in fields: changed |= leftarrays[field] != rightarrays[field]
+    indexes = np.flatnonzero(changed)
+    result = {"left": leftname, "right": rightname, "numbers": rd(first, 1, 1) + indexes}
+    for field in fields: result[field] = (leftarrays[field][indexes], rightarrays[field][indexes])
+    return result
+
+def runs(result) -> list:
+    """
+    This function merges the changes of the result of `diff` into runs of consecutive days with the same change of a field.
+
+    Returns:
+        list: (first Rata Die, last Rata Die, field, left value, right value) of every run, in chronological order.
+    """
+    rows = []
+    numbers = result["numbers"]
+    for field in FIELDS:
+        if field not in result: continue
+        before, after = result[field]
+        changed = np.flatnonzero(before != after)
+        if not len(changed): continue
+        # A run starts where the day is not the next day of the previous change, or the change is not the same.
+        start = np.ones(len(changed), dtype = bool)
+        start[1:] = (np.diff(numbers[changed]) != 1) | (before[changed][1:] != before[changed][:-1]) | (after[changed][1:] != after[changed][:-1])
+        starts = np.flatnonzero(start)
+        ends = np.append(starts[1:], len(changed)) - 1
+        for begin, end in zip(changed[starts], changed[ends]):
+            rows.append((int(numbers[begin]), int(numbers[end]), field, int(before[begin]), int(after[begin])))
+    return sorted(rows, key = lambda row: (row[0], list(FIELDS).index(row[2])))
+
+def summary(result) -> dict:
+    """
+    This function counts the days that differ in the result of `diff`, in total and per field, and the calendar years affected.
+    """
+    counts = {field: int(np.count_nonzero(result[field][0] != result[field][1])) for field in FIELDS if field in result}
+    years = np.unique((result["numbers"] - EPOCH).astype("datetime64[D]").astype("datetime64[Y]"))
+    return {"days": len(result["numbers"]), "years": len(years), "fields": counts}
+
+def report(result, limit = 50) -> list:
+    """
+    This function formats the runs of the result of `diff` as lines of a compact report, e.g. "2025-04-20 celebration: Easter Sunday -> -".
+
+    Args:
+        result (dict): The result of `diff`.
+        limit (int): The maximum number of runs listed, or None for all. Default is 50.
+    """
+    counts = summary(result)
+    lines = [f"--- {result['left']}", f"+++ {result['right']}", f"{counts['days']} days differ in {counts['years']} years" + "".join(f", {field}: {count}" for field, count in counts["fields"].items() if count)]
+    rows = runs(result)
+    for begin, end, field, before, after in rows[:limit]:
+        days = todate(begin).isoformat() + (f"..{todate(end).isoformat()}" if end != begin else "")
+        lines.append(f"{days} {field}: {FORMATS[field](before)} -> {FORMATS[field](after)}")
+    if limit is not None and len(rows) > limit: lines.append(f"... {len(rows) - limit} more runs")
+    return lines
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Compare the daily calendar of two configurations, or save a snapshot to compare later.")
+    parser.add_argument("command", choices = ["compare", "snapshot"], help = "compare: report the days that differ between two sides, snapshot: save the calendar of a profile")
+    parser.add_argument("sides", nargs = "+", help = "compare: the left and right sides, 'profile', 'profile@snapshot.npz' or 'profile@shm:name', snapshot: the profile")
+    parser.add_argument("--years", type = yearrange, default = yearrange("1-9998"), help = "year range (default: 1-9998)")
+    parser.add_argument("--fields", default = "all", help = f"comma-separated fields or 'all' (available: {', '.join(FIELDS)})")
+    parser.add_argument("--limit", type = int, default = 50, help = "maximum number of runs listed, 0 for all (default: 50)")
+    parser.add_argument("--output", default = "calendar.npz", help = "snapshot file (default: calendar.npz)")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+    first, last = args.years[0], args.years[-1]
+    if args.command == "snapshot":
+        snapshot(args.output, first, last, args.sides[0], args.workers)
+        print(f"{args.sides[0]} {first}-{last} (version {sourceversion()}) saved to {args.output}")
+    else:
+        if len(args.sides) != 2: parser.error("compare needs two sides")
+        result = diff(first, last, *args.sides, fields = None if args.fields == "all" else args.fields.split(","), workers = args.workers)
+        print("\n".join(report(result, args.limit or None)))
+        sys.exit(1 if len(result["numbers"]) else 0)
@@ -0,0 +1,168 @@
+"""
+A Python module to count how often Easter falls on each date, and how often the Western (Gregorian) and Eastern (Julian) Easter coincide, over whole computus cycles.
+
+The computus of `easter.py` (the paschal full moon of Clavius's tables of `epact.py`, and the weekday of Gauss) is run on NumPy arrays of years, so any range of years can be counted (`easterdate` is limited to the years 1 to 9999 by the `datetime` module, the arrays are not), chunk by chunk in a process pool:
+- The Gregorian dates of Easter repeat every 5,700,000 years (the 19-year lunar cycle, the 400-year solar cycle and the 30-epact correction cycle of 10,000 years combined).
+- The Julian dates of Easter repeat every 532 years (19 × 28).
+- The Julian dates drift by one day in the Gregorian calendar every century not divisible by 400, so the coincidences of Western and Eastern Easter are counted over a range of years, not a cycle.
+
+Usage:
+    python easterstats.py --coincidences 1583-9999
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from liturgicalyear import yearrange
+from epact import PASCHALFULLMOON, epactrows
+
+REFORMYEAR = 1582 # The last year of Julian Easter when calendar is True, as in `easter`.
+GREGORIANCYCLE = 5700000
+JULIANCYCLE = 532
+DATES = 35 # Easter falls from 22 March to 25 April.
+MONTHS = {3: "March", 4: "April"}
+PASCHALDAYS = np.array(PASCHALFULLMOON, dtype = np.int64) - 79 # Row of `epact.AGES` -> days from 21 March (day 79 of a common year) to the paschal full moon.
+
+def easteroffsets(years, calendar = True) -> np.ndarray:
+    """
+    This function is the batch variant of `easter.easter` for an array of years, with the same Gaussian computus.
+
+    Args:
+        years (array of int): The years, any integers.
+        calendar (bool): Whether to use the Gregorian computus. Default is True (Gregorian computus, but Julian Easter if before 1583).
+
+    Returns:
+        np.ndarray: The nominal date of Easter of every year, in days after 22 March (0 to 34).
+    """
+    years = np.asarray(years, dtype = np.int64)
+    gregorian = years > REFORMYEAR if calendar else np.zeros(years.shape, dtype = bool)
+    b = years % 4
+    c = years % 7
+    k = years // 100
+    q = k // 4
+    n = np.where(gregorian, (4 + k - q) % 7, 6)
+    d = PASCHALDAYS[epactrows(years, gregorian)]
+    e = (2 * b + 4 * c + 6 * d + n) % 7
+    return d + e
+
+def easterdays(years, calendar = True) -> np.ndarray:
+    """
+    This function returns the date of Easter converted to the Gregorian calendar as in `easter.easterdate`, in days after 22 March (Gregorian) of every year.
+    """
+    years = np.asarray(years, dtype = np.int64)
+    shift = years // 100 - years // 400 - 2 # Gregorian-Julian day difference correction.
+    if calendar: shift = np.where(years > REFORMYEAR, 0, shift)
+    return easteroffsets(years, calendar) + shift
+
+def easterdates(years, calendar = True) -> np.ndarray:
+    """
+    This function is the batch variant of `easter.easterdate` for an array of years, returning datetime64[D] dates (in the proleptic Gregorian calendar) without the limit of the years 1 to 9999.
+    """
+    years = np.asarray(years, dtype = np.int64)
+    march = (years - 1970).astype("datetime64[Y]").astype("datetime64[M]") + 2 # 1 March of every year.
+    return march.astype("datetime64[D]") + 21 + easterdays(years, calendar)
+
+def _chunks(first, last, chunksize) -> list:
+    """
+    This function splits the years from `first` to `last` (inclusive) into (first, last) chunks.
+    """
+    return [(start, min(start + chunksize - 1, last)) for start in range(first, last + 1, chunksize)]
+
+def _histogramchunk(task) -> np.ndarray:
+    """
+    This function counts the dates of Easter of a chunk of years in a worker process.
+    """
+    first, last, calendar = task
+    return np.bincount(easteroffsets(np.arange(first, last + 1), calendar), minlength = DATES)
+
+def _coincidencechunk(task) -> dict:
+    """
+    This function counts the weeks between Western and Eastern Easter of a chunk of years in a worker process.
+    """
+    first, last = task
+    years = np.arange(first, last + 1)
+    weeks, counts = np.unique((easterdays(years, False) - easterdays(years, True)) // 7, return_counts = True)
+    return dict(zip(weeks.tolist(), counts.tolist()))
+
+def histogram(first, last, calendar = True, workers = None, chunksize = 250000) -> np.ndarray:
+    """
+    This function counts how often Easter falls on each date in a range of years.
+
+    Args:
+        first (int): The first year.
+        last (int): The last year.
+        calendar (bool): Whether to use the Gregorian computus. Default is True (Gregorian computus, but Julian Easter if before 1583).
+        workers (int): The number of worker processes. Default is the number of CPUs.
+        chunksize (int): The number of years counted by one task. Default is 250000.
+
+    Returns:
+        np.ndarray: The number of years of every nominal date of Easter, index 0 is 22 March and index 34 is 25 April.
+    """
+    tasks = [(start, stop, calendar) for start, stop in _chunks(first, last, chunksize)]
+    if len(tasks) == 1: return _histogramchunk(tasks[0])
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        return sum(executor.map(_histogramchunk, tasks))
+
+def gregoriancycle(workers = None, chunksize = 250000) -> np.ndarray:
+    """
+    This function counts the Gregorian dates of Easter over the whole 5,700,000-year cycle, see `histogram`.
+    """
+    return histogram(REFORMYEAR + 1, REFORMYEAR + GREGORIANCYCLE, True, workers, chunksize)
+
+def juliancycle() -> np.ndarray:
+    """
+    This function counts the Julian dates of Easter (not converted to the Gregorian calendar) over the whole 532-year cycle, see `histogram`.
+    """
+    return np.bincount(easteroffsets(np.arange(JULIANCYCLE), False), minlength = DATES)
+
+def coincidences(first, last, workers = None, chunksize = 250000) -> dict:
+    """
+    This function counts how often Western (Gregorian) and Eastern (Julian) Easter coincide in a range of years, and how many weeks apart they are otherwise.
+
+    Args:
+        first (int): The first year.
+        last (int): The last year.
+        workers (int): The number of worker processes. Default is the number of CPUs.
+        chunksize (int): The number of years counted by one task. Default is 250000.
+
+    Returns:
+        dict: years (the number of years), same (the number of years both Easters coincide), frequency (same / years) and weeks (the number of years by weeks from Western to Eastern Easter).
+    """
+    tasks = _chunks(first, last, chunksize)
+    if len(tasks) == 1: results = [_coincidencechunk(tasks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+            results = list(executor.map(_coincidencechunk, tasks))
+    weeks = {}
+    for result in results:
+        for week, count in result.items(): weeks[week] = weeks.get(week, 0) + count
+    years = last - first + 1
+    return {"years": years, "same": weeks.get(0, 0), "frequency": weeks.get(0, 0) / years, "weeks": dict(sorted(weeks.items()))}
+
+def table(counts) -> list:
+    """
+    This function lists a histogram of the dates of Easter as (date, count, frequency) rows, e.g. ("April 19", 220400, 0.0386667).
+    """
+    total = int(counts.sum())
+    rows = []
+    for offset, count in enumerate(counts.tolist()):
+        day, month = (22 + offset, 3) if offset < 10 else (offset - 9, 4)
+        rows.append((f"{MONTHS[month]} {day}", count, count / total))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Count the dates of Easter over the computus cycles, and the coincidences of Western and Eastern Easter.")
+    parser.add_argument("--coincidences", type = yearrange, default = yearrange("1583-9999"), help = "year range of the coincidences (default: 1583-9999)")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    gregorian = gregoriancycle(args.workers)
+    julian = juliancycle()
+    print(f"{'Date':<10}{'Gregorian (5,700,000 years)':>30}{'Julian (532 years)':>24}")
+    for (name, count, frequency), (_, juliancount, julianfrequency) in zip(table(gregorian), table(julian)):
+        print(f"{name:<10}{count:>20} {frequency:>8.4%}{juliancount:>14} {julianfrequency:>8.4%}")
+    result = coincidences(args.coincidences.start, args.coincidences.stop - 1, args.workers)
+    print(f"Western and Eastern Easter coincide in {result['same']} of {result['years']} years ({result['frequency']:.2%}) from {args.coincidences.start} to {args.coincidences.stop - 1}.")
+    print("Weeks from Western to Eastern Easter: " + ", ".join(f"{week}: {count}" for week, count in result["weeks"].items()))
+    print(f"{time.perf_counter() - start:.2f} seconds")
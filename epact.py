@@ -0,0 +1,216 @@
+"""
+A Python module to find the epact of any year, and the age of the ecclesiastical moon of any day, by table lookup (Clavius's tables of the Gregorian calendar).
+
+The epact (the age of the moon on 31 December of the previous year) only depends on the golden number and on the "index" of the century, so Clavius's expanded table of epacts (30 rows of 19 epacts) is precomputed once:
+- The index of a Gregorian century is the sum of its solar equation (one day less for every century year that is not a leap year) and its lunar equation (one day more eight times in 2500 years), precomputed for the years 0 to 9999 and computed by the same formula beyond. It is named by Clavius's index letters: D for 1583 to 1699, C for 1700 to 1899, B for 1900 to 2199, etc.
+- The Julian epacts (years up to 1582, as in `YearInfo`) are the row of index P.
+- The black epact 25 (epact 25 with a golden number above 11) has its own row of the lunar table (BLACK25).
+- So has the epact 19 with the golden number 19 (NINETEEN): the Arabic 19 written with xx on 31 December moves the last new moon of that year from 1 January of the next year to 31 December.
+The age of the moon of every day of a common year is precomputed once for every epact (`AGES`), from the lunar calendar of the Kalendarium: the epacts are written backwards from * on 1 January, with lunations of 30 (full) and 29 (hollow) days alternating, where xxv and xxiv share a day in the hollow lunations and the black epact 25 is written with xxvi there (with xxv in the full ones). The bissextile day (25 February of a leap year) takes the moon of 24 February (`LEAPINDEX`).
+As in `weekday.py`, years after 1582 are Gregorian and years up to 1582 are Julian unless `gregorian` is given, and the batch variants take NumPy arrays of years.
+"""
+
+try:
+    import numpy as np
+except ImportError: # Only the batch functions need NumPy.
+    np = None
+from weekday import REFORMYEAR, MONTHSTART, isleap
+
+JULIANINDEX = 7 # The index of the Julian epacts: (11 * golden number - 3) % 30.
+BLACK25 = 30 # Row of AGES of the black epact 25.
+NINETEEN = 31 # Row of AGES of the epact 19 with the golden number 19.
+# Clavius's index letters, by index 7, 6, ..., 0, 29, ..., 8 (D is the index 0 of the centuries 1500 and 1600).
+INDEXLETTERS = ["P", "N", "M", "H", "G", "F", "E", "D", "C", "B", "A", "u", "t", "s", "r", "q", "p", "n", "m", "l", "k", "i", "h", "g", "f", "e", "d", "c", "b", "a"]
+# The letter of the Roman Martyrology of every epact (0 to 29).
+MARTYROLOGYLETTERS = ["P", "a", "b", "c", "d", "e", "f", "g", "h", "i", "k", "l", "m", "n", "p", "q", "r", "s", "t", "u", "A", "B", "C", "D", "E", "F", "G", "H", "M", "N"]
+LEAPINDEX = list(range(55)) + list(range(54, 365)) # Day of a leap year (0 = 1 January) -> day of a common year.
+
+def _centuryindex(century) -> int:
+    """
+    This function calculates the index of a Gregorian century (year // 100): its lunar equation minus its solar equation, counted from the century 1500.
+    """
+    solar = (3 * (century + 1)) // 4 - 12
+    lunar = (8 * (century + 1) + 5) // 25 - 5
+    return (lunar - solar) % 30
+
+def _ages() -> list:
+    """
+    This function lists the age of the moon (1 to 30) of every day of a common year for every epact (0 to 29, BLACK25 for the black epact 25 and NINETEEN for the epact 19 with the golden number 19).
+    """
+    labels = [] # The epacts written on every day of the Kalendarium.
+    label = 0
+    lunation = 0 # Number of the lunation from 1 January (even: full, odd: hollow).
+    start = 0 # First day of the lunation.
+    for day in range(365):
+        if day > start and label == 0: # Back to *, a new lunation.
+            lunation += 1
+            start = day
+        hollow = lunation % 2 == 1
+        if hollow and label == 25:
+            labels.append({25, 24})
+            label = 23
+        else:
+            labels.append({label})
+            label = (label - 1) % 30
+        if hollow and 26 in labels[-1]: labels[-1].add(BLACK25)
+        elif not hollow and 25 in labels[-1]: labels[-1].add(BLACK25)
+    ages = []
+    for epact in range(31):
+        row = []
+        age = 25 if epact == BLACK25 else epact # The age on 31 December of the previous year.
+        for day in range(365):
+            age = 1 if epact in labels[day] else age + 1
+            row.append(age)
+        ages.append(row)
+    ages.append(ages[19][:364] + [1]) # NINETEEN: the new moon of the Arabic 19 on 31 December.
+    return ages
+
+CENTURYINDEX = [_centuryindex(century) for century in range(100)] # Years 0 to 9999.
+CLAVIUS = [[(11 * golden - 10 + index) % 30 for golden in range(1, 20)] for index in range(30)] # Index -> epact of every golden number.
+AGES = _ages()
+# Row of AGES -> the paschal full moon, the first 14th moon from 21 March (day 79 of a common year), as a day of a common year.
+PASCHALFULLMOON = [next(day for day in range(79, 365) if row[day] == 14) for row in AGES]
+
+def _gregorian(year, gregorian) -> bool:
+    """
+    This function decides whether a year is counted in the Gregorian calendar.
+    """
+    return year > REFORMYEAR if gregorian is None else gregorian
+
+def goldennumber(year) -> int:
+    """
+    This function returns the golden number of a given year (1 to 19), its place in the 19-year lunar cycle.
+    """
+    return year % 19 + 1
+
+def centuryindex(year, gregorian = None) -> int:
+    """
+    This function returns the index of the row of Clavius's table of epacts of a given year (JULIANINDEX for the Julian calendar).
+
+    Args:
+        year (int): The year, any integer.
+        gregorian (bool): Whether the year is counted in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    if not _gregorian(year, gregorian): return JULIANINDEX
+    century = year // 100
+    return CENTURYINDEX[century] if 0 <= century < 100 else _centuryindex(century)
+
+def indexletter(year, gregorian = None) -> str:
+    """
+    This function returns Clavius's index letter of a given year, e.g. "B" for 1900 to 2199.
+    """
+    return INDEXLETTERS[(JULIANINDEX - centuryindex(year, gregorian)) % 30]
+
+def epact(year, gregorian = None) -> int:
+    """
+    This function returns the epact of a given year (0 to 29), the age of the moon on 31 December of the previous year.
+
+    Args:
+        year (int): The year, any integer.
+        gregorian (bool): Whether the year is counted in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    return CLAVIUS[centuryindex(year, gregorian)][year % 19]
+
+def isblack25(year, gregorian = None) -> bool:
+    """
+    This function checks if the epact of a given year is the black epact 25 (epact 25 with a golden number above 11).
+    """
+    return epact(year, gregorian) == 25 and goldennumber(year) > 11
+
+def epactrow(year, gregorian = None) -> int:
+    """
+    This function returns the row of `AGES` of a given year: its epact, BLACK25 for the black epact 25, or NINETEEN for the epact 19 with the golden number 19.
+    """
+    value = epact(year, gregorian)
+    if value == 25 and goldennumber(year) > 11: return BLACK25
+    if value == 19 and goldennumber(year) == 19: return NINETEEN
+    return value
+
+def martyrologyletter(year, gregorian = None) -> str:
+    """
+    This function returns the letter of the Roman Martyrology of a given year, the letter of its epact.
+    """
+    return MARTYROLOGYLETTERS[epact(year, gregorian)]
+
+def moonage(year, month, day, gregorian = None) -> int:
+    """
+    This function returns the age of the ecclesiastical moon (1 to 30) on a given date.
+
+    Args:
+        year (int): The year of the date.
+        month (int): The month of the date (1 to 12).
+        day (int): The day of the month.
+        gregorian (bool): Whether the date is in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    gregorian = _gregorian(year, gregorian)
+    leap = isleap(year, gregorian)
+    index = MONTHSTART[leap][month] + day - 1
+    return AGES[epactrow(year, gregorian)][LEAPINDEX[index] if leap else index]
+
+def paschalfullmoon(year, gregorian = None) -> tuple:
+    """
+    This function returns the date of the paschal full moon of a given year, as (month, day).
+    """
+    index = PASCHALFULLMOON[epactrow(year, gregorian)]
+    return (3, index - 58) if index < 90 else (4, index - 89)
+
+def _batch(years, gregorian) -> tuple:
+    """
+    This function returns the years as an int64 array and the mask of the years counted in the Gregorian calendar (gregorian may be a bool or an array of bools).
+    """
+    years = np.asarray(years, dtype = np.int64)
+    if gregorian is None: return years, years > REFORMYEAR
+    return years, np.broadcast_to(np.asarray(gregorian, dtype = bool), years.shape)
+
+if np is not None:
+    _CLAVIUS = np.array(CLAVIUS, dtype = np.int8)
+    _AGES = np.array(AGES, dtype = np.int8)
+    _LEAPINDEX = np.array(LEAPINDEX, dtype = np.int16)
+    _MONTHSTART = np.array(MONTHSTART, dtype = np.int16)
+    _MARTYROLOGYLETTERS = np.array(MARTYROLOGYLETTERS)
+
+def centuryindexes(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `centuryindex` for an array of years.
+    """
+    years, mask = _batch(years, gregorian)
+    century = years // 100 + 1
+    index = ((8 * century + 5) // 25 - 5 - (3 * century) // 4 + 12) % 30
+    return np.where(mask, index, JULIANINDEX)
+
+def epacts(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `epact` for an array of years.
+    """
+    years = np.asarray(years, dtype = np.int64)
+    return _CLAVIUS[centuryindexes(years, gregorian), years % 19]
+
+def epactrows(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `epactrow` for an array of years.
+    """
+    years = np.asarray(years, dtype = np.int64)
+    values = epacts(years, gregorian)
+    values = np.where((values == 19) & (years % 19 == 18), NINETEEN, values)
+    return np.where((values == 25) & (years % 19 >= 11), BLACK25, values)
+
+def martyrologyletters(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `martyrologyletter` for an array of years, returning an array of strings.
+    """
+    return _MARTYROLOGYLETTERS[epacts(years, gregorian)]
+
+def moonages(years, months, days, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `moonage` for arrays of years, months and days (broadcast together).
+    """
+    years, mask = _batch(years, gregorian)
+    leap = np.where(mask, (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0)), years % 4 == 0)
+    index = _MONTHSTART[leap.astype(np.int8), np.asarray(months)] + np.asarray(days) - 1
+    index = np.where(leap, _LEAPINDEX[index], index)
+    return _AGES[epactrows(years, mask), index]
+
+if __name__ == "__main__":
+    # Testing program, printing the epact, the index letter and the moon of Christmas of a few years.
+    for year in [1582, 1583, 1700, 1900, 2011, 2025, 2200, 12345]:
+        print(f"{year}: golden number {goldennumber(year)}, index {indexletter(year)}, epact {epact(year)}{' (black)' if isblack25(year) else ''}, martyrology letter {martyrologyletter(year)}, paschal full moon {paschalfullmoon(year)}, moon of Christmas {moonage(year, 12, 25, year >= REFORMYEAR)}")
@@ -0,0 +1,162 @@
+"""
+A Python module to export the Python-computed calendar, year info and proclamations as compact JSON files, one file per century, for `CALENDAR.html` to fetch lazily.
+
+Every repeated string (celebration names, seasons, year info values, proclamation lines) is stored once in the string table of its century file and referred to by index; proclamation texts are lists of line indices, deduplicated the same way.
+A celebration is stored once per year with a bitmask of the profiles in which it falls on that date, instead of once per profile.
+
+Layout of `century-<NN>.json` (years NN00 to NN99):
+    {
+        "century": NN, "first": first year, "last": last year,
+        "profiles": [profile names, bit i of a mask is profiles[i]],
+        "infokeys": [year info labels],
+        "strings": [string table],
+        "texts": [[string indices of the lines of a text], ...],
+        "years": [
+            {
+                "info": [string index of every year info value],
+                "events": [[day of the year (1 = 1 January), name index, season index, profile mask], ...],
+                "noveritis": [text index per profile], "kalenda": text index
+            }, ... one per year from first to last
+        ],
+        "exsultet": text index
+    }
+`index.json` lists the century files and their year ranges.
+
+Usage:
+    python export.py --years 2-9998 --out data
+"""
+
+import argparse
+import json
+import os
+from YearInfo import YearInfo
+from Noveritis import Noveritis
+from Kalenda import Kalenda
+from Exsultet import ExsultetText
+from liturgicalyear import LiturgicalYear, PROFILES, yearrange
+
+MINYEAR = 2 # Christmastide of year 1 needs year 0, which the `datetime` module does not support.
+MAXYEAR = 9998 # Advent of year 9999 is of liturgical year 10000.
+
+class StringTable:
+    """
+    This class deduplicates the strings and texts of a century file.
+    """
+    def __init__(self):
+        """
+        This method initializes the StringTable class.
+        """
+        self.strings = []
+        self.stringindex = {}
+        self.texts = []
+        self.textindex = {}
+    def string(self, value) -> int:
+        """
+        This method returns the index of a string, adding it to the table on first use.
+        """
+        index = self.stringindex.get(value)
+        if index is None:
+            index = self.stringindex[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+    def text(self, value) -> int:
+        """
+        This method returns the index of a multi-line text, stored as the indices of its lines.
+        """
+        lines = tuple(self.string(line) for line in value.split("\n"))
+        index = self.textindex.get(lines)
+        if index is None:
+            index = self.textindex[lines] = len(self.texts)
+            self.texts.append(list(lines))
+        return index
+
+def exportyear(year, table) -> dict:
+    """
+    This function exports the data of one year into the string table of its century.
+
+    Args:
+        year (int): The calendar year to export.
+        table (StringTable): The string table of the century.
+
+    Returns:
+        dict: The year entry of the century file.
+    """
+    events = {} # (day of the year, name, season) -> profile mask
+    noveritis = []
+    for bit, flags in enumerate(PROFILES.values()):
+        for day, name, season in LiturgicalYear(year, **flags).celebrations:
+            key = (day.timetuple().tm_yday, table.string(name), table.string(season))
+            events[key] = events.get(key, 0) | (1 << bit)
+        noveritis.append(table.text(Noveritis(year, flags["calendar"], flags["ascensionThursday"], flags["corpusChristionThursday"]).text))
+    return {
+        "info": [table.string(value) for value in YearInfo(year).asdict().values()],
+        "events": sorted([*key, mask] for key, mask in events.items()),
+        "noveritis": noveritis,
+        "kalenda": table.text(Kalenda(year).text),
+    }
+
+def exportcentury(century, first = MINYEAR, last = MAXYEAR) -> dict:
+    """
+    This function exports the data of one century (years NN00 to NN99, clipped to `first` and `last`).
+
+    Args:
+        century (int): The century number NN.
+        first (int): The first year to export. Default is MINYEAR.
+        last (int): The last year to export. Default is MAXYEAR.
+
+    Returns:
+        dict: The century file, see the module docstring.
+    """
+    first, last = max(first, century * 100), min(last, century * 100 + 99)
+    table = StringTable()
+    years = [exportyear(year, table) for year in range(first, last + 1)]
+    exsultet = table.text(ExsultetText())
+    return {
+        "century": century,
+        "first": first,
+        "last": last,
+        "profiles": list(PROFILES),
+        "infokeys": list(YearInfo(first).asdict()),
+        "strings": table.strings,
+        "texts": table.texts,
+        "years": years,
+        "exsultet": exsultet,
+    }
+
+def export(years, outdir = "data") -> list:
+    """
+    This function writes the century files covering the given years, and the index of all century files in the output directory.
+
+    Args:
+        years (range): The calendar years to export, within MINYEAR to MAXYEAR.
+        outdir (str): The output directory. Default is "data".
+
+    Returns:
+        list: The paths of the written century files.
+    """
+    first, last = max(min(years), MINYEAR), min(max(years), MAXYEAR)
+    os.makedirs(outdir, exist_ok = True)
+    indexpath = os.path.join(outdir, "index.json")
+    index = {}
+    if os.path.exists(indexpath):
+        with open(indexpath, encoding = "utf-8") as file:
+            index = {entry["file"]: entry for entry in json.load(file)["chunks"]}
+    paths = []
+    for century in range(first // 100, last // 100 + 1):
+        data = exportcentury(century, first, last)
+        name = f"century-{century:02d}.json"
+        with open(os.path.join(outdir, name), "w", encoding = "utf-8") as file:
+            json.dump(data, file, ensure_ascii = False, separators = (",", ":"))
+        index[name] = {"file": name, "first": data["first"], "last": data["last"]}
+        paths.append(os.path.join(outdir, name))
+    with open(indexpath, "w", encoding = "utf-8") as file:
+        json.dump({"chunks": sorted(index.values(), key = lambda entry: entry["first"])}, file, ensure_ascii = False, indent = 1)
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Export century-chunked JSON data for CALENDAR.html.")
+    parser.add_argument("--years", type = yearrange, default = yearrange(f"{MINYEAR}-{MAXYEAR}"), help = f"year or year range (default: {MINYEAR}-{MAXYEAR})")
+    parser.add_argument("--out", default = "data", help = "output directory (default: data)")
+    args = parser.parse_args()
+    for path in export(args.years, args.out):
+        print(f"{path}: {os.path.getsize(path)} bytes")
@@ -0,0 +1,152 @@
+"""
+A Python module to list the holy days of obligation of a region, and to build NumPy business-day calendars and pandas holiday calendars skipping them, for scheduling over many years.
+
+A region (see `REGIONS`) is a set of holy days of obligation (see `HOLYDAYS`) with the transfer flags of its bishops' conference (as in `liturgicalyear.PROFILES`), e.g. in the United States Epiphany and Ascension are transferred to Sunday, and the obligation of some holy days is abrogated when they fall on a Saturday or a Monday.
+The obligation of Saint Joseph and the Immaculate Conception stays on their fixed dates (19 March, 8 December) when the liturgy moves them (Holy Week, a Sunday), as the transfer of a celebration does not move the obligation.
+The holy days of a year range are computed once with the day-number functions of the season modules into one sorted `datetime64` array, and every business-day calendar of that range is built from it, so business-day arithmetic over decades (`np.busday_offset`, `np.busday_count`, pandas `CustomBusinessDay`) runs in vectorized NumPy.
+
+Usage:
+    calendar = busdaycalendar(2000, 2050, "usa")
+    np.busday_offset(dates, 10, roll = "forward", busdaycal = calendar)
+"""
+
+from functools import lru_cache
+import numpy as np
+try:
+    import pandas as pd
+    from pandas.tseries.holiday import AbstractHolidayCalendar
+except ImportError: # Only the pandas calendars need pandas.
+    pd = None
+from daynumber import rd, weekday
+from lent import eastertiderd, solemnitiesrd
+from advent import christmastiderd
+from classify import EPOCH
+
+# Key -> (name, as in `LiturgicalYear.celebrations`, function of the calendar year and the transfer flags returning the Rata Die).
+HOLYDAYS = {
+    "newyear": ("Solemnity of Mary, Mother of God", lambda year, flags: christmastiderd(year)["NewYear"]),
+    "epiphany": ("The Epiphany of the Lord", lambda year, flags: christmastiderd(year, flags["epiphany_on_jan6th"])["Epiphany"]),
+    "joseph": ("Saint Joseph, Spouse of the Blessed Virgin Mary", lambda year, flags: rd(year, 3, 19)), # Not `holidaysrd`, the obligation is not transferred.
+    "ascension": ("Ascension of the Lord", lambda year, flags: eastertiderd(year, flags["calendar"], flags["ascensionThursday"])["Ascension"]),
+    "corpus": ("Corpus Christi", lambda year, flags: solemnitiesrd(year, flags["calendar"], flags["corpusChristionThursday"])["CorpusChristi"]),
+    "peterpaul": ("Saints Peter and Paul, Apostles", lambda year, flags: rd(year, 6, 29)),
+    "assumption": ("The Assumption of the Blessed Virgin Mary", lambda year, flags: rd(year, 8, 15)),
+    "allsaints": ("All Saints", lambda year, flags: rd(year, 11, 1)),
+    "immaculate": ("Immaculate Conception", lambda year, flags: rd(year, 12, 8)), # Not `immaculaterd`, the obligation is not transferred.
+    "christmas": ("The Nativity of the Lord (Christmas)", lambda year, flags: christmastiderd(year + 1)["ChristmasDay"]),
+}
+
+# Region -> (description, transfer flags, holy days of obligation, holy days whose obligation is abrogated on a Saturday or a Monday).
+REGIONS = {
+    "universal": ("Universal law (canon 1246)", {"calendar": True, "ascensionThursday": True, "corpusChristionThursday": True, "epiphany_on_jan6th": True}, list(HOLYDAYS), []),
+    "usa": ("United States", {"calendar": True, "ascensionThursday": False, "corpusChristionThursday": False, "epiphany_on_jan6th": False}, ["newyear", "ascension", "assumption", "allsaints", "immaculate", "christmas"], ["newyear", "assumption", "allsaints"]),
+    "canada": ("Canada", {"calendar": True, "ascensionThursday": False, "corpusChristionThursday": False, "epiphany_on_jan6th": False}, ["newyear", "christmas"], []),
+}
+
+WEEKMASK = "1111100" # Monday to Friday, as in `np.busdaycalendar`.
+
+def holydayrds(year, region = "universal") -> list:
+    """
+    This function lists the holy days of obligation of a calendar year in a region.
+
+    Args:
+        year (int): The calendar year, any integer.
+        region (str): The region, see `REGIONS`. Default is "universal".
+
+    Returns:
+        list: (Rata Die, name) of every holy day of obligation, in chronological order.
+    """
+    if region not in REGIONS: raise ValueError(f"Unknown region {region!r}, expected one of {', '.join(REGIONS)}")
+    description, flags, keys, abrogated = REGIONS[region]
+    days = []
+    for key in keys:
+        name, function = HOLYDAYS[key]
+        number = function(year, flags)
+        if key in abrogated and weekday(number) in [0, 5]: continue # Monday or Saturday
+        days.append((number, name))
+    return sorted(days)
+
+@lru_cache(maxsize = 64)
+def holydayarrays(first, last, region = "universal") -> tuple:
+    """
+    This function precomputes the holy days of obligation of a range of calendar years in a region, once per process.
+
+    Args:
+        first (int): The first calendar year.
+        last (int): The last calendar year (included).
+        region (str): The region, see `REGIONS`. Default is "universal".
+
+    Returns:
+        tuple: (the read-only sorted `datetime64[D]` array of the holy days, the read-only array of their names).
+    """
+    rows = [row for year in range(first, last + 1) for row in holydayrds(year, region)]
+    dates = (np.array([number for number, name in rows], dtype = np.int64) - EPOCH).astype("datetime64[D]")
+    names = np.array([name for number, name in rows], dtype = object)
+    dates.setflags(write = False)
+    names.setflags(write = False)
+    return dates, names
+
+def holydays(first, last, region = "universal") -> np.ndarray:
+    """
+    This function returns the sorted `datetime64[D]` array of the holy days of obligation of a range of calendar years in a region, see `holydayarrays`.
+    """
+    return holydayarrays(first, last, region)[0]
+
+def busdaycalendar(first, last, region = "universal", weekmask = WEEKMASK) -> np.busdaycalendar:
+    """
+    This function builds a NumPy business-day calendar skipping the weekend and the holy days of obligation of a range of calendar years, for `np.busday_offset`, `np.busday_count` and `np.is_busday`.
+
+    Args:
+        first (int): The first calendar year.
+        last (int): The last calendar year (included).
+        region (str): The region, see `REGIONS`. Default is "universal".
+        weekmask (str): The business days of the week, from Monday. Default is "1111100" (Monday to Friday).
+    """
+    return np.busdaycalendar(weekmask = weekmask, holidays = holydays(first, last, region))
+
+if pd is not None:
+    class HolyDayCalendar(AbstractHolidayCalendar):
+        """
+        This class is a pandas holiday calendar of the holy days of obligation of a region, usable wherever an `AbstractHolidayCalendar` is (e.g. `pd.offsets.CustomBusinessDay(calendar = HolyDayCalendar("usa"))`).
+        Note: `CustomBusinessDay` calls `holidays()` without dates, so it only skips the holy days from `start_date` to `end_date`. They cover the whole range of `pd.Timestamp` (1678 to 2261) instead of the 1970 to 2200 of `AbstractHolidayCalendar`, so no holy day is missed in business-day arithmetic.
+        """
+        start_date = pd.Timestamp("1678-01-01")
+        end_date = pd.Timestamp("2261-12-31")
+        def __init__(self, region = "universal"):
+            """
+            This method initializes the HolyDayCalendar class.
+
+            Args:
+                region (str): The region, see `REGIONS`. Default is "universal".
+            """
+            if region not in REGIONS: raise ValueError(f"Unknown region {region!r}, expected one of {', '.join(REGIONS)}")
+            super().__init__(name = region, rules = [])
+            self.region = region
+        def holidays(self, start = None, end = None, return_name = False):
+            """
+            This method returns the holy days of obligation between two dates (by default the `start_date` and `end_date` of the calendar), from the precomputed arrays of their years.
+
+            Returns:
+                pd.DatetimeIndex: The holy days, or a pd.Series of their names indexed by date if return_name is True.
+            """
+            start = pd.Timestamp(self.start_date if start is None else start)
+            end = pd.Timestamp(self.end_date if end is None else end)
+            dates, names = holydayarrays(start.year, end.year, self.region)
+            mask = (dates >= np.datetime64(start.date())) & (dates <= np.datetime64(end.date()))
+            index = pd.DatetimeIndex(dates[mask])
+            return pd.Series(names[mask], index = index) if return_name else index
+
+    def businessday(region = "universal", weekmask = "Mon Tue Wed Thu Fri", n = 1) -> "pd.offsets.CustomBusinessDay":
+        """
+        This function returns a pandas business-day offset skipping the weekend and the holy days of obligation of a region, e.g. `pd.Timestamp("2025-12-24") + businessday("usa")` is 26 December 2025.
+        """
+        return pd.offsets.CustomBusinessDay(n = n, weekmask = weekmask, calendar = HolyDayCalendar(region))
+
+if __name__ == "__main__":
+    # Testing program, printing the holy days of obligation of a given year in every region and counting the business days of the year.
+    year = 2025
+    for region, (description, flags, keys, abrogated) in REGIONS.items():
+        print(f"--- {description} ---")
+        for number, name in holydayrds(year, region):
+            print(f"{np.datetime64(number - EPOCH, 'D')}: {name}")
+        print(f"Business days: {np.busday_count(f'{year}-01-01', f'{year + 1}-01-01', busdaycal = busdaycalendar(year, year, region))}")
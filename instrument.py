@@ -0,0 +1,159 @@
+"""
+A Python module to count the calls and the wall time of the computus functions, the season-class properties, the `YearInfo` fields and the proclamation renderers, for a metrics exporter.
+
+The instrumentation is opt-in: nothing is wrapped until `enable` is called (or the `instrumented` context manager is entered), so it costs nothing when disabled.
+When enabled, every public function and every property and method of every class of the instrumented modules is replaced by a counting wrapper, in its own module and in every module that imported it by name (e.g. `easterdate` in `lent.py`), and `disable` puts the originals back.
+The counters are named "<module>.<function>" or "<module>.<class>.<property>", and the time of a call includes the calls it makes.
+
+Usage:
+    with instrumented():
+        Noveritis(2025).text
+    print(snapshot()["easter.easterdate"]) # {"calls": 5, "seconds": ...}
+"""
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+import easter
+import lent
+import advent
+import ordinarytime
+import YearInfo
+import Kalenda
+import Noveritis
+import Exsultet
+
+MODULES = [easter, lent, advent, ordinarytime, YearInfo, Kalenda, Noveritis, Exsultet]
+
+_counters = {} # name -> [calls, seconds]
+_lock = threading.Lock()
+_patches = [] # (owner, attribute, original), to restore on disable.
+_depth = 0 # Nesting level of `instrumented`.
+
+def _record(name, seconds):
+    """
+    This function adds one call of a given duration to a counter.
+    """
+    with _lock:
+        counter = _counters.get(name)
+        if counter is None: _counters[name] = [1, seconds]
+        else:
+            counter[0] += 1
+            counter[1] += seconds
+
+def _wrap(function, name):
+    """
+    This function returns a wrapper of a function counting its calls and wall time under a given name.
+    """
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - start)
+    wrapper.__instrumented__ = function
+    return wrapper
+
+def _patch(owner, attribute, value):
+    """
+    This function replaces an attribute, remembering the original.
+    """
+    _patches.append((owner, attribute, owner.__dict__[attribute] if isinstance(owner, type) else getattr(owner, attribute)))
+    setattr(owner, attribute, value)
+
+def _targets() -> list:
+    """
+    This function lists the functions and classes defined in the instrumented modules, as (module, name, object).
+    """
+    targets = []
+    for module in MODULES:
+        for name, value in vars(module).items():
+            if name.startswith("_") or getattr(value, "__module__", None) != module.__name__: continue
+            if callable(value): targets.append((module, name, value))
+    return targets
+
+def enable():
+    """
+    This function enables the instrumentation (if it is not enabled yet).
+    """
+    if _patches: return
+    wrappers = {} # id of a function -> its wrapper
+    for module, name, value in _targets():
+        if isinstance(value, type):
+            for attribute, member in list(vars(value).items()):
+                counter = f"{module.__name__}.{value.__name__}.{attribute}"
+                if isinstance(member, property) and member.fget is not None:
+                    _patch(value, attribute, property(_wrap(member.fget, counter), member.fset, member.fdel, member.__doc__))
+                elif isinstance(member, staticmethod):
+                    _patch(value, attribute, staticmethod(_wrap(member.__func__, counter)))
+                elif callable(member) and not isinstance(member, type) and (attribute == "__init__" or not attribute.startswith("_")):
+                    _patch(value, attribute, _wrap(member, counter))
+        else:
+            wrappers[id(value)] = _wrap(value, f"{module.__name__}.{name}")
+    for other in list(sys.modules.values()): # The module itself and every module that imported the function by name.
+        if other is None: continue
+        for attribute, member in list(vars(other).items()):
+            wrapper = wrappers.get(id(member))
+            if wrapper is not None and wrapper.__instrumented__ is member: _patch(other, attribute, wrapper)
+
+def disable():
+    """
+    This function disables the instrumentation, restoring the original functions and properties. The counters are kept.
+    """
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
+
+def enabled() -> bool:
+    """
+    This function checks if the instrumentation is enabled.
+    """
+    return bool(_patches)
+
+def snapshot() -> dict:
+    """
+    This function returns a copy of the counters.
+
+    Returns:
+        dict: name -> {"calls": number of calls, "seconds": total wall time}, sorted by name.
+    """
+    with _lock:
+        return {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in sorted(_counters.items())}
+
+def reset():
+    """
+    This function clears the counters.
+    """
+    with _lock:
+        _counters.clear()
+
+@contextmanager
+def instrumented(clear = False):
+    """
+    This context manager enables the instrumentation inside a `with` block, and disables it afterwards unless an outer block is still active. It yields the `snapshot` function.
+
+    Args:
+        clear (bool): Whether to clear the counters on entry. Default is False.
+    """
+    global _depth
+    if clear: reset()
+    enable()
+    _depth += 1
+    try:
+        yield snapshot
+    finally:
+        _depth -= 1
+        if _depth == 0: disable()
+
+if __name__ == "__main__":
+    # Testing program, counting the calls made to render the Noveritis and the Kalenda of a given year.
+    year = 2025
+    with instrumented(clear = True):
+        Noveritis.Noveritis(year).text
+        Kalenda.Kalenda(year).text
+        YearInfo.YearInfo(year).asdict()
+    for name, counter in sorted(snapshot().items(), key = lambda item: -item[1]["seconds"]):
+        print(f"{name:<60}{counter['calls']:>8}{counter['seconds'] * 1000:>12.3f} ms")
@@ -0,0 +1,165 @@
+"""
+A Python module to check the invariants of the liturgical calendar for every year and every profile (see `liturgicalyear.PROFILES`), reporting every counterexample year.
+
+The dates of every year of a profile are computed once by the day-number functions of the season modules (`lentrd`, `eastertiderd`, `adventrd`, `boundrd`, ...) into NumPy columns of Rata Die, and every invariant is then checked on whole columns at once.
+The columns are filled year by year on purpose, as they are the output of the scalar functions under test (a batch variant would check itself), only the checks are vectorized. Easter is checked against an independent computus, the Meeus algorithms (see `meeuseaster`).
+The 16 profiles are checked in parallel in a process pool, so the years 1 to 9999 of every profile take seconds.
+
+Usage:
+    python invariants.py --years 1-9999
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from easterstats import REFORMYEAR
+from lent import lentrd, eastertiderd, solemnitiesrd, holidaysrd
+from advent import adventrd, christmastiderd
+from ordinarytime import sundayrd, boundrd
+from liturgicalyear import PROFILES, yearrange
+
+def rdarray(years, month, day) -> np.ndarray:
+    """
+    This function is the batch variant of `daynumber.rd` for an array of years and a fixed month and day.
+    """
+    years = np.asarray(years, dtype = np.int64)
+    y = years - 1
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    correction = 0 if month <= 2 else np.where(leap, -1, -2)
+    return 365 * y + y // 4 - y // 100 + y // 400 + (367 * month - 362) // 12 + correction + day
+
+def weekdays(numbers) -> np.ndarray:
+    """
+    This function is the batch variant of `daynumber.weekday` (0 = Monday, ..., 6 = Sunday).
+    """
+    return (np.asarray(numbers) - 1) % 7
+
+def meeuseaster(years, calendar = True) -> np.ndarray:
+    """
+    This function calculates the Rata Die of Easter of every year with the algorithms of Meeus (the anonymous Gregorian algorithm and the Julian algorithm), independent of the Gaussian computus of `easter`, for the years 1 and after.
+
+    Args:
+        years (array of int): The years.
+        calendar (bool): Whether to use the Gregorian computus. Default is True (Gregorian computus, but Julian Easter if before 1583).
+    """
+    years = np.asarray(years, dtype = np.int64)
+    # Gregorian: the anonymous algorithm (Meeus, Astronomical Algorithms, chapter 8).
+    a = years % 19
+    b, c = years // 100, years % 100
+    d, e = b // 4, b % 4
+    g = (b - (b + 8) // 25 + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = (h + l - 7 * m + 114) // 31, (h + l - 7 * m + 114) % 31 + 1
+    gregorian = rdarray(years, 3, 1) - 1 + np.where(month == 4, 31, 0) + day
+    # Julian: the Julian algorithm, converted with the Julian calendar (Rata Die of 1 January 1 Julian is -1).
+    e = (19 * a + 15) % 30
+    f = (2 * (years % 4) + 4 * (years % 7) - e + 34) % 7
+    month, day = (e + f + 114) // 31, (e + f + 114) % 31 + 1
+    y = years - 1
+    julian = -2 + 365 * y + y // 4 + (367 * month - 362) // 12 + np.where(years % 4 == 0, -1, -2) + day
+    return np.where(years > REFORMYEAR, gregorian, julian) if calendar else julian
+
+def columns(years, calendar = True, ascensionThursday = False, corpusChristionThursday = False, epiphany_on_jan6th = False) -> dict:
+    """
+    This function computes the dates of the liturgical year of every year of a profile with the day-number functions of the season modules.
+
+    Args:
+        years (range): The years.
+        calendar, ascensionThursday, corpusChristionThursday, epiphany_on_jan6th (bool): The profile, as in `LiturgicalYear`.
+
+    Returns:
+        dict: name -> np.ndarray of the Rata Die (or week number) of every year.
+    """
+    rows = []
+    for year in years:
+        lent = lentrd(year, calendar)
+        eastertide = eastertiderd(year, calendar, ascensionThursday)
+        easter = lent["EasterSunday"]
+        prelent, postpentecost = boundrd(year, easter)
+        holidays = holidaysrd(year, calendar)
+        christmastide = christmastiderd(year, epiphany_on_jan6th)
+        rows.append((
+            year, easter, lent["AshWednesday"], lent["PalmSunday"], eastertide["Ascension"], eastertide["pentecost"],
+            solemnitiesrd(year, calendar, corpusChristionThursday)["CorpusChristi"], holidays["SaintJoseph"], holidays["Annunciation"],
+            adventrd(year)["firstSunday"], adventrd(year + 1)["firstSunday"], christmastide["Epiphany"], christmastide["BaptismOfTheLord"],
+            prelent, postpentecost, sundayrd(year, prelent, True), sundayrd(year, postpentecost), sundayrd(year, 34),
+        ))
+    names = [
+        "year", "easter", "ashwednesday", "palmsunday", "ascension", "pentecost",
+        "corpuschristi", "saintjoseph", "annunciation",
+        "advent", "nextadvent", "epiphany", "baptism",
+        "prelent", "postpentecost", "lastsundaybeforelent", "firstsundayafterpentecost", "christtheking",
+    ]
+    return dict(zip(names, np.array(rows, dtype = np.int64).T))
+
+# Name -> (description, function of the columns and the profile returning True for every year where the invariant holds).
+INVARIANTS = {
+    "easter-computus": ("Easter matches the independent computus of Meeus", lambda c, p: c["easter"] == meeuseaster(c["year"], p["calendar"])),
+    "easter-sunday": ("Easter is a Sunday", lambda c, p: weekdays(c["easter"]) == 6),
+    "ashwednesday-wednesday": ("Ash Wednesday is a Wednesday", lambda c, p: weekdays(c["ashwednesday"]) == 2),
+    "ashwednesday-46": ("Ash Wednesday is 46 days before Easter", lambda c, p: c["easter"] - c["ashwednesday"] == 46),
+    "pentecost-49": ("Pentecost is 49 days after Easter", lambda c, p: c["pentecost"] - c["easter"] == 49),
+    "ascension": ("Ascension is 39 (Thursday) or 42 (Sunday) days after Easter", lambda c, p: c["ascension"] - c["easter"] == (39 if p["ascensionThursday"] else 42)),
+    "corpuschristi": ("Corpus Christi is 60 (Thursday) or 63 (Sunday) days after Easter", lambda c, p: c["corpuschristi"] - c["easter"] == (60 if p["corpusChristionThursday"] else 63)),
+    "advent-range": ("The first Sunday of Advent is a Sunday from 27 November to 3 December", lambda c, p: (weekdays(c["advent"]) == 6) & (c["advent"] >= rdarray(c["year"] - 1, 11, 27)) & (c["advent"] <= rdarray(c["year"] - 1, 12, 3))),
+    "saintjoseph-holyweek": ("Saint Joseph is not in Holy Week nor on a Sunday", lambda c, p: ((c["saintjoseph"] < c["palmsunday"]) | (c["saintjoseph"] > c["easter"])) & (weekdays(c["saintjoseph"]) != 6)),
+    "annunciation-octave": ("The Annunciation is not in Holy Week, the Octave of Easter nor on a Sunday", lambda c, p: ((c["annunciation"] < c["palmsunday"]) | (c["annunciation"] > c["easter"] + 7)) & (weekdays(c["annunciation"]) != 6)),
+    "epiphany-range": ("Epiphany is 6 January, or the Sunday from 2 to 8 January", lambda c, p: c["epiphany"] == rdarray(c["year"], 1, 6) if p["epiphany_on_jan6th"] else (weekdays(c["epiphany"]) == 6) & (c["epiphany"] >= rdarray(c["year"], 1, 2)) & (c["epiphany"] <= rdarray(c["year"], 1, 8))),
+    "baptism-range": ("The Baptism of the Lord is from 7 to 13 January", lambda c, p: (c["baptism"] >= rdarray(c["year"], 1, 7)) & (c["baptism"] <= rdarray(c["year"], 1, 13))),
+    "ordinarytime-beforelent": ("The last Sunday of Ordinary Time before Lent is the Sunday before Ash Wednesday", lambda c, p: c["ashwednesday"] - c["lastsundaybeforelent"] == 3),
+    "ordinarytime-afterpentecost": ("Ordinary Time resumes in the week of Pentecost", lambda c, p: c["firstsundayafterpentecost"] == c["pentecost"]),
+    "ordinarytime-weeks": ("Ordinary Time has 33 or 34 weeks", lambda c, p: np.isin(c["prelent"] + 35 - c["postpentecost"], [33, 34])),
+    "christtheking": ("Christ the King (week 34) is the Sunday before the next Advent", lambda c, p: c["nextadvent"] - c["christtheking"] == 7),
+}
+
+def checkprofile(task) -> dict:
+    """
+    This function checks every invariant for the years of one profile.
+
+    Args:
+        task (tuple): (profile name, first year, last year).
+
+    Returns:
+        dict: invariant -> list of the counterexample years.
+    """
+    name, first, last = task
+    profile = PROFILES[name]
+    c = columns(range(first, last + 1), **profile)
+    return {invariant: c["year"][~np.broadcast_to(function(c, profile), c["year"].shape)].tolist() for invariant, (description, function) in INVARIANTS.items()}
+
+def check(first = 1, last = 9999, profiles = None, workers = None) -> dict:
+    """
+    This function checks every invariant for every year and every profile in a process pool.
+
+    Args:
+        first, last (int): The years (inclusive). Default is 1 to 9999.
+        profiles (list of str): The profiles, see `liturgicalyear.PROFILES`. Default is all 16 profiles.
+        workers (int): The number of worker processes. Default is the number of CPUs.
+
+    Returns:
+        dict: profile -> invariant -> list of the counterexample years.
+    """
+    profiles = list(PROFILES) if profiles is None else profiles
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        return dict(zip(profiles, executor.map(checkprofile, [(name, first, last) for name in profiles])))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Check the invariants of the liturgical calendar for every year and profile.")
+    parser.add_argument("--years", type = yearrange, default = range(1, 10000), help = "year or year range (default: 1-9999)")
+    parser.add_argument("--profiles", default = None, help = "comma-separated profiles (default: all)")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+    results = check(args.years[0], args.years[-1], None if args.profiles is None else args.profiles.split(","), args.workers)
+    failures = 0
+    for invariant, (description, function) in INVARIANTS.items():
+        counterexamples = {name: result[invariant] for name, result in results.items() if result[invariant]}
+        failures += sum(len(years) for years in counterexamples.values())
+        print(f"{'FAIL' if counterexamples else 'ok':<6}{invariant:<30}{description}")
+        for name, years in counterexamples.items():
+            print(f"      {name}: {len(years)} years, e.g. {', '.join(map(str, years[:10]))}")
+    print(f"{len(results)} profiles, {len(args.years)} years, {failures} counterexamples")
+    sys.exit(1 if failures else 0)
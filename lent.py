@@ -8,8 +8,9 @@ This is made for the purpose of calculating the dates of the Lent and Eastertide
 Originally written on First Monday of Advent, 1 December 2025, the second day of Liturgical Year 2026, when the first window of the 24-window Advent calendar is opened after the first candle of 5-candle Advent wreath is lit (30 November 2025 was the first day of Advent and the First Sunday of Advent of lectionary year A).
 """
 
-from datetime import date, timedelta # import date and timedelta from datetime module to convert to Gregorian calendar to be compatible with the Gregorian calendar.
-from easter import easterdate # import easter and easterdate from easter.py module to calculate the date of Easter.
+from datetime import date # import date from datetime module to convert to Gregorian calendar to be compatible with the Gregorian calendar.
+from easter import easterdate, easterrd # import easterrd from easter.py module to calculate the day number of Easter, and easterdate to compare the Gregorian and Julian Easters in the testing program.
+from daynumber import rd, todate, weekday # import the day number functions from daynumber.py module to do the date arithmetic on integers.
 
 class Lent:
     """
@@ -18,7 +19,7 @@ class Lent:
     Alleluia is banned all throughout Lent, including the Sundays of Lent and feasts and solemnities of Lent. The only exception is the Easter Vigil, the last day of Lent where Alleluia is sung.
     Every Sunday of Lent is how we journey by the Cross of Jesus Christ. And all Lent season is the catechumens' last challenge before their baptism on Easter Vigil.
     Note: 
-    - All days of the Lent and Eastertide are weekday-locked (as Easter cannot be any day of the week other than Sunday and neither can Ash Wednesday other than Wednesday), the only the `timedelta` function is used to calculate the dates of the days of the Lent and Eastertide.
+    - All days of the Lent and Eastertide are weekday-locked (as Easter cannot be any day of the week other than Sunday and neither can Ash Wednesday other than Wednesday), so they are fixed offsets from Easter, calculated once on day numbers by `lentrd` and converted to dates by the properties.
     - The Lent season is always 40 days, from Ash Wednesday to Holy Saturday, discounting the Sundays of Lent.
     - If counting from Ash Wednesday to Maundy Thursday inclusive (per current Roman Missal since 1970), then Lent is 44 days (counting Sundays).
     - Unlike Advent, the Lent cannot have 5-candle Advent Wreath nor Advent calendar, but the Lenten calendar (which is always reusable since Advent date ranges (hence the separate Advent Candles in Advent Wreath (Sunday) and Advent calendar (December 1-24)) varies but Lent date ranges is always the same). Instead, Lent is the intense time for the spiritual journey of the faithful to follow the way of the Cross of Jesus Christ.
@@ -39,7 +40,17 @@ class Lent:
             calendar (bool): Whether to return the date in the Gregorian calendar. Default is True (Gregorian calendar, but Julian Easter if before 1583).
         """
         self.year = year # The input year is for liturgical year.
-        self.easter = easterdate(year, calendar) # Calculate the date of Easter for the given year.
+        self.days = lentrd(year, calendar) # The day numbers of the dates, see `lentrd`.
+        self.easter = todate(self.days["EasterSunday"]) # The date of Easter for the given year.
+    def dualdates(self, country = "rome") -> dict:
+        """
+        This method returns the dates of the Lent season alongside their historical civil dates in a country, see `reform.dualdays`.
+
+        Returns:
+            dict: name of the date in `self.days` -> (proleptic Gregorian date, civil date).
+        """
+        from reform import dualdays # reform.py imports this module through liturgicalyear.py.
+        return dualdays(self.days, country)
     @property
     def AshWednesday(self) -> date:
         """
@@ -52,7 +63,7 @@ class Lent:
         Returns:
             date: The date of Ash Wednesday.
         """
-        return self.easter - timedelta(days = 46) # Ash Wednesday is 46 days before Easter.
+        return todate(self.days["AshWednesday"]) # Ash Wednesday is 46 days before Easter.
     @property
     def FirstSunday(self) -> date:
         """
@@ -66,7 +77,7 @@ class Lent:
         Returns:
             date: The date of the First Sunday of Lent.
         """
-        return self.easter - timedelta(days = 42) # The First Sunday of Lent is 42 days before Easter.
+        return todate(self.days["FirstSunday"]) # The First Sunday of Lent is 42 days before Easter.
     @property
     def SecondSunday(self) -> date:
         """
@@ -79,7 +90,7 @@ class Lent:
         Returns:
             date: The date of the Second Sunday of Lent.
         """
-        return self.easter - timedelta(days = 35) # The Second Sunday of Lent is 35 days before Easter.
+        return todate(self.days["SecondSunday"]) # The Second Sunday of Lent is 35 days before Easter.
     @property
     def ThirdSunday(self) -> date:
         """
@@ -97,7 +108,7 @@ class Lent:
         Returns:
             date: The date of the Third Sunday of Lent.
         """
-        return self.easter - timedelta(days = 28) # The Third Sunday of Lent is 28 days before Easter.
+        return todate(self.days["ThirdSunday"]) # The Third Sunday of Lent is 28 days before Easter.
     @property
     def FourthSunday(self) -> date:
         """
@@ -117,7 +128,7 @@ class Lent:
         Returns:
             date: The date of the Fourth Sunday of Lent.
         """
-        return self.easter - timedelta(days = 21) # The Fourth Sunday of Lent is 21 days before Easter.
+        return todate(self.days["FourthSunday"]) # The Fourth Sunday of Lent is 21 days before Easter.
     @property
     def FifthSunday(self) -> date:
         """
@@ -132,7 +143,7 @@ class Lent:
         Returns:
             date: The date of the Fifth Sunday of Lent.
         """
-        return self.easter - timedelta(days = 14) # The Fifth Sunday of Lent is 14 days before Easter.
+        return todate(self.days["FifthSunday"]) # The Fifth Sunday of Lent is 14 days before Easter.
     @property
     def PalmSunday(self) -> date:
         """
@@ -157,7 +168,7 @@ class Lent:
         Returns:
             date: The date of Palm Sunday.
         """
-        return self.easter - timedelta(days = 7) # Palm Sunday is 7 days before Easter.
+        return todate(self.days["PalmSunday"]) # Palm Sunday is 7 days before Easter.
     @property
     def MaundyThursday(self) -> date:
         """
@@ -174,7 +185,7 @@ class Lent:
         Returns:
             date: The date of Maundy Thursday.
         """
-        return self.easter - timedelta(days = 3) # Maundy Thursday is 3 days before Easter.
+        return todate(self.days["MaundyThursday"]) # Maundy Thursday is 3 days before Easter.
     @property
     def GoodFriday(self) -> date:
         """
@@ -193,7 +204,7 @@ class Lent:
         Returns:
             date: The date of Good Friday.
         """
-        return self.easter - timedelta(days = 2) # Good Friday is 2 days before Easter.
+        return todate(self.days["GoodFriday"]) # Good Friday is 2 days before Easter.
     @property
     def HolySaturday(self) -> date:
         """
@@ -210,7 +221,7 @@ class Lent:
         Returns:
             date: The date of Holy Saturday.
         """
-        return self.easter - timedelta(days = 1) # Holy Saturday is the day before Easter.
+        return todate(self.days["HolySaturday"]) # Holy Saturday is the day before Easter.
     
 class Eastertide:
     """
@@ -219,7 +230,7 @@ class Eastertide:
     Also, not only Alleluia is allowed, but also expanded throughout the Eastertide, hence Alleluia overloads on Eastertide.
     On Eastertide, instead of Angelus, we will pray the Regina Coeli instead. Also on Eastertide, according to the Percepts of the Church, you must take communion at least once in Eastertide annually.
     Note:
-    - Also like `Lent` class, all the dates of the Eastertide are weekday-locked (as Easter cannot be any day of the week other than Sunday and neither can Ascension Thursday other than Thursday), the only the `timedelta` function is used to calculate the dates of the days of the Eastertide.
+    - Also like `Lent` class, all the dates of the Eastertide are weekday-locked (as Easter cannot be any day of the week other than Sunday and neither can Ascension Thursday other than Thursday), so they are fixed offsets from Easter, calculated once on day numbers by `eastertiderd` and converted to dates by the properties.
     - While Lent forbids Alleluia in all of Lent including its solemnities and feasts (EXCEPT the Easter Vigil), Eastertide allows Alleluia in all of Eastertide including its solemnities and feasts, but not only does it return but also is expanded throughout the Eastertide (appended after every liturgical antiphon, e.g. introits, communions, psalmody antiphons, etc), hence Alleluia overloads on Eastertide.
     - White vestments are worn on Eastertide. On Eastertide Masses, Matins Lauds and Vespers, the Easter Candle is lit.It is placed in the center of the altar.
     """
@@ -233,8 +244,18 @@ class Eastertide:
             ascensionThursday (bool): Whether to include Ascension Thursday in the Eastertide. Ascension is Thursday (`True`) in Northeast USA, North Vietnam, France, England, etc; but Sunday (`False`) in most of the rest of the world. Default is False, since the developer lives in South Vietnam, where Ascension is celebrated on Sunday.
         """
         self.year = year # The input year is for liturgical year.
-        self.easter = easterdate(year, calendar) # Calculate the date of Easter for the given year.
+        self.days = eastertiderd(year, calendar, ascensionThursday) # The day numbers of the dates, see `eastertiderd`.
+        self.easter = todate(self.days["EasterSunday"]) # The date of Easter for the given year.
         self.ascensionThursday = ascensionThursday # Whether to include Ascension Thursday in the Eastertide.
+    def dualdates(self, country = "rome") -> dict:
+        """
+        This method returns the dates of the Eastertide alongside their historical civil dates in a country, see `reform.dualdays`.
+
+        Returns:
+            dict: name of the date in `self.days` -> (proleptic Gregorian date, civil date).
+        """
+        from reform import dualdays # reform.py imports this module through liturgicalyear.py.
+        return dualdays(self.days, country)
     @property
     def EasterVigil(self) -> date:
         """
@@ -388,7 +409,7 @@ class Eastertide:
         Returns:
             date: The date of Easter Vigil.
         """
-        return self.easter - timedelta(days = 1) # Easter Vigil is the day before Easter.
+        return todate(self.days["EasterVigil"]) # Easter Vigil is the day before Easter.
 
     @property
     def EasterSunday(self) -> date:
@@ -409,7 +430,7 @@ class Eastertide:
         Returns:
             date: The date of Easter Sunday.
         """
-        return self.easter # Easter Sunday is the first day of Eastertide.
+        return todate(self.days["EasterSunday"]) # Easter Sunday is the first day of Eastertide.
     @property
     def secondSunday(self) -> date:
         """
@@ -423,7 +444,7 @@ class Eastertide:
         Returns:
             date: The date of the second Sunday of Eastertide.
         """
-        return self.easter + timedelta(days = 7) # The second Sunday of Eastertide is the Sunday after Easter Sunday.
+        return todate(self.days["secondSunday"]) # The second Sunday of Eastertide is the Sunday after Easter Sunday.
     @property
     def thirdSunday(self) -> date:
         """
@@ -437,7 +458,7 @@ class Eastertide:
         Returns:
             date: The date of the third Sunday of Eastertide.
         """
-        return self.easter + timedelta(days = 14) # The third Sunday of Eastertide is 14 days after Easter Sunday.
+        return todate(self.days["thirdSunday"]) # The third Sunday of Eastertide is 14 days after Easter Sunday.
     
     @property
     def fourthSunday(self) -> date:
@@ -452,7 +473,7 @@ class Eastertide:
         Returns:
             date: The date of the fourth Sunday of Eastertide.
         """
-        return self.easter + timedelta(days = 21) # The fourth Sunday of Eastertide is 21 days after Easter Sunday.
+        return todate(self.days["fourthSunday"]) # The fourth Sunday of Eastertide is 21 days after Easter Sunday.
     
     @property
     def fifthSunday(self) -> date:
@@ -464,7 +485,7 @@ class Eastertide:
         - B: John 15:1-8 (#53) - The Vine and the Branches
         - C: John 13:31-33a, 34-35 (#54) - The New Commandment
         """
-        return self.easter + timedelta(days = 28) # The fifth Sunday of Eastertide is 28 days after Easter Sunday.
+        return todate(self.days["fifthSunday"]) # The fifth Sunday of Eastertide is 28 days after Easter Sunday.
     
     @property
     def sixthSunday(self) -> date:
@@ -480,7 +501,7 @@ class Eastertide:
         Note:
             In where Ascension is transferred to Sunday (`ascensionThursday` is `False`), the readings from the 7th Sunday of Eastertide (sourced from John 17) is sometimes read on this day instead.
         """
-        return self.easter + timedelta(days = 35) # The sixth Sunday of Eastertide is 35 days after Easter Sunday.
+        return todate(self.days["sixthSunday"]) # The sixth Sunday of Eastertide is 35 days after Easter Sunday.
     
     @property
     def Ascension(self) -> date:
@@ -494,7 +515,7 @@ class Eastertide:
         - B: Mark 16:15-20 - The Great Commission
         - C: Luke 24:46-53 - The Ascension of the Lord
         """
-        return self.easter + timedelta(days = 39 if self.ascensionThursday else 42) # Ascension Day is the 40th day after Easter Sunday if Ascension is celebrated on Thursday, otherwise it is the 43rd day after Easter Sunday.
+        return todate(self.days["Ascension"]) # Ascension Day is the 40th day after Easter Sunday if Ascension is celebrated on Thursday, otherwise it is the 43rd day after Easter Sunday.
     
     @property
     def seventhSunday(self) -> date:
@@ -511,7 +532,7 @@ class Eastertide:
         Returns:
             date: The date of the seventh Sunday of Eastertide.
         """
-        return self.easter + timedelta(days = 42) if self.ascensionThursday else None
+        return todate(self.days["seventhSunday"]) if self.ascensionThursday else None
         # The seventh Sunday of Eastertide is 42 days after Easter Sunday if Ascension is celebrated on Thursday, otherwise it is not celebrated (None is returned). 
     
     @property
@@ -536,7 +557,7 @@ class Eastertide:
         Returns:
             date: The date of Pentecost.
         """
-        return self.easter + timedelta(days = 49) # Pentecost is the 50th day after Easter Sunday.
+        return todate(self.days["pentecost"]) # Pentecost is the 50th day after Easter Sunday.
     
 class SolemnitiesoftheLord:
     """
@@ -553,9 +574,19 @@ class SolemnitiesoftheLord:
             corpusChristionThursday (bool): Corpus Christi is celebrated on Thursday after Trinity in Germany, Brazil, Australia, etc; but Sunday in most of the rest of the world, including USA, Vietnam, England, France, etc.
         """
         self.year = year # The input year is for liturgical year.
-        self.easter = easterdate(year, calendar) # Calculate the date of Easter for the given year.
+        self.days = solemnitiesrd(year, calendar, corpusChristionThursday) # The day numbers of the dates, see `solemnitiesrd`.
+        self.easter = todate(self.days["EasterSunday"]) # The date of Easter for the given year.
         self.corpusChristionThursday = corpusChristionThursday # Whether to include Corpus Christi in the Solemnities of the Lord.
         
+    def dualdates(self, country = "rome") -> dict:
+        """
+        This method returns the dates of the Solemnities of the Lord alongside their historical civil dates in a country, see `reform.dualdays`.
+
+        Returns:
+            dict: name of the date in `self.days` -> (proleptic Gregorian date, civil date).
+        """
+        from reform import dualdays # reform.py imports this module through liturgicalyear.py.
+        return dualdays(self.days, country)
     @property
     def Trinity(self) -> date:
         """
@@ -570,7 +601,7 @@ class SolemnitiesoftheLord:
         - B: Matthew 28:16-20 (#165) - Baptize in Trinity's Name
         - C: John 16:12-15 (#166) - The Spirit of Truth
         """
-        return self.easter + timedelta(days = 56) # Trinity Sunday is 56 days after Easter Sunday.
+        return todate(self.days["Trinity"]) # Trinity Sunday is 56 days after Easter Sunday.
     
     @property
     def CorpusChristi(self) -> date:
@@ -586,7 +617,7 @@ class SolemnitiesoftheLord:
         - B: Mark 14:12-16, 22-26 (#168) - The First Mass
         - C: Luke 9:11b-17 (#169) - The Eucharistic Meal with the 5000
         """
-        return self.easter + timedelta(days = 60 if self.corpusChristionThursday else 63)
+        return todate(self.days["CorpusChristi"])
         # Corpus Christi is 60 days after Easter Sunday if Corpus Christi is celebrated on Thursday, otherwise it is 63 days after Easter Sunday. 
     
     @property
@@ -599,7 +630,7 @@ class SolemnitiesoftheLord:
         - B: John 19:34-37 (#171) - The Pierced Heart
         - C: Luke 15:3-7 (#172) - The Searching Heart for the Lost Sheep
         """
-        return self.easter + timedelta(days = 68) # Sacred Heart is 68 days after Easter Sunday.
+        return todate(self.days["SacredHeart"]) # Sacred Heart is 68 days after Easter Sunday.
 
 class LentenEastertide_Holidays:
     """
@@ -614,7 +645,17 @@ class LentenEastertide_Holidays:
             calendar (bool): Whether to return the date in the Gregorian calendar. Default is True (Gregorian calendar, but Julian Easter if before 1583).
         """
         self.year = year # The input year is for liturgical year.
-        self.easter = easterdate(year, calendar) # Calculate the date of Easter for the given year.
+        self.days = holidaysrd(year, calendar) # The day numbers of the dates, see `holidaysrd`.
+        self.easter = todate(self.days["EasterSunday"]) # The date of Easter for the given year.
+    def dualdates(self, country = "rome") -> dict:
+        """
+        This method returns the dates of the Lenten Eastertide Holidays alongside their historical civil dates in a country, see `reform.dualdays`.
+
+        Returns:
+            dict: name of the date in `self.days` -> (proleptic Gregorian date, civil date).
+        """
+        from reform import dualdays # reform.py imports this module through liturgicalyear.py.
+        return dualdays(self.days, country)
     @property
     def SaintJoseph(self) -> date:
         """
@@ -632,19 +673,7 @@ class LentenEastertide_Holidays:
         Returns:
             date: The date of Saint Joseph.
         """
-        joseph = date(self.year, 3, 19)
-        if joseph.weekday() == 6: # Sunday in Lent (except Palm Sunday)
-            return joseph + timedelta(days = 1)
-        elif self.easter < date(self.year, 3, 27): 
-            # Palm Sunday and Holy Week, Saint Joseph is celebrated on the Saturday before Palm Sunday (8 days before Easter)
-            # If Easter is 22 March -> Saint Joseph is 14 March
-            # If Easter is 23 March -> Saint Joseph is 15 March (worked example in 2008)
-            # If Easter is 24 March -> Saint Joseph is 16 March
-            # If Easter is 25 March -> Saint Joseph is 17 March
-            # If Easter is 26 March -> Saint Joseph is 18 March
-            return self.easter - timedelta(days = 8)
-        else:
-            return joseph
+        return todate(self.days["SaintJoseph"])
     @property
     def Annunciation(self) -> date:
         """
@@ -660,25 +689,57 @@ class LentenEastertide_Holidays:
         Returns:
             date: The date of the Annunciation.
         """
-        annunciation = date(self.year, 3, 25)
-        if annunciation.weekday() == 6: # Sunday in Lent (except Palm Sunday)
-            return annunciation + timedelta(days = 1)
-        elif self.easter < date(self.year, 4, 2):
-            # Palm Sunday and Holy Week, the Annunciation is celebrated on the Monday after Divine Mercy Sunday (8 days after Easter)
-            # If Easter is 22 March -> Annunciation is 30 March
-            # If Easter is 23 March -> Annunciation is 31 March (worked example in 2008)
-            # If Easter is 24 March -> Annunciation is 1 April
-            # If Easter is 25 March -> Annunciation is 2 April
-            # If Easter is 26 March -> Annunciation is 3 April
-            # If Easter is 27 March -> Annunciation is 4 April (worked example in 2016)
-            # If Easter is 28 March -> Annunciation is 5 April (worked example in 2026)
-            # If Easter is 29 March -> Annunciation is 6 April
-            # If Easter is 30 March -> Annunciation is 7 April
-            # If Easter is 31 March -> Annunciation is 8 April (worked example in 2024)
-            # If Easter is 1 April -> Annunciation is 9 April (latest possible Annunciation, worked example in 2018)
-            return self.easter + timedelta(days = 8)
-        else:
-            return annunciation
+        return todate(self.days["Annunciation"])
+
+def josephrd(year, easter) -> int:
+    """
+    This function calculates the day number (Rata Die) of Saint Joseph for any year, see `LentenEastertide_Holidays.SaintJoseph`.
+
+    Args:
+        year (int): The year.
+        easter (int): The Rata Die of Easter of the year.
+    """
+    joseph = rd(year, 3, 19)
+    if easter < rd(year, 3, 27):
+        # Palm Sunday and Holy Week, Saint Joseph is celebrated on the Saturday before Palm Sunday (8 days before Easter)
+        # If Easter is 22 March -> Saint Joseph is 14 March
+        # If Easter is 23 March -> Saint Joseph is 15 March (worked example in 2008)
+        # If Easter is 24 March -> Saint Joseph is 16 March
+        # If Easter is 25 March -> Saint Joseph is 17 March
+        # If Easter is 26 March -> Saint Joseph is 18 March
+        return easter - 8
+    elif weekday(joseph) == 6: # Sunday in Lent (except Palm Sunday, handled above)
+        return joseph + 1
+    else:
+        return joseph
+
+def annunciationrd(year, easter) -> int:
+    """
+    This function calculates the day number (Rata Die) of the Annunciation for any year, see `LentenEastertide_Holidays.Annunciation`.
+
+    Args:
+        year (int): The year.
+        easter (int): The Rata Die of Easter of the year.
+    """
+    annunciation = rd(year, 3, 25)
+    if easter < rd(year, 4, 2):
+        # Palm Sunday and Holy Week, the Annunciation is celebrated on the Monday after Divine Mercy Sunday (8 days after Easter)
+        # If Easter is 22 March -> Annunciation is 30 March
+        # If Easter is 23 March -> Annunciation is 31 March (worked example in 2008)
+        # If Easter is 24 March -> Annunciation is 1 April
+        # If Easter is 25 March -> Annunciation is 2 April
+        # If Easter is 26 March -> Annunciation is 3 April
+        # If Easter is 27 March -> Annunciation is 4 April (worked example in 2016)
+        # If Easter is 28 March -> Annunciation is 5 April (worked example in 2026)
+        # If Easter is 29 March -> Annunciation is 6 April
+        # If Easter is 30 March -> Annunciation is 7 April
+        # If Easter is 31 March -> Annunciation is 8 April (worked example in 2024)
+        # If Easter is 1 April -> Annunciation is 9 April (latest possible Annunciation, worked example in 2018)
+        return easter + 8
+    elif weekday(annunciation) == 6: # Sunday in Lent (except Palm Sunday, handled above)
+        return annunciation + 1
+    else:
+        return annunciation
 
 def HolyFire(year):
     """
@@ -687,8 +748,86 @@ def HolyFire(year):
     Returns:
         date: The date of Holy Fire Saturday.
     """
-    return easterdate(year, False) - timedelta(days = 1) 
+    return todate(holyfirerd(year)) 
     # Holy Fire Saturday is the day before Julian Easter.
+
+def lentrd(year, calendar = True) -> dict:
+    """
+    This function calculates the day numbers (Rata Die) of the Lent season for any year, see `Lent`.
+
+    Returns:
+        dict: The Rata Die of every property of `Lent` by name, and of Easter Sunday.
+    """
+    easter = easterrd(year, calendar)
+    return {
+        "AshWednesday": easter - 46,
+        "FirstSunday": easter - 42,
+        "SecondSunday": easter - 35,
+        "ThirdSunday": easter - 28,
+        "FourthSunday": easter - 21,
+        "FifthSunday": easter - 14,
+        "PalmSunday": easter - 7,
+        "MaundyThursday": easter - 3,
+        "GoodFriday": easter - 2,
+        "HolySaturday": easter - 1,
+        "EasterSunday": easter,
+    }
+
+def eastertiderd(year, calendar = True, ascensionThursday = False) -> dict:
+    """
+    This function calculates the day numbers (Rata Die) of the Eastertide for any year, see `Eastertide`.
+
+    Returns:
+        dict: The Rata Die of every property of `Eastertide` by name (seventhSunday is None unless Ascension is celebrated on Thursday).
+    """
+    easter = easterrd(year, calendar)
+    return {
+        "EasterVigil": easter - 1,
+        "EasterSunday": easter,
+        "secondSunday": easter + 7,
+        "thirdSunday": easter + 14,
+        "fourthSunday": easter + 21,
+        "fifthSunday": easter + 28,
+        "sixthSunday": easter + 35,
+        "Ascension": easter + (39 if ascensionThursday else 42),
+        "seventhSunday": easter + 42 if ascensionThursday else None,
+        "pentecost": easter + 49,
+    }
+
+def solemnitiesrd(year, calendar = True, corpusChristionThursday = False) -> dict:
+    """
+    This function calculates the day numbers (Rata Die) of the Solemnities of the Lord after Pentecost for any year, see `SolemnitiesoftheLord`.
+
+    Returns:
+        dict: The Rata Die of every property of `SolemnitiesoftheLord` by name, and of Easter Sunday.
+    """
+    easter = easterrd(year, calendar)
+    return {
+        "Trinity": easter + 56,
+        "CorpusChristi": easter + (60 if corpusChristionThursday else 63),
+        "SacredHeart": easter + 68,
+        "EasterSunday": easter,
+    }
+
+def holidaysrd(year, calendar = True) -> dict:
+    """
+    This function calculates the day numbers (Rata Die) of the Lenten Eastertide Holidays for any year, see `LentenEastertide_Holidays`.
+
+    Returns:
+        dict: The Rata Die of every property of `LentenEastertide_Holidays` by name, and of Easter Sunday.
+    """
+    easter = easterrd(year, calendar)
+    return {
+        "SaintJoseph": josephrd(year, easter),
+        "Annunciation": annunciationrd(year, easter),
+        "EasterSunday": easter,
+    }
+
+def holyfirerd(year) -> int:
+    """
+    This function calculates the day number (Rata Die) of Holy Fire Saturday for any year, see `HolyFire`.
+    """
+    return easterrd(year, False) - 1
     
 if __name__ == "__main__": # Testing program, testing all the dates of the Lent, Eastertide, Solemnities of the Lord and Holy Fire Saturday for any proleptic Gregorian calendar year.
     year = 2024
@@ -0,0 +1,157 @@
+"""
+A Python module to list the celebrations of a given calendar year (1 January to 31 December), gathered from the season classes of `advent.py`, `lent.py` and `ordinarytime.py`.
+
+A profile is a combination of the four boolean flags of the season classes:
+- calendar: Gregorian computus (True) or Julian Paschalion (False).
+- ascensionThursday: Ascension on Thursday (True) or Sunday (False).
+- corpusChristionThursday: Corpus Christi on Thursday (True) or Sunday (False).
+- epiphany_on_jan6th: Epiphany on 6 January (True) or the Sunday after New Year's Day (False).
+"""
+
+from datetime import date
+from itertools import product
+from lent import Lent, Eastertide, SolemnitiesoftheLord, LentenEastertide_Holidays
+from advent import Advent, Christmastide
+from ordinarytime import OrdinaryTime
+
+def profilename(calendar = True, ascensionThursday = False, corpusChristionThursday = False, epiphany_on_jan6th = False) -> str:
+    """
+    This function returns the name of a profile, e.g. "gregorian" for the default profile or "julian-ascension-epiphany" for Julian Easter with Ascension Thursday and Epiphany on 6 January.
+    """
+    name = ["gregorian" if calendar else "julian"]
+    if ascensionThursday: name.append("ascension")
+    if corpusChristionThursday: name.append("corpus")
+    if epiphany_on_jan6th: name.append("epiphany")
+    return "-".join(name)
+
+def yearrange(text) -> range:
+    """
+    This function parses a year range such as "1583-2082" or a single year such as "2025", as given on the command line.
+    """
+    first, _, last = text.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+# All the 16 profiles, by name.
+PROFILES = {
+    profilename(*flags): dict(zip(["calendar", "ascensionThursday", "corpusChristionThursday", "epiphany_on_jan6th"], flags))
+    for flags in product([True, False], repeat = 4)
+}
+
+# Fixed feasts listed in the calendar, with their season (the CSS class of `CALENDAR.html`).
+FIXEDFEASTS = [
+    (2, 2, "The Presentation of the Lord", "christmas"),
+    (6, 29, "Saints Peter and Paul, Apostles", "red"),
+    (8, 6, "The Transfiguration of the Lord", "christmas"),
+    (8, 15, "The Assumption of the Blessed Virgin Mary", "christmas"),
+    (9, 14, "The Exaltation of the Holy Cross", "red"),
+    (11, 1, "All Saints", "christmas"),
+    (11, 2, "All Souls", "advent"),
+    (11, 9, "The Dedication of the Lateran Basilica", "christmas"),
+]
+
+class LiturgicalYear:
+    """
+    This class lists the celebrations of a given calendar year: the feasts, solemnities and ALL Sundays, from the Solemnity of Mary, Mother of God to the Holy Family.
+    Note: The calendar year spans two liturgical years, so Christmastide is taken from the liturgical year of the calendar year (January) and from the next liturgical year (December), as is Advent.
+    """
+    def __init__(self, year, calendar = True, ascensionThursday = False, corpusChristionThursday = False, epiphany_on_jan6th = False):
+        """
+        This method initializes the LiturgicalYear class.
+
+        Args:
+            year (int): The calendar year to list the celebrations for.
+            calendar (bool): Whether to return the date in the Gregorian calendar. Default is True (Gregorian calendar, but Julian Easter if before 1583).
+            ascensionThursday (bool): Whether Ascension is celebrated on Thursday. Default is False.
+            corpusChristionThursday (bool): Whether Corpus Christi is celebrated on Thursday. Default is False.
+            epiphany_on_jan6th (bool): Whether Epiphany is celebrated on 6 January. Default is False.
+        """
+        self.year = year
+        self.calendar = calendar
+        self.ascensionThursday = ascensionThursday
+        self.corpusChristionThursday = corpusChristionThursday
+        self.epiphany_on_jan6th = epiphany_on_jan6th
+    @property
+    def profile(self) -> str:
+        """
+        This property returns the name of the profile of the calendar, see `profilename`.
+        """
+        return profilename(self.calendar, self.ascensionThursday, self.corpusChristionThursday, self.epiphany_on_jan6th)
+    @property
+    def celebrations(self) -> list:
+        """
+        This property lists the celebrations of the calendar year in chronological order.
+        A Sunday of Ordinary Time is left out if a feast or solemnity falls on it (e.g. Trinity Sunday), since it is overridden.
+
+        Returns:
+            list: (date, name, season) tuples, where season is one of "christmas", "ordinary", "lent", "easter", "red" and "advent".
+        """
+        year = self.year
+        christmastide = Christmastide(year, self.epiphany_on_jan6th)
+        lent = Lent(year, self.calendar)
+        eastertide = Eastertide(year, self.calendar, self.ascensionThursday)
+        solemnities = SolemnitiesoftheLord(year, self.calendar, self.corpusChristionThursday)
+        holidays = LentenEastertide_Holidays(year, self.calendar)
+        ordinarytime = OrdinaryTime(year, self.calendar)
+        advent = Advent(year + 1) # Advent of this calendar year is of the next liturgical year.
+        nextchristmastide = Christmastide(year + 1, self.epiphany_on_jan6th)
+        events = [
+            (christmastide.NewYear, "Solemnity of Mary, Mother of God", "christmas"),
+            (christmastide.SecondSundayAfterChristmas, "Second Sunday after Christmas", "christmas"),
+            (christmastide.Epiphany, "The Epiphany of the Lord", "christmas"),
+            (christmastide.BaptismOfTheLord, "The Baptism of the Lord", "christmas"),
+            (lent.AshWednesday, "Ash Wednesday", "lent"),
+            (lent.FirstSunday, "First Sunday of Lent", "lent"),
+            (lent.SecondSunday, "Second Sunday of Lent", "lent"),
+            (lent.ThirdSunday, "Third Sunday of Lent", "lent"),
+            (lent.FourthSunday, "Fourth Sunday of Lent (Laetare)", "lent"),
+            (lent.FifthSunday, "Fifth Sunday of Lent", "lent"),
+            (holidays.SaintJoseph, "Saint Joseph, Spouse of the Blessed Virgin Mary", "christmas"),
+            (holidays.Annunciation, "The Annunciation of the Lord", "christmas"),
+            (lent.PalmSunday, "Palm Sunday of the Passion of the Lord", "red"),
+            (lent.MaundyThursday, "Maundy Thursday", "lent"),
+            (lent.GoodFriday, "Good Friday", "red"),
+            (lent.HolySaturday, "Holy Saturday", "lent"),
+            (eastertide.EasterSunday, "Easter Sunday", "easter"),
+            (eastertide.secondSunday, "Divine Mercy Sunday", "easter"),
+            (eastertide.thirdSunday, "Third Sunday of Easter", "easter"),
+            (eastertide.fourthSunday, "Fourth Sunday of Easter", "easter"),
+            (eastertide.fifthSunday, "Fifth Sunday of Easter", "easter"),
+            (eastertide.sixthSunday, "Sixth Sunday of Easter", "easter"),
+            (eastertide.Ascension, "Ascension of the Lord", "easter"),
+            (eastertide.seventhSunday, "Seventh Sunday of Easter", "easter"),
+            (eastertide.pentecost, "Pentecost Sunday", "red"),
+            (solemnities.Trinity, "The Most Holy Trinity", "ordinary"),
+            (solemnities.CorpusChristi, "Corpus Christi", "ordinary"),
+            (solemnities.SacredHeart, "The Most Sacred Heart of Jesus", "ordinary"),
+            (ordinarytime.ChristtheKing, "Our Lord Jesus Christ, King of the Universe", "ordinary"),
+            (advent.firstSunday, "First Sunday of Advent", "advent"),
+            (advent.secondSunday, "Second Sunday of Advent", "advent"),
+            (advent.ImmaculateConception, "Immaculate Conception", "advent"),
+            (advent.thirdSunday, "Third Sunday of Advent (Gaudete)", "advent"),
+            (advent.fourthSunday, "Fourth Sunday of Advent", "advent"),
+            (nextchristmastide.ChristmasDay, "The Nativity of the Lord (Christmas)", "christmas"),
+            (nextchristmastide.holyFamily, "The Holy Family", "christmas"),
+        ]
+        events += [(date(year, month, day), name, season) for month, day, name, season in FIXEDFEASTS]
+        events = [event for event in events if event[0] is not None] # Second Sunday after Christmas and Seventh Sunday of Easter only exist in some profiles.
+        taken = {event[0] for event in events}
+        # Sundays of Ordinary Time before Lent (the first one is the Baptism of the Lord) and after Pentecost (until Christ the King, the 34th).
+        sundays = [(ordinarytime.sunday(week, True), week) for week in range(2, ordinarytime.max_week + 1)]
+        sundays += [(ordinarytime.sunday(week), week) for week in range(ordinarytime.week_after_pentecost, 34)]
+        events += [(sunday, f"Sunday {week} of Ordinary Time", "ordinary") for sunday, week in sundays if sunday not in taken]
+        return sorted(events, key = lambda event: event[0])
+    def dualcelebrations(self, country = "rome") -> list:
+        """
+        This method lists the celebrations of the calendar year (see `celebrations`) with the historical civil date of every celebration in a country, see `reform.civildate`.
+
+        Returns:
+            list: (date, civil date, name, season) tuples, the date being proleptic Gregorian.
+        """
+        from reform import civildate # reform.py imports this module.
+        return [(day, civildate(day.toordinal(), country), name, season) for day, name, season in self.celebrations]
+
+if __name__ == "__main__":
+    # Testing program, listing all the celebrations of a given calendar year.
+    year = 2025
+    for day, name, season in LiturgicalYear(year).celebrations:
+        print(f"{day:%a %d %b}: {name} ({season})")
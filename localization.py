@@ -0,0 +1,152 @@
+"""
+A Python module to translate the celebrations and render the proclamations (the Noveritis and the Kalenda) in several languages, from the message catalogs of the `locales` directory.
+
+Every catalog (`locales/<language>.json`) holds:
+- language, months, weekdays, date: The name of the language, the names of the months and of the days of the week (from Sunday), and the format of a date (with the fields day, month and monthname).
+- moons: The 30 days of the moon, as read in the Kalenda.
+- celebrations, patterns: The translations of the celebration names of `LiturgicalYear.celebrations`, exact or with fields (e.g. "Sunday {week} of Ordinary Time"). A missing name is left in English.
+- noveritis, kalenda: The lines of the proclamations, with the fields of the dates (noveritis) or the moon (kalenda).
+A catalog is loaded and compiled on first use only, once per process: its strings are interned, the lines without fields are kept as they are, the patterns are compiled to regular expressions, and the translated names, formatted dates and rendered Kalendas (one per moon) are memoized, so rendering many years in many languages never re-parses a catalog nor re-formats a shared string.
+
+Usage:
+    catalog("vi").noveritis(2025)
+"""
+
+import json
+import os
+import re
+import string
+import sys
+from functools import lru_cache
+from daynumber import todate
+from lent import lentrd, eastertiderd, solemnitiesrd
+from advent import adventrd
+from ordinarytime import sundayrd
+from Kalenda import ChristmasMoon
+
+LOCALEDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+
+def _fields(template) -> list:
+    """
+    This function lists the names of the fields of a format string.
+    """
+    return [field for literal, field, spec, conversion in string.Formatter().parse(template) if field is not None]
+
+class Catalog:
+    """
+    This class is a compiled message catalog of one language.
+    """
+    def __init__(self, code, messages):
+        """
+        This method initializes the Catalog class, compiling the messages of a catalog file.
+
+        Args:
+            code (str): The code of the language, e.g. "vi".
+            messages (dict): The content of the catalog file.
+        """
+        self.code = code
+        self.language = sys.intern(messages["language"])
+        self.months = tuple(sys.intern(month) for month in messages["months"])
+        self.weekdays = tuple(sys.intern(weekday) for weekday in messages["weekdays"])
+        self.dateformat = messages["date"]
+        self.moons = tuple(sys.intern(moon) for moon in messages["moons"])
+        self.names = {sys.intern(name): sys.intern(translation) for name, translation in messages["celebrations"].items()}
+        self.patterns = [(re.compile("^" + re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>.+?)", re.escape(pattern)) + "$"), translation) for pattern, translation in messages["patterns"].items()]
+        self.templates = {kind: tuple(self._compile(line) for line in messages[kind]) for kind in ["noveritis", "kalenda"]}
+        self.dates = {} # date -> formatted date
+        self.kalendas = {} # moon -> rendered Kalenda
+    @staticmethod
+    def _compile(line):
+        """
+        This method compiles a line: an interned string if it has no fields, else the line itself with the names of its fields.
+        """
+        fields = _fields(line)
+        return sys.intern(line) if not fields else (line, tuple(fields))
+    def _render(self, kind, values) -> str:
+        """
+        This method renders the lines of a proclamation with the values of their fields.
+        """
+        return "\n".join(line if isinstance(line, str) else line[0].format_map(values) for line in self.templates[kind])
+    def formatdate(self, day) -> str:
+        """
+        This method formats a date, e.g. "March 05" in English or "ngày 5 tháng 3" in Vietnamese.
+        """
+        text = self.dates.get(day)
+        if text is None:
+            text = self.dates[day] = sys.intern(self.dateformat.format(day = day.day, month = day.month, monthname = self.months[day.month - 1]))
+        return text
+    def celebration(self, name) -> str:
+        """
+        This method translates the name of a celebration, leaving it in English if the catalog has no translation.
+        """
+        translation = self.names.get(name)
+        if translation is None:
+            translation = name
+            for pattern, template in self.patterns:
+                match = pattern.match(name)
+                if match is not None:
+                    translation = sys.intern(template.format_map(match.groupdict()))
+                    break
+            self.names[name] = translation # Memoized, the fields are formatted once.
+        return translation
+    def celebrations(self, events) -> list:
+        """
+        This method translates the names of the (date, name, season) tuples of `LiturgicalYear.celebrations`.
+        """
+        return [(day, self.celebration(name), season) for day, name, season in events]
+    def noveritis(self, year, calendar = True, ascensionThursday = False, corpusChristionThursday = False) -> str:
+        """
+        This method renders the Noveritis of a year, see `Noveritis.Noveritis`.
+        """
+        lent = lentrd(year, calendar)
+        eastertide = eastertiderd(year, calendar, ascensionThursday)
+        values = {
+            "ashwednesday": lent["AshWednesday"],
+            "easter": lent["EasterSunday"],
+            "ascension": eastertide["Ascension"],
+            "pentecost": eastertide["pentecost"],
+            "corpus": solemnitiesrd(year, calendar, corpusChristionThursday)["CorpusChristi"],
+            "christtheking": sundayrd(year, 34),
+            "advent": adventrd(year + 1)["firstSunday"], # The first Sunday of Advent of this calendar year.
+        }
+        return self._render("noveritis", {name: self.formatdate(todate(number)) for name, number in values.items()})
+    def kalenda(self, year) -> str:
+        """
+        This method renders the Kalenda of a year, see `Kalenda.Kalenda`.
+        """
+        moon = ChristmasMoon(year)
+        text = self.kalendas.get(moon)
+        if text is None: text = self.kalendas[moon] = self._render("kalenda", {"moon": self.moons[moon - 1]})
+        return text
+
+def languages() -> list:
+    """
+    This function lists the codes of the languages of the `locales` directory.
+    """
+    return sorted(name[:-5] for name in os.listdir(LOCALEDIR) if name.endswith(".json"))
+
+@lru_cache(maxsize = None)
+def catalog(code = "en") -> Catalog:
+    """
+    This function loads and compiles the catalog of a language on first use, and returns the same catalog afterwards.
+    """
+    path = os.path.join(LOCALEDIR, f"{code}.json")
+    if not os.path.exists(path): raise ValueError(f"Unknown language {code!r}, expected one of {', '.join(languages())}")
+    with open(path, encoding = "utf-8") as file:
+        return Catalog(code, json.load(file))
+
+def translate(name, code = "en") -> str:
+    """
+    This function translates the name of a celebration, see `Catalog.celebration`.
+    """
+    return catalog(code).celebration(name)
+
+if __name__ == "__main__":
+    # Testing program, printing the proclamations of a given year in every language.
+    year = 2025
+    for code in languages():
+        print(f"--- {catalog(code).language} ---")
+        print(catalog(code).noveritis(year))
+        print()
+        print(catalog(code).kalenda(year))
+        print()
@@ -0,0 +1,233 @@
+"""
+A Python module to calculate the Vietnamese lunisolar calendar (Âm lịch, UTC+7) offline, for planning around Tết (the Lunar New Year) colliding with Ash Wednesday or Lent.
+
+The new moons and the solar terms are computed once for a range of years (Ho Ngoc Duc's algorithm, after Jean Meeus' Astronomical Algorithms) and kept in sorted tables, so every lookup is a binary search:
+- The 11th lunar month is the month containing the winter solstice.
+- A lunar year with 13 months between two 11th months has a leap month: the first month with no major solar term (its new moon and the next one fall in the same 30° sector of the sun's longitude).
+- Tết is the first day of the 1st lunar month.
+
+Note: `YearInfo.ChineseZodiac` names the zodiac of a whole Gregorian year, which is wrong for January and early February dates before Tết; `zodiac` names it by the lunar year of the day.
+"""
+
+from bisect import bisect_right
+from datetime import date
+from math import sin, pi, floor
+from daynumber import JDNOFFSET
+from YearInfo import YearInfo
+from lent import Lent
+
+TIMEZONE = 7 # Vietnam (UTC+7), since 1975.
+
+def newmoon(k) -> float:
+    """
+    This function calculates the Julian Day (UT) of the k-th new moon after the new moon of 1 January 1900.
+
+    Args:
+        k (int): The number of the new moon.
+
+    Returns:
+        float: The Julian Day of the new moon.
+    """
+    T = k / 1236.85 # Time in Julian centuries from 1900 January 0.5
+    T2 = T * T
+    T3 = T2 * T
+    dr = pi / 180
+    jd1 = 2415020.75933 + 29.53058868 * k + 0.0001178 * T2 - 0.000000155 * T3
+    jd1 += 0.00033 * sin((166.56 + 132.87 * T - 0.009173 * T2) * dr) # Mean new moon
+    M = 359.2242 + 29.10535608 * k - 0.0000333 * T2 - 0.00000347 * T3 # Sun's mean anomaly
+    Mpr = 306.0253 + 385.81691806 * k + 0.0107306 * T2 + 0.00001236 * T3 # Moon's mean anomaly
+    F = 21.2964 + 390.67050646 * k - 0.0016528 * T2 - 0.00000239 * T3 # Moon's argument of latitude
+    C1 = (0.1734 - 0.000393 * T) * sin(M * dr) + 0.0021 * sin(2 * dr * M)
+    C1 = C1 - 0.4068 * sin(Mpr * dr) + 0.0161 * sin(dr * 2 * Mpr)
+    C1 = C1 - 0.0004 * sin(dr * 3 * Mpr)
+    C1 = C1 + 0.0104 * sin(dr * 2 * F) - 0.0051 * sin(dr * (M + Mpr))
+    C1 = C1 - 0.0074 * sin(dr * (M - Mpr)) + 0.0004 * sin(dr * (2 * F + M))
+    C1 = C1 - 0.0004 * sin(dr * (2 * F - M)) - 0.0006 * sin(dr * (2 * F + Mpr))
+    C1 = C1 + 0.0010 * sin(dr * (2 * F - Mpr)) + 0.0005 * sin(dr * (2 * Mpr + M))
+    if T < -11: deltat = 0.001 + 0.000839 * T + 0.0002261 * T2 - 0.00000845 * T3 - 0.000000081 * T * T3
+    else: deltat = -0.000278 + 0.000265 * T + 0.000262 * T2
+    return jd1 + C1 - deltat
+
+def sunlongitude(jd) -> float:
+    """
+    This function calculates the sun's longitude (in radians, 0 to 2π) at a given Julian Day (UT).
+    """
+    T = (jd - 2451545.0) / 36525 # Time in Julian centuries from 2000-01-01 12:00:00 GMT
+    T2 = T * T
+    dr = pi / 180
+    M = 357.52910 + 35999.05030 * T - 0.0001559 * T2 - 0.00000048 * T * T2 # Mean anomaly
+    L0 = 280.46645 + 36000.76983 * T + 0.0003032 * T2 # Mean longitude
+    DL = (1.914600 - 0.004817 * T - 0.000014 * T2) * sin(dr * M)
+    DL += (0.019993 - 0.000101 * T) * sin(dr * 2 * M) + 0.000290 * sin(dr * 3 * M)
+    L = (L0 + DL) * dr
+    return L - 2 * pi * floor(L / (2 * pi))
+
+def newmoonday(k, timezone = TIMEZONE) -> int:
+    """
+    This function returns the Julian Day Number of the local day of the k-th new moon.
+    """
+    return floor(newmoon(k) + 0.5 + timezone / 24)
+
+def solarterm(jdn, timezone = TIMEZONE) -> int:
+    """
+    This function returns the 30° sector (0 to 11) of the sun's longitude at the local midnight starting a given Julian Day Number. The major solar terms (trung khí) begin at 0°, 30°, ..., so the winter solstice begins sector 9.
+    """
+    return floor(sunlongitude(jdn - 0.5 - timezone / 24) / pi * 6)
+
+class LunisolarCalendar:
+    """
+    This class holds the precomputed new-moon and solar-term tables of the Vietnamese lunisolar calendar for a range of years, and looks up lunar dates and Tết by binary search.
+    """
+    def __init__(self, first = 1000, last = 3000, timezone = TIMEZONE):
+        """
+        This method initializes the LunisolarCalendar class, computing the tables.
+
+        Args:
+            first (int): The first Gregorian year of the tables. Default is 1000.
+            last (int): The last Gregorian year of the tables. Default is 3000.
+            timezone (int): The time zone in hours from UTC. Default is 7 (Vietnam).
+        """
+        self.first = first
+        self.last = last
+        self.timezone = timezone
+        start = date(first - 1, 1, 1).toordinal() + JDNOFFSET
+        end = date(last + 1, 12, 31).toordinal() + JDNOFFSET
+        k = floor((start - 2415021.076998695) / 29.530588853) - 1
+        self.newmoons = [] # Julian Day Number of the first day of every lunar month.
+        while not self.newmoons or self.newmoons[-1] <= end + 31:
+            self.newmoons.append(newmoonday(k, timezone))
+            k += 1
+        self.terms = [solarterm(day, timezone) for day in self.newmoons] # Solar term sector at the start of every lunar month.
+        # Index of the 11th month of every year (the last new moon before 31 December with the sun still before the winter solstice).
+        self.month11 = {}
+        for year in range(first - 1, last + 2):
+            index = bisect_right(self.newmoons, date(year, 12, 31).toordinal() + JDNOFFSET) - 1
+            if self.terms[index] >= 9: index -= 1
+            self.month11[year] = index
+    def leapmonth(self, month11) -> int:
+        """
+        This method returns the offset of the leap month after the 11th month with the given index, or None if the following lunar year has no leap month.
+        """
+        following = self.month11[self.newmoonyear(month11) + 1]
+        if following - month11 != 13: return None
+        for offset in range(1, 13):
+            if self.terms[month11 + offset] == self.terms[month11 + offset + 1]: return offset
+        return None
+    def newmoonyear(self, index) -> int:
+        """
+        This method returns the Gregorian year in which the lunar month with the given index starts.
+        """
+        return date.fromordinal(self.newmoons[index] - JDNOFFSET).year
+    def lunardate(self, day) -> tuple:
+        """
+        This method converts a Gregorian date to the Vietnamese lunar date.
+
+        Args:
+            day (date): The Gregorian date, within the years of the tables.
+
+        Returns:
+            tuple: (lunar year, lunar month, lunar day, leap), where leap tells whether the month is a leap month (tháng nhuận).
+        """
+        if not (self.first <= day.year <= self.last): raise ValueError(f"Year must be between {self.first} and {self.last}")
+        jdn = day.toordinal() + JDNOFFSET
+        index = bisect_right(self.newmoons, jdn) - 1 # The lunar month containing the day.
+        a11 = self.month11[day.year]
+        if a11 > index:
+            a11 = self.month11[day.year - 1]
+            lunaryear = day.year
+        else:
+            lunaryear = day.year + 1
+        diff = index - a11
+        leapoffset = self.leapmonth(a11)
+        leap = False
+        month = diff + 11
+        if leapoffset is not None and diff >= leapoffset:
+            month = diff + 10
+            leap = diff == leapoffset
+        if month > 12: month -= 12
+        if month >= 11 and diff < 4: lunaryear -= 1
+        return (lunaryear, month, jdn - self.newmoons[index] + 1, leap)
+    def tet(self, year) -> date:
+        """
+        This method calculates the date of Tết (the first day of the 1st lunar month) of a given lunar year.
+
+        Args:
+            year (int): The lunar year, i.e. the Gregorian year in which Tết falls.
+
+        Returns:
+            date: The date of Tết.
+        """
+        if not (self.first <= year <= self.last): raise ValueError(f"Year must be between {self.first} and {self.last}")
+        a11 = self.month11[year - 1]
+        leapoffset = self.leapmonth(a11)
+        diff = 3 if leapoffset is not None and leapoffset <= 2 else 2 # A leap 11th or 12th month delays Tết by one month.
+        return date.fromordinal(self.newmoons[a11 + diff] - JDNOFFSET)
+
+_default = None
+
+def default() -> LunisolarCalendar:
+    """
+    This function returns the shared LunisolarCalendar of the years 1000 to 3000, computing its tables on first use.
+    """
+    global _default
+    if _default is None: _default = LunisolarCalendar()
+    return _default
+
+def lunardate(day) -> tuple:
+    """
+    This function converts a Gregorian date to the Vietnamese lunar date (lunar year, month, day, leap), see `LunisolarCalendar.lunardate`.
+    """
+    return default().lunardate(day)
+
+def tet(year) -> date:
+    """
+    This function calculates the date of Tết of a given year, see `LunisolarCalendar.tet`.
+    """
+    return default().tet(year)
+
+def zodiac(day) -> str:
+    """
+    This function returns the Chinese Zodiac of a given date, by the lunar year of the date instead of the Gregorian year.
+    """
+    return str(YearInfo(lunardate(day)[0]).chinesezodiac)
+
+def tetreport(first, last, calendar = True) -> list:
+    """
+    This function reports how Tết meets Ash Wednesday and Lent for every year of a range.
+    The Tết holidays are counted from Tết's Eve (Giao thừa) to the 3rd day of Tết.
+
+    Args:
+        first (int): The first year of the report.
+        last (int): The last year of the report.
+        calendar (bool): Whether to return the date in the Gregorian calendar. Default is True (Gregorian calendar, but Julian Easter if before 1583).
+
+    Returns:
+        list: One dictionary per year with the keys year, tet, ashwednesday, days (from Ash Wednesday to Tết), holidaysonashwednesday (Ash Wednesday falls in the Tết holidays) and inlent (Tết falls in Lent).
+    """
+    report = []
+    for year in range(first, last + 1):
+        tetday = tet(year)
+        lent = Lent(year, calendar)
+        days = (tetday - lent.AshWednesday).days
+        report.append({
+            "year": year,
+            "tet": tetday,
+            "ashwednesday": lent.AshWednesday,
+            "days": days,
+            "holidaysonashwednesday": -2 <= days <= 1,
+            "inlent": lent.AshWednesday <= tetday < lent.easter,
+        })
+    return report
+
+if __name__ == "__main__":
+    # Testing program, printing Tết of a given year and the years of this century when Tết meets Lent.
+    year = 2026
+    day = date(year, 1, 20)
+    lunaryear, month, dom, leap = lunardate(day)
+    print(f"Tết {year}: {tet(year)}")
+    print(f"{day} is day {dom} of {'leap ' if leap else ''}month {month} of the lunar year {lunaryear} ({zodiac(day)}), not {YearInfo(year).chinesezodiac}.")
+    report = tetreport(2001, 2100)
+    for row in report:
+        if row["holidaysonashwednesday"] or row["inlent"]:
+            print(f"{row['year']}: Tết {row['tet']}, Ash Wednesday {row['ashwednesday']}{' (during the Tết holidays)' if row['holidaysonashwednesday'] else ''}{' (Tết in Lent)' if row['inlent'] else ''}")
+    print(f"Tết in Lent: {sum(row['inlent'] for row in report)} of {len(report)} years; Ash Wednesday in the Tết holidays: {sum(row['holidaysonashwednesday'] for row in report)}.")
@@ -0,0 +1,145 @@
+"""
+A Python module to generate the daily headings of the Roman Martyrology: the Roman date (Kalends, Nones and Ides) and the age of the moon of every day of a year, in Latin, English and Vietnamese.
+
+The headings are looked up, not computed day by day:
+- The Roman date of every day of a common year is precomputed once. In a leap year, the bissextile day is 24 February counted twice: 24 and 25 February are both the sixth Kalends of March, and 26 to 29 February are the days 25 to 28 February of a common year (`LEAPINDEX`).
+- The age of the moon of every day of a common year is precomputed once for every epact (`epact.AGES`, from the lunar calendar of the Gregorian Kalendarium). The bissextile day takes the moon of 24 February as it takes its Roman date.
+- The full headings of every (epact, day) are built once per language on first use, so a year of headings is 365 or 366 lookups.
+
+Usage:
+    python martyrology.py --years 2025 --languages la,en,vi
+"""
+
+import argparse
+from datetime import date, timedelta
+from functools import lru_cache
+from daynumber import isleap
+from epact import AGES, LEAPINDEX, epactrow as _epactrow
+from localization import catalog
+from liturgicalyear import yearrange
+
+MINYEAR = 1583 # The first year of the Gregorian epacts.
+MONTHDAYS = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+
+def _romandates() -> list:
+    """
+    This function lists the Roman date of every day of a common year, as (kind, count, month) with kind "kalends", "nones" or "ides", count 1 for the day itself and 2 for the day before (pridie), and month the month (1 to 12) of the Kalends, Nones or Ides.
+    """
+    dates = []
+    for month, days in enumerate(MONTHDAYS, 1):
+        nones = 7 if month in [3, 5, 7, 10] else 5
+        ides = nones + 8
+        for day in range(1, days + 1):
+            if day == 1: dates.append(("kalends", 1, month))
+            elif day <= nones: dates.append(("nones", nones - day + 1, month))
+            elif day <= ides: dates.append(("ides", ides - day + 1, month))
+            else: dates.append(("kalends", days - day + 2, month % 12 + 1)) # Counted inclusively to the Kalends of the next month.
+    return dates
+
+ROMANDATES = _romandates()
+
+MONTHS = {
+    "la": ["Ianuarii", "Februarii", "Martii", "Aprilis", "Maii", "Iunii", "Iulii", "Augusti", "Septembris", "Octobris", "Novembris", "Decembris"],
+    "en": list(catalog("en").months),
+    "vi": ["Janvier", "Février", "Mars", "Avril", "Mai", "Juin", "Juillet", "Août", "Septembre", "Octobre", "Novembre", "Décembre"], # As in Kalenda_VN.html.
+}
+# Ordinals of the days counted before the Kalends, Nones and Ides (3 to 19).
+COUNTS = {
+    "la": {3: "Tertio", 4: "Quarto", 5: "Quinto", 6: "Sexto", 7: "Septimo", 8: "Octavo", 9: "Nono", 10: "Decimo", 11: "Undecimo", 12: "Duodecimo", 13: "Tertio decimo", 14: "Quarto decimo", 15: "Quinto decimo", 16: "Sexto decimo", 17: "Septimo decimo", 18: "Duodevicesimo", 19: "Undevicesimo"},
+    "en": {count: catalog("en").moons[count - 1].capitalize() for count in range(3, 20)},
+    "vi": {count: "thứ " + word for count, word in enumerate(["ba", "tư", "năm", "sáu", "bảy", "tám", "chín", "mười", "mười một", "mười hai", "mười ba", "mười bốn", "mười lăm", "mười sáu", "mười bảy", "mười tám", "mười chín"], 3)},
+}
+# Language -> kind -> (the day itself, the day before, the days before with {count}), with {month}.
+FORMS = {
+    "la": {
+        "kalends": ("Kalendis {month}", "Pridie Kalendas {month}", "{count} Kalendas {month}"),
+        "nones": ("Nonis {month}", "Pridie Nonas {month}", "{count} Nonas {month}"),
+        "ides": ("Idibus {month}", "Pridie Idus {month}", "{count} Idus {month}"),
+    },
+    "en": {
+        "kalends": ("Kalends of {month}", "Day before the Kalends of {month}", "{count} Kalends of {month}"),
+        "nones": ("Nones of {month}", "Day before the Nones of {month}", "{count} Nones of {month}"),
+        "ides": ("Ides of {month}", "Day before the Ides of {month}", "{count} Ides of {month}"),
+    },
+    "vi": {
+        "kalends": ("Kalends tháng {month}", "áp Kalends tháng {month}", "{count} trước Kalends tháng {month}"),
+        "nones": ("Nones tháng {month}", "áp Nones tháng {month}", "{count} trước Nones tháng {month}"),
+        "ides": ("Ides tháng {month}", "áp Ides tháng {month}", "{count} trước Ides tháng {month}"),
+    },
+}
+LATINMOONS = ["prima", "secunda", "tertia", "quarta", "quinta", "sexta", "septima", "octava", "nona", "decima", "undecima", "duodecima", "tertia decima", "quarta decima", "quinta decima", "sexta decima", "septima decima", "duodevicesima", "undevicesima", "vicesima"] + ["vicesima " + moon for moon in ["prima", "secunda", "tertia", "quarta", "quinta", "sexta", "septima", "octava", "nona"]] + ["tricesima"]
+MOONS = {"la": LATINMOONS, "en": list(catalog("en").moons), "vi": list(catalog("vi").moons)}
+HEADINGS = {"la": "{date}. Luna {moon}.", "en": "The {date}, the {moon} day of the moon.", "vi": "Ngày {date}, nhằm {moon} âm lịch."}
+LANGUAGES = list(HEADINGS)
+
+def romandate(kind, count, month, language = "la") -> str:
+    """
+    This function formats a Roman date, see `_romandates`.
+    """
+    forms = FORMS[language][kind]
+    form = forms[0] if count == 1 else (forms[1] if count == 2 else forms[2])
+    return form.format(count = COUNTS[language].get(count), month = MONTHS[language][month - 1])
+
+@lru_cache(maxsize = None)
+def headingtable(language = "la") -> list:
+    """
+    This function builds the heading of every day of a common year for every epact in a language, once per process.
+
+    Returns:
+        list: One list of 365 headings per row of `AGES`.
+    """
+    if language not in HEADINGS: raise ValueError(f"Unknown language {language!r}, expected one of {', '.join(LANGUAGES)}")
+    dates = [romandate(*roman, language) for roman in ROMANDATES]
+    moons = MOONS[language]
+    template = HEADINGS[language]
+    return [[template.format(date = dates[day], moon = moons[age - 1]) for day, age in enumerate(row)] for row in AGES]
+
+def epactrow(year) -> int:
+    """
+    This function returns the row of `AGES` of a year: its epact, or `epact.BLACK25` for the black epact 25.
+    """
+    if year < MINYEAR: raise ValueError(f"The Gregorian epacts start in {MINYEAR}")
+    return _epactrow(year)
+
+def headings(year, language = "la") -> list:
+    """
+    This function generates the Martyrology headings of every day of a year.
+
+    Args:
+        year (int): The year (from 1583).
+        language (str): The language, "la" (Latin), "en" (English) or "vi" (Vietnamese). Default is "la".
+
+    Returns:
+        list: (date, heading) for every day of the year.
+    """
+    row = headingtable(language)[epactrow(year)]
+    indexes = LEAPINDEX if isleap(year) else range(365)
+    first = date(year, 1, 1)
+    return [(first + timedelta(days = day), row[index]) for day, index in enumerate(indexes)]
+
+def heading(day, language = "la") -> str:
+    """
+    This function returns the Martyrology heading of a day.
+    """
+    return headings(day.year, language)[day.timetuple().tm_yday - 1][1]
+
+def manyheadings(years, languages = None) -> dict:
+    """
+    This function generates the Martyrology headings of many years in many languages.
+
+    Returns:
+        dict: (year, language) -> headings, see `headings`.
+    """
+    languages = LANGUAGES if languages is None else languages
+    return {(year, language): headings(year, language) for year in years for language in languages}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Generate the daily headings of the Roman Martyrology.")
+    parser.add_argument("--years", type = yearrange, default = yearrange(str(date.today().year)), help = "year or year range (default: this year)")
+    parser.add_argument("--languages", default = ",".join(LANGUAGES), help = f"comma-separated languages (default: {','.join(LANGUAGES)})")
+    args = parser.parse_args()
+    languages = args.languages.split(",")
+    result = manyheadings(args.years, languages)
+    for year in args.years:
+        for index, (day, text) in enumerate(result[(year, languages[0])]):
+            print(f"{day}: " + " | ".join(result[(year, language)][index][1] for language in languages))
@@ -2,10 +2,11 @@
 A Module to calculate the dates of the Ordinary Time for any given year.
 """
 
-from datetime import date, timedelta
+from datetime import date
 from lent import Lent, SolemnitiesoftheLord
 from easter import easterdate
-from advent import Advent, getSunday
+from advent import Advent
+from daynumber import rd, todate, sunday, isleap
 
 class OrdinaryTime:
     """
@@ -54,10 +55,7 @@ class OrdinaryTime:
         Returns:
             date: The date of the Sunday of the given week.
         """
-        if prelent:
-            return getSunday(date(self.year - 1, 12, 31)) + timedelta(weeks = week)
-        else:
-            return getSunday(date(self.year, 3, 27)) + timedelta(weeks = week)
+        return todate(sundayrd(self.year, week, prelent))
     def bound(self) -> int:
         """
         This method calculates the bound of the given year
@@ -66,11 +64,7 @@ class OrdinaryTime:
         Returns:
             int: The bound of the given week.
         """
-        day = (self.easter - date(self.year, 3, 1)).days + 1
-        isleap = (self.year % 4 == 0 and self.year % 100 != 0) or (self.year % 400 == 0)
-        prelent = 4 + (day - (17 if isleap else 18)) // 7 # Week number before Lent
-        postpentecost = 6 + (day - 20) // 7 # Week number after Pentecost
-        return prelent, postpentecost
+        return boundrd(self.year, self.easter.toordinal())
     @property
     def max_week(self) -> int:
         """
@@ -101,6 +95,31 @@ class OrdinaryTime:
             date: The date of Christ the King.
         """
         return self.sunday(34)
+
+def sundayrd(year, week, prelent = False) -> int:
+    """
+    This function calculates the day number (Rata Die) of the Sunday of the given week of the Ordinary Time for any year, see `OrdinaryTime.sunday`.
+    """
+    if prelent:
+        return sunday(rd(year - 1, 12, 31)) + 7 * week
+    else:
+        return sunday(rd(year, 3, 27)) + 7 * week
+
+def boundrd(year, easter) -> tuple:
+    """
+    This function calculates the week numbers of the Ordinary Time before Ash Wednesday and after Pentecost for any year, see `OrdinaryTime.bound`.
+
+    Args:
+        year (int): The year.
+        easter (int): The Rata Die of Easter of the year.
+
+    Returns:
+        tuple: (the last week before Lent, the first week after Pentecost).
+    """
+    day = easter - rd(year, 3, 1) + 1
+    prelent = 4 + (day - (17 if isleap(year) else 18)) // 7 # Week number before Lent
+    postpentecost = 6 + (day - 20) // 7 # Week number after Pentecost
+    return prelent, postpentecost
         
 if __name__ == "__main__":
     # Testing program, testing all the dates of the Ordinary Time for any proleptic Gregorian calendar year.
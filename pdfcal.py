@@ -0,0 +1,733 @@
+"""
+A Python module to render printable wall calendars as PDF files, one page per month, with the Sundays, the celebrations and the liturgical colors of every day, and the `YearInfo` of the year in the header (golden number, epact, dominical letter, ...).
+
+The PDF is written in pure Python (zlib-compressed content streams), without any external service or package:
+- The text is set in a TrueType font, a regular and a bold face (the first pair of `FONTCANDIDATES` found in `FONTDIRS`, or given as `fonts`). Only the glyphs used by a calendar are embedded, as a subset of the font: a CIDFontType2 font with the Identity-H encoding (the glyph ids as 2-byte codes) and a ToUnicode CMap, so every script of the font (e.g. Vietnamese) is printed, and can be searched and copied. The text is measured and wrapped with the advance widths of its glyphs.
+- A font file is parsed once per process, and its subset is built once per set of glyphs (see `TrueTypeFace.subset`), so the calendars of a parish over many years share it.
+- Without a TrueType font, the text is set in the standard Helvetica and Helvetica-Bold fonts of every PDF viewer (see `WIDTHS`), which only cover WinAnsiEncoding (cp1252).
+- A text with characters missing from its font is rejected with a ValueError naming them, rather than printed with "?" or blank glyphs.
+- The static part of a month page (the weekday headings, the grid and the color legend) is a page template, drawn once per page size, language and fonts as a Form XObject shared by the 12 pages of a calendar, and cached per process.
+- Every day cell has a band of the liturgical color of the day (see `colors.colorarray`), the day of the month (in red on Sundays and solemnities) and the celebration of highest precedence of the day (see `store.PRECEDENCE`).
+The names of the months, of the weekdays and of the celebrations are taken from the message catalog of a language (see `localization.catalog`).
+A parish is a name printed on every page and a profile (see `liturgicalyear.PROFILES`). Many parishes and years are rendered in one batch by a process pool.
+
+Usage:
+    python pdfcal.py --years 2025-2027 --parish "Saint Mary=gregorian" --parish "Holy Cross=gregorian-ascension" --out calendars
+    python pdfcal.py --years 2026 --parish "Giáo xứ Đức Mẹ" --language vi --font NotoSans-Regular.ttf --boldfont NotoSans-Bold.ttf
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import time
+import unicodedata
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from functools import lru_cache
+from YearInfo import YearInfo
+from liturgicalyear import LiturgicalYear, PROFILES, yearrange
+from colors import colorarray, COLORHEX, COLORNAMES, REDGREEN, RED, GREEN, WHITE
+from store import PRECEDENCE
+from localization import catalog, languages
+
+PAGESIZES = {"a4": (842, 595), "letter": (792, 612)} # Landscape, in points.
+MARGIN = 36
+FONTKEYS = ["F1", "F2"] # The resource names of the regular and the bold face.
+STANDARDFONTS = {"F1": "Helvetica", "F2": "Helvetica-Bold"}
+# Font -> widths of the characters 32 to 126 in 1/1000 of the font size, from the Adobe font metrics of the standard fonts.
+WIDTHS = {
+    "F1": [278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278] + [556] * 10 + [278, 278, 584, 584, 584, 556, 1015,
+        667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611,
+        278, 278, 278, 469, 556, 333,
+        556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556, 556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500,
+        334, 260, 334, 584],
+    "F2": [278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278] + [556] * 10 + [333, 333, 584, 584, 584, 611, 975,
+        722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611,
+        333, 278, 333, 584, 556, 333,
+        556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611, 611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500,
+        389, 280, 389, 584],
+}
+OTHERWIDTH = 556 # Width of the characters outside 32 to 126 in the standard fonts (e.g. the middle dot, as in Latin-1).
+# Directories searched (with their subdirectories) for TrueType fonts, and the (regular, bold) file names tried in order.
+FONTDIRS = ["/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.fonts"), os.path.expanduser("~/.local/share/fonts"), "/Library/Fonts", "/System/Library/Fonts/Supplemental", os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts")]
+FONTCANDIDATES = [("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"), ("NotoSans-Regular.ttf", "NotoSans-Bold.ttf"), ("LiberationSans-Regular.ttf", "LiberationSans-Bold.ttf"), ("FreeSans.ttf", "FreeSansBold.ttf"), ("arial.ttf", "arialbd.ttf"), ("Arial.ttf", "Arial Bold.ttf")]
+SUNDAYRED = COLORHEX[RED]
+GREY = "#9CA3AF"
+
+def _rgb(hexcolor) -> str:
+    """
+    This function converts a hex color to the operands of the PDF color operators.
+    """
+    return " ".join(f"{int(hexcolor[index:index + 2], 16) / 255:.3g}" for index in (1, 3, 5))
+
+def _textstring(text) -> str:
+    """
+    This function encodes a text as a PDF text string (UTF-16BE with a byte order mark), for the document information.
+    """
+    return "<FEFF" + text.encode("utf-16-be").hex().upper() + ">"
+
+class StandardFace:
+    """
+    This class is a standard font of every PDF viewer (Helvetica or Helvetica-Bold), not embedded, in WinAnsiEncoding (cp1252).
+    """
+    path = None # Not a font file.
+    def __init__(self, key):
+        """
+        This method initializes the StandardFace class.
+
+        Args:
+            key (str): The font, see `STANDARDFONTS`.
+        """
+        self.name = STANDARDFONTS[key]
+        self.widths = WIDTHS[key]
+    def missing(self, text) -> list:
+        """
+        This method returns the characters of a text outside WinAnsiEncoding, in order of appearance.
+        """
+        result = []
+        for char in text:
+            try: char.encode("cp1252")
+            except UnicodeEncodeError:
+                if char not in result: result.append(char)
+        return result
+    def width(self, text) -> float:
+        """
+        This method measures a text in 1/1000 of the font size.
+        """
+        return sum(self.widths[ord(char) - 32] if 32 <= ord(char) <= 126 else OTHERWIDTH for char in text)
+    def operand(self, text) -> str:
+        """
+        This method encodes a text as the string operand of the text operators, with the delimiters escaped.
+        """
+        encoded = text.encode("cp1252").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+        return f"({encoded.decode('latin-1')})"
+    def fontobject(self, add, chars) -> int:
+        """
+        This method adds the font object to a PDF file, returning its object number.
+        """
+        return add(f"<< /Type /Font /Subtype /Type1 /BaseFont /{self.name} /Encoding /WinAnsiEncoding >>".encode())
+
+def _tables(data) -> dict:
+    """
+    This function splits a TrueType font file into its tables, by tag.
+    """
+    count = struct.unpack_from(">H", data, 4)[0]
+    tables = {}
+    for index in range(count):
+        tag, checksum, offset, length = struct.unpack_from(">4sIII", data, 12 + 16 * index)
+        tables[tag.decode("latin-1")] = data[offset:offset + length]
+    return tables
+
+def _cmap(table) -> dict:
+    """
+    This function reads the Unicode character map of a TrueType font (format 12, else format 4 for the Basic Multilingual Plane).
+
+    Returns:
+        dict: code point -> glyph id, without the unmapped code points.
+    """
+    count = struct.unpack_from(">H", table, 2)[0]
+    subtables = {}
+    for index in range(count):
+        platform, encoding, offset = struct.unpack_from(">HHI", table, 4 + 8 * index)
+        subtables[(platform, encoding)] = offset
+    for key in [(3, 10), (0, 6), (0, 4), (3, 1), (0, 3), (0, 2), (0, 1), (0, 0)]:
+        if key not in subtables: continue
+        offset = subtables[key]
+        mapping = {}
+        format = struct.unpack_from(">H", table, offset)[0]
+        if format == 12:
+            groups = struct.unpack_from(">I", table, offset + 12)[0]
+            for index in range(groups):
+                start, end, glyph = struct.unpack_from(">III", table, offset + 16 + 12 * index)
+                for code in range(start, end + 1): mapping[code] = glyph + code - start
+            return mapping
+        if format == 4:
+            segments = struct.unpack_from(">H", table, offset + 6)[0] // 2
+            ends = struct.unpack_from(f">{segments}H", table, offset + 14)
+            starts = struct.unpack_from(f">{segments}H", table, offset + 16 + 2 * segments)
+            deltas = struct.unpack_from(f">{segments}h", table, offset + 16 + 4 * segments)
+            rangestart = offset + 16 + 6 * segments
+            rangeoffsets = struct.unpack_from(f">{segments}H", table, rangestart)
+            for segment in range(segments):
+                for code in range(starts[segment], ends[segment] + 1):
+                    if code == 0xFFFF: continue
+                    if rangeoffsets[segment] == 0: glyph = (code + deltas[segment]) & 0xFFFF
+                    else:
+                        glyph = struct.unpack_from(">H", table, rangestart + 2 * segment + rangeoffsets[segment] + 2 * (code - starts[segment]))[0]
+                        if glyph: glyph = (glyph + deltas[segment]) & 0xFFFF
+                    if glyph: mapping[code] = glyph
+            return mapping
+    raise ValueError("The font has no Unicode character map")
+
+def _postscriptname(table, default) -> str:
+    """
+    This function reads the PostScript name of a TrueType font (name id 6) from its name table, keeping the characters allowed in a PDF name.
+    """
+    count, storage = struct.unpack_from(">HH", table, 2)
+    for index in range(count):
+        platform, encoding, language, nameid, length, offset = struct.unpack_from(">6H", table, 6 + 12 * index)
+        if nameid != 6: continue
+        raw = table[storage + offset:storage + offset + length]
+        name = re.sub(r"[^A-Za-z0-9-]", "", raw.decode("utf-16-be", "ignore") if platform in (0, 3) else raw.decode("latin-1"))
+        if name: return name
+    return re.sub(r"[^A-Za-z0-9-]", "", default) or "Font"
+
+def _components(glyph) -> list:
+    """
+    This function lists the glyph ids of the components of a composite glyph (none for a simple glyph).
+    """
+    if len(glyph) < 10 or struct.unpack_from(">h", glyph, 0)[0] >= 0: return []
+    components = []
+    position = 10
+    while True:
+        flags, component = struct.unpack_from(">HH", glyph, position)
+        components.append(component)
+        position += 4 + (4 if flags & 0x0001 else 2) # ARG_1_AND_2_ARE_WORDS
+        if flags & 0x0008: position += 2 # WE_HAVE_A_SCALE
+        elif flags & 0x0040: position += 4 # WE_HAVE_AN_X_AND_Y_SCALE
+        elif flags & 0x0080: position += 8 # WE_HAVE_A_TWO_BY_TWO
+        if not flags & 0x0020: return components # MORE_COMPONENTS
+
+def _checksum(data) -> int:
+    """
+    This function calculates the checksum of a table of a TrueType font.
+    """
+    data += b"\0" * (-len(data) % 4)
+    return sum(struct.unpack(f">{len(data) // 4}I", data)) & 0xFFFFFFFF
+
+def _sfnt(tables) -> bytes:
+    """
+    This function assembles a TrueType font file from its tables, by tag, with the table directory, the checksums and the checkSumAdjustment of the head table.
+    """
+    tags = sorted(tables)
+    power = 1 << (len(tags).bit_length() - 1) # The largest power of 2 not above the number of tables.
+    output = bytearray(struct.pack(">IHHHH", 0x00010000, len(tags), 16 * power, power.bit_length() - 1, 16 * (len(tags) - power)))
+    offset = 12 + 16 * len(tags)
+    offsets = {}
+    for tag in tags:
+        offsets[tag] = offset
+        output += struct.pack(">4sIII", tag.encode("latin-1"), _checksum(tables[tag]), offset, len(tables[tag]))
+        offset += len(tables[tag]) + (-len(tables[tag]) % 4)
+    for tag in tags: output += tables[tag] + b"\0" * (-len(tables[tag]) % 4)
+    struct.pack_into(">I", output, offsets["head"] + 8, (0xB1B0AFBA - _checksum(bytes(output))) & 0xFFFFFFFF)
+    return bytes(output)
+
+class TrueTypeFace:
+    """
+    This class is a TrueType font file, parsed once per process (see `truetype`), and embedded in the PDF files as subsets of its glyphs.
+    """
+    def __init__(self, path):
+        """
+        This method initializes the TrueTypeFace class, reading the metrics, the character map and the glyph locations of a font file, and raises a ValueError for a font collection, a font with PostScript outlines or a font whose license does not allow embedding it.
+
+        Args:
+            path (str): The path of the .ttf file.
+        """
+        with open(path, "rb") as file: data = file.read()
+        if data[:4] == b"ttcf": raise ValueError(f"{path}: font collections (.ttc) are not supported, give a .ttf file")
+        if data[:4] == b"OTTO": raise ValueError(f"{path}: OpenType fonts with PostScript outlines are not supported, give a TrueType font")
+        self.path = path
+        self.tables = _tables(data)
+        head, hhea = self.tables["head"], self.tables["hhea"]
+        self.unitsperem = struct.unpack_from(">H", head, 18)[0]
+        longloca = struct.unpack_from(">h", head, 50)[0] == 1
+        ascent, descent = struct.unpack_from(">hh", hhea, 4)
+        metrics = struct.unpack_from(">H", hhea, 34)[0]
+        self.numglyphs = struct.unpack_from(">H", self.tables["maxp"], 4)[0]
+        advances = list(struct.unpack_from(f">{2 * metrics}H", self.tables["hmtx"])[0::2]) # (advance width, left side bearing) pairs.
+        self.advances = advances + [advances[-1]] * (self.numglyphs - metrics) # The last advance width repeats.
+        loca = self.tables["loca"]
+        self.offsets = struct.unpack_from(f">{self.numglyphs + 1}I", loca) if longloca else [2 * offset for offset in struct.unpack_from(f">{self.numglyphs + 1}H", loca)]
+        self.cmap = _cmap(self.tables["cmap"])
+        self.name = _postscriptname(self.tables.get("name", b"\0" * 6), os.path.splitext(os.path.basename(path))[0])
+        os2 = self.tables.get("OS/2", b"")
+        self.fstype = struct.unpack_from(">H", os2, 8)[0] if len(os2) >= 10 else 0
+        if self.fstype & 0x000F == 2 or self.fstype & 0x0200: raise ValueError(f"{path}: the license of the font does not allow embedding it")
+        weight = struct.unpack_from(">H", os2, 4)[0] if len(os2) >= 6 else 400
+        capheight = struct.unpack_from(">h", os2, 88)[0] if len(os2) >= 90 and struct.unpack_from(">H", os2, 0)[0] >= 2 else ascent
+        post = self.tables.get("post", b"")
+        italicangle = struct.unpack_from(">i", post, 4)[0] / 65536 if len(post) >= 16 else 0
+        fixedpitch = len(post) >= 16 and struct.unpack_from(">I", post, 12)[0] != 0
+        flags = 32 | (1 if fixedpitch else 0) | (64 if italicangle else 0) # Nonsymbolic, FixedPitch, Italic.
+        bbox = " ".join(str(self.scale(value)) for value in struct.unpack_from(">4h", head, 36))
+        self.descriptor = f"/Flags {flags} /FontBBox [{bbox}] /ItalicAngle {italicangle:g} /Ascent {self.scale(ascent)} /Descent {self.scale(descent)} /CapHeight {self.scale(capheight)} /StemV {140 if weight >= 600 else 80}"
+    def scale(self, value) -> int:
+        """
+        This method converts a length in font units to 1/1000 of the font size.
+        """
+        return round(value * 1000 / self.unitsperem)
+    def glyph(self, gid) -> bytes:
+        """
+        This method returns the outline of a glyph, from the glyf table.
+        """
+        return self.tables["glyf"][self.offsets[gid]:self.offsets[gid + 1]]
+    def missing(self, text) -> list:
+        """
+        This method returns the characters of a text that have no glyph in the font, in order of appearance.
+        """
+        result = []
+        for char in text:
+            if ord(char) not in self.cmap and char not in result: result.append(char)
+        return result
+    def width(self, text) -> float:
+        """
+        This method measures a text in 1/1000 of the font size, with the advance widths of its glyphs.
+        """
+        return sum(self.advances[self.cmap.get(ord(char), 0)] for char in text) * 1000 / self.unitsperem
+    def operand(self, text) -> str:
+        """
+        This method encodes a text as the string operand of the text operators: the glyph ids as 2-byte codes (Identity-H).
+        """
+        return "<" + "".join(f"{self.cmap.get(ord(char), 0):04X}" for char in text) + ">"
+    @lru_cache(maxsize = 256)
+    def subset(self, glyphs) -> bytes:
+        """
+        This method builds the font file of a subset of the glyphs, once per set of glyphs. The outlines of the other glyphs are emptied, so the glyph ids are kept (CIDToGIDMap /Identity).
+        A font whose license does not allow subsetting it is embedded whole.
+
+        Args:
+            glyphs (frozenset of int): The glyph ids, to which the .notdef glyph and the components of the composite glyphs are added.
+
+        Returns:
+            bytes: The font file.
+        """
+        if self.fstype & 0x0100:
+            with open(self.path, "rb") as file: return file.read()
+        keep = {0} | set(glyphs)
+        stack = list(keep)
+        while stack:
+            for component in _components(self.glyph(stack.pop())):
+                if component not in keep:
+                    keep.add(component)
+                    stack.append(component)
+        glyf = bytearray()
+        loca = []
+        for gid in range(self.numglyphs):
+            loca.append(len(glyf))
+            if gid in keep: glyf += self.glyph(gid) + b"\0" * (-len(self.glyph(gid)) % 4)
+        loca.append(len(glyf))
+        head = bytearray(self.tables["head"])
+        struct.pack_into(">I", head, 8, 0) # checkSumAdjustment, set by `_sfnt`.
+        struct.pack_into(">h", head, 50, 1) # indexToLocFormat, long offsets.
+        tables = {tag: self.tables[tag] for tag in ["cvt ", "fpgm", "prep", "hhea", "hmtx", "maxp"] if tag in self.tables}
+        tables.update({"head": bytes(head), "loca": struct.pack(f">{len(loca)}I", *loca), "glyf": bytes(glyf)})
+        return _sfnt(tables)
+    @lru_cache(maxsize = 256)
+    def embedding(self, chars) -> tuple:
+        """
+        This method builds the embedded data of the subset of a set of characters, once per set of characters.
+
+        Args:
+            chars (frozenset of str): The characters.
+
+        Returns:
+            tuple: (the name of the subset, the compressed font file, its length, the widths of its glyphs as in the W array, the compressed ToUnicode CMap).
+        """
+        glyphs = {} # Glyph id -> character.
+        for char in sorted(chars): glyphs.setdefault(self.cmap.get(ord(char), 0), char)
+        glyphs.pop(0, None)
+        font = self.subset(frozenset(glyphs))
+        digest = hashlib.md5(repr(sorted(glyphs)).encode()).digest()
+        name = "".join(chr(65 + byte % 26) for byte in digest[:6]) + "+" + self.name # The tag of a subset, six capital letters.
+        widths = " ".join(f"{gid} [{self.scale(self.advances[gid])}]" for gid in sorted(glyphs))
+        mappings = [f"<{gid:04X}> <{char.encode('utf-16-be').hex().upper()}>" for gid, char in sorted(glyphs.items())]
+        blocks = [f"{len(mappings[index:index + 100])} beginbfchar\n" + "\n".join(mappings[index:index + 100]) + "\nendbfchar" for index in range(0, len(mappings), 100)] # At most 100 mappings per block.
+        cmap = "\n".join([
+            "/CIDInit /ProcSet findresource begin", "12 dict begin", "begincmap",
+            "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def", "/CMapName /Adobe-Identity-UCS def", "/CMapType 2 def",
+            "1 begincodespacerange", "<0000> <FFFF>", "endcodespacerange", *blocks,
+            "endcmap", "CMapName currentdict /CMap defineresource pop", "end", "end",
+        ])
+        return name, zlib.compress(font), len(font), widths, zlib.compress(cmap.encode("ascii"))
+    def fontobject(self, add, chars) -> int:
+        """
+        This method adds the objects of the subset of a set of characters to a PDF file (the Type0 font, its CIDFontType2 font, font descriptor, font file and ToUnicode CMap), returning the object number of the Type0 font.
+        """
+        name, font, length, widths, cmap = self.embedding(frozenset(chars))
+        fontfile = add(f"<< /Length {len(font)} /Length1 {length} /Filter /FlateDecode >>\nstream\n".encode() + font + b"\nendstream")
+        descriptor = add(f"<< /Type /FontDescriptor /FontName /{name} {self.descriptor} /FontFile2 {fontfile} 0 R >>".encode())
+        cidfont = add(f"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /{name} /CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> /FontDescriptor {descriptor} 0 R /DW {self.scale(self.advances[0])} /W [{widths}] /CIDToGIDMap /Identity >>".encode())
+        tounicode = add(f"<< /Length {len(cmap)} /Filter /FlateDecode >>\nstream\n".encode() + cmap + b"\nendstream")
+        return add(f"<< /Type /Font /Subtype /Type0 /BaseFont /{name} /Encoding /Identity-H /DescendantFonts [{cidfont} 0 R] /ToUnicode {tounicode} 0 R >>".encode())
+
+@lru_cache(maxsize = None)
+def truetype(path) -> TrueTypeFace:
+    """
+    This function parses a TrueType font file once per process.
+    """
+    return TrueTypeFace(path)
+
+@lru_cache(maxsize = None)
+def findfonts() -> tuple:
+    """
+    This function looks for the first pair of `FONTCANDIDATES` in `FONTDIRS`, once per process.
+
+    Returns:
+        tuple: (the path of the regular face, the path of the bold face), or None if no pair is found.
+    """
+    found = {}
+    for directory in FONTDIRS:
+        for root, directories, files in os.walk(directory):
+            for name in files: found.setdefault(name, os.path.join(root, name))
+    for regular, bold in FONTCANDIDATES:
+        if regular in found and bold in found: return (found[regular], found[bold])
+    return None
+
+@lru_cache(maxsize = None)
+def loadfaces(fonts = None) -> tuple:
+    """
+    This function loads the faces of the text, once per process.
+
+    Args:
+        fonts (tuple): (the regular, the bold) TrueType font files, None to look for them (see `findfonts`), or () for the standard Helvetica fonts. Default is None.
+
+    Returns:
+        tuple: The faces of `FONTKEYS`, `TrueTypeFace` or `StandardFace` if no TrueType font is given or found.
+    """
+    if fonts is None: fonts = findfonts() or ()
+    if not fonts: return tuple(StandardFace(key) for key in FONTKEYS)
+    return tuple(truetype(os.path.abspath(path)) for path in fonts)
+
+class Typesetter:
+    """
+    This class sets the text of one PDF file in its faces: it measures and wraps the text, checks that the faces can print it, and collects the characters set in every face, from which the font subsets are built.
+    """
+    def __init__(self, faces):
+        """
+        This method initializes the Typesetter class.
+
+        Args:
+            faces (tuple): The faces of `FONTKEYS`, see `loadfaces`.
+        """
+        self.faces = dict(zip(FONTKEYS, faces))
+        self.used = {key: set() for key in FONTKEYS}
+    def check(self, text, font = "F1"):
+        """
+        This method raises a ValueError naming the characters of a text that a face cannot print.
+        """
+        face = self.faces[font]
+        missing = face.missing(unicodedata.normalize("NFC", text))
+        if missing:
+            advice = ", give a TrueType font that covers them" if face.path is None else ""
+            raise ValueError(f"{text!r} has characters the font {face.name} cannot print: {' '.join(f'{char!r} (U+{ord(char):04X})' for char in missing)}{advice}")
+    def width(self, text, font = "F1", size = 10) -> float:
+        """
+        This method measures the width of a text in points.
+
+        Args:
+            text (str): The text.
+            font (str): The face, see `FONTKEYS`. Default is "F1" (regular).
+            size (float): The font size in points. Default is 10.
+        """
+        return self.faces[font].width(unicodedata.normalize("NFC", text)) * size / 1000
+    def text(self, x, y, text, font = "F1", size = 10, color = "#000000", align = "left") -> str:
+        """
+        This method returns the PDF operators drawing a line of text, its baseline starting (left), centered (center) or ending (right) at x.
+        """
+        text = unicodedata.normalize("NFC", text) # Precomposed characters, as mapped by the fonts.
+        self.check(text, font)
+        if align != "left": x -= self.width(text, font, size) / (2 if align == "center" else 1)
+        self.used[font].update(text)
+        return f"BT /{font} {size:g} Tf {_rgb(color)} rg {x:.2f} {y:.2f} Td {self.faces[font].operand(text)} Tj ET"
+    def wrap(self, text, width, font = "F1", size = 7, lines = 3) -> list:
+        """
+        This method wraps a text into lines of at most a given width, the last line ending with "..." if the text is cut.
+
+        Args:
+            text (str): The text.
+            width (float): The width of a line in points.
+            font (str): The face, see `FONTKEYS`. Default is "F1" (regular).
+            size (float): The font size in points. Default is 7.
+            lines (int): The maximum number of lines. Default is 3.
+        """
+        result = []
+        for word in text.split():
+            if result and self.width(f"{result[-1]} {word}", font, size) <= width: result[-1] += f" {word}"
+            else: result.append(word)
+        if len(result) > lines:
+            result = result[:lines]
+            while result[-1] and self.width(result[-1] + "...", font, size) > width: result[-1] = result[-1][:-1]
+            result[-1] += "..."
+        return result
+    def fontresources(self, add) -> str:
+        """
+        This method adds the fonts of the characters set so far to a PDF file, returning the entries of its /Font resource dictionary.
+        """
+        return " ".join(f"/{key} {face.fontobject(add, frozenset(self.used[key]))} 0 R" for key, face in self.faces.items())
+
+@lru_cache(maxsize = None)
+def layout(pagesize = "a4") -> dict:
+    """
+    This function calculates the geometry of the month pages of a page size, in points from the lower left corner.
+
+    Returns:
+        dict: width, height, the top of the weekday headings (headtop), the top of the grid (gridtop), the bottom of the grid (gridbottom), the size of a day cell (cellwidth, cellheight).
+    """
+    width, height = PAGESIZES[pagesize]
+    headtop = height - MARGIN - 72
+    gridtop = headtop - 16
+    gridbottom = MARGIN + 22 # Room for the legend.
+    return {"width": width, "height": height, "headtop": headtop, "gridtop": gridtop, "gridbottom": gridbottom, "cellwidth": (width - 2 * MARGIN) / 7, "cellheight": (gridtop - gridbottom) / 6}
+
+@lru_cache(maxsize = None)
+def template(pagesize = "a4", language = "en", faces = None) -> tuple:
+    """
+    This function draws the page template of a page size, language and faces once per process: the weekday headings, the grid of 7 x 6 day cells and the color legend.
+
+    Args:
+        pagesize (str): The page size, see `PAGESIZES`. Default is "a4".
+        language (str): The language of the weekday headings, see `localization.languages`. Default is "en".
+        faces (tuple): The faces of `FONTKEYS`, see `loadfaces`. Default is None (`loadfaces()`).
+
+    Returns:
+        tuple: (the zlib-compressed content stream of the template, dict of face -> the characters it sets).
+    """
+    typesetter = Typesetter(loadfaces() if faces is None else faces)
+    box = layout(pagesize)
+    left, right = MARGIN, box["width"] - MARGIN
+    operators = [f"0.5 w {_rgb(GREY)} RG"]
+    for column, name in enumerate(catalog(language).weekdays):
+        operators.append(typesetter.text(left + (column + 0.5) * box["cellwidth"], box["headtop"] - 12, name, "F2", 9, SUNDAYRED if column == 0 else "#000000", "center"))
+    for row in range(7):
+        y = box["gridtop"] - row * box["cellheight"]
+        operators.append(f"{left:.2f} {y:.2f} m {right:.2f} {y:.2f} l S")
+    for column in range(8):
+        x = left + column * box["cellwidth"]
+        operators.append(f"{x:.2f} {box['gridtop']:.2f} m {x:.2f} {box['gridbottom']:.2f} l S")
+    x = left
+    for code, name in enumerate(COLORNAMES):
+        operators.append(_swatch(x, MARGIN + 2, 14, 8, code))
+        operators.append(typesetter.text(x + 18, MARGIN + 3, name, "F1", 8))
+        x += 26 + typesetter.width(name, "F1", 8)
+    return zlib.compress("\n".join(operators).encode("latin-1")), {key: frozenset(chars) for key, chars in typesetter.used.items()}
+
+def _swatch(x, y, width, height, color) -> str:
+    """
+    This function returns the PDF operators filling a rectangle with a liturgical color code, Red+Green as two halves, White with an outline.
+    """
+    if color == REDGREEN:
+        return f"{_rgb(COLORHEX[RED])} rg {x:.2f} {y + height / 2:.2f} {width:.2f} {height / 2:.2f} re f {_rgb(COLORHEX[GREEN])} rg {x:.2f} {y:.2f} {width:.2f} {height / 2:.2f} re f"
+    return f"{_rgb(COLORHEX[color])} rg {x:.2f} {y:.2f} {width:.2f} {height:.2f} re " + ("B" if color == WHITE else "f")
+
+def _celebrations(year, flags) -> dict:
+    """
+    This function returns the celebration of highest precedence of every day of a calendar year with a celebration, as in `store.computedays`.
+
+    Returns:
+        dict: date -> (precedence, name).
+    """
+    best = {}
+    for day, name, season in LiturgicalYear(year, **flags).celebrations:
+        precedence = PRECEDENCE.get(name, 6) # Sundays of Ordinary Time
+        if day not in best or precedence < best[day][0]: best[day] = (precedence, name)
+    return best
+
+def monthpage(year, month, colors, celebrations, header, pagesize = "a4", typesetter = None, language = "en") -> str:
+    """
+    This function draws the variable part of a month page, over its template.
+
+    Args:
+        year (int): The calendar year.
+        month (int): The month (1 to 12).
+        colors (np.ndarray): The color codes of the year, see `colors.colorarray`.
+        celebrations (dict): The celebrations of the year, see `_celebrations`.
+        header (tuple): (the parish, the year info line).
+        pagesize (str): The page size, see `PAGESIZES`. Default is "a4".
+        typesetter (Typesetter): The typesetter of the PDF file. Default is None (a new typesetter of `loadfaces()`).
+        language (str): The language of the month and celebration names, see `localization.languages`. Default is "en".
+
+    Returns:
+        str: The PDF operators of the page.
+    """
+    typesetter = Typesetter(loadfaces()) if typesetter is None else typesetter
+    messages = catalog(language)
+    box = layout(pagesize)
+    parish, info = header
+    operators = ["q /Tpl Do Q", f"0.5 w {_rgb(GREY)} RG"]
+    top = box["height"] - MARGIN
+    monthname = messages.months[month - 1]
+    if parish: operators.append(typesetter.text(MARGIN, top - 11, parish, "F1", 11))
+    operators.append(typesetter.text(MARGIN, top - 42, f"{monthname[:1].upper()}{monthname[1:]} {year}", "F2", 26)) # Capitalized, e.g. "tháng 1" in Vietnamese.
+    operators.append(typesetter.text(box["width"] - MARGIN, top - 42, info, "F1", 8, "#4B5563", "right"))
+    newyear = date(year, 1, 1).toordinal()
+    first = date(year, month, 1)
+    days = (date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)).toordinal() - first.toordinal()
+    offset = (first.weekday() + 1) % 7 # Column of the first day, 0 = Sunday.
+    namewidth = box["cellwidth"] - 8
+    for dom in range(1, days + 1):
+        day = date(year, month, dom)
+        row, column = divmod(offset + dom - 1, 7) # At most 6 rows, as offset + 31 <= 37.
+        x = MARGIN + column * box["cellwidth"]
+        y = box["gridtop"] - row * box["cellheight"] # Top of the cell.
+        precedence, name = celebrations.get(day, (13, ""))
+        highlight = column == 0 or precedence <= 3
+        operators.append(_swatch(x + 1, y - 8, box["cellwidth"] - 2, 7, int(colors[day.toordinal() - newyear])))
+        operators.append(typesetter.text(x + 4, y - 22, str(dom), "F2", 13, SUNDAYRED if highlight else "#000000"))
+        font = "F2" if precedence <= 3 else "F1"
+        for line, text in enumerate(typesetter.wrap(messages.celebration(name) if name else "", namewidth, font, 7)):
+            operators.append(typesetter.text(x + 4, y - 32 - line * 8, text, font, 7))
+    return "\n".join(operators)
+
+def _pdf(pages, typesetter, pagetemplate, pagesize = "a4", title = "") -> bytes:
+    """
+    This function assembles a PDF file from the content streams of its pages, all drawn over the page template (see `template`), with the fonts of the typesetter embedded once.
+    """
+    box = layout(pagesize)
+    stream, templatechars = pagetemplate
+    for key, chars in templatechars.items(): typesetter.used[key] |= chars
+    objects = [] # The bodies of the objects 1, 2, ...
+    def add(body):
+        objects.append(body)
+        return len(objects)
+    root = add(b"") # Filled once the page tree is known.
+    tree = add(b"")
+    fontrefs = typesetter.fontresources(add)
+    resources = f"/Resources << /Font << {fontrefs} >> >>"
+    tpl = add(f"<< /Type /XObject /Subtype /Form /BBox [0 0 {box['width']} {box['height']}] {resources} /Filter /FlateDecode /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+    kids = []
+    for content in pages:
+        data = zlib.compress(content.encode("latin-1"))
+        contents = add(f"<< /Filter /FlateDecode /Length {len(data)} >>\nstream\n".encode() + data + b"\nendstream")
+        kids.append(add(f"<< /Type /Page /Parent {tree} 0 R /MediaBox [0 0 {box['width']} {box['height']}] /Resources << /Font << {fontrefs} >> /XObject << /Tpl {tpl} 0 R >> >> /Contents {contents} 0 R >>".encode()))
+    objects[root - 1] = f"<< /Type /Catalog /Pages {tree} 0 R >>".encode()
+    objects[tree - 1] = f"<< /Type /Pages /Kids [{' '.join(f'{kid} 0 R' for kid in kids)}] /Count {len(kids)} >>".encode()
+    info = add(f"<< /Title {_textstring(title)} /Producer (LiturgicalCalendar pdfcal.py) >>".encode())
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode() + b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root {root} 0 R /Info {info} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(output)
+
+def wallcalendar(year, profile = "gregorian", parish = "", pagesize = "a4", language = "en", fonts = None) -> bytes:
+    """
+    This function renders the wall calendar of a calendar year as a PDF file of 12 month pages, and raises a ValueError if the fonts cannot print the parish (see `Typesetter.check`).
+
+    Args:
+        year (int): The calendar year (2 to 9998).
+        profile (str): The profile, see `liturgicalyear.PROFILES`. Default is "gregorian".
+        parish (str): The name of the parish printed on every page. Default is none.
+        pagesize (str): The page size, see `PAGESIZES`. Default is "a4".
+        language (str): The language of the month, weekday and celebration names, see `localization.languages`. Default is "en".
+        fonts (tuple): (the regular, the bold) TrueType font files, see `loadfaces`. Default is None (found in `FONTDIRS`, else the standard Helvetica fonts).
+
+    Returns:
+        bytes: The PDF file.
+    """
+    if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+    if pagesize not in PAGESIZES: raise ValueError(f"Unknown page size {pagesize!r}, expected one of {', '.join(PAGESIZES)}")
+    catalog(language) # Fails for an unknown language.
+    faces = loadfaces(None if fonts is None else tuple(fonts))
+    typesetter = Typesetter(faces)
+    typesetter.check(parish) # Fails before anything is computed.
+    flags = PROFILES[profile]
+    colors = colorarray(year, **flags)
+    celebrations = _celebrations(year, flags)
+    info = YearInfo(year, flags["calendar"]).asdict()
+    line = " \xb7 ".join(f"{key}: {info[key]}" for key in ["Golden Number", "Epact", "Dominical Letter", "Martyrology Letter", "Solar Cycle", "Indiction"])
+    pages = [monthpage(year, month, colors, celebrations, (parish, line), pagesize, typesetter, language) for month in range(1, 13)]
+    return _pdf(pages, typesetter, template(pagesize, language, faces), pagesize, f"{parish} {year}".strip())
+
+def slug(name) -> str:
+    """
+    This function converts the name of a parish to a directory name without diacritics, e.g. "Saint Mary's, Springfield" to "saint-mary-s-springfield" and "Giáo xứ Đức Mẹ" to "giao-xu-duc-me".
+    """
+    plain = unicodedata.normalize("NFKD", name.replace("đ", "d").replace("Đ", "D")).encode("ascii", "ignore").decode("ascii") # Đ has no decomposition.
+    return re.sub(r"[^a-z0-9]+", "-", plain.lower()).strip("-") or "calendar"
+
+def _renderchunk(task) -> list:
+    """
+    This function renders the wall calendars of a chunk of years of one parish in a worker process.
+
+    Args:
+        task (tuple): (outdir, parish, profile, years, pagesize, language, fonts).
+
+    Returns:
+        list: The paths of the written files.
+    """
+    outdir, parish, profile, years, pagesize, language, fonts = task
+    directory = os.path.join(outdir, slug(parish))
+    os.makedirs(directory, exist_ok = True)
+    paths = []
+    for year in years:
+        path = os.path.join(directory, f"{year}.pdf")
+        with open(path, "wb") as file:
+            file.write(wallcalendar(year, profile, parish, pagesize, language, fonts))
+        paths.append(path)
+    return paths
+
+def render(parishes, years, outdir = "calendars", pagesize = "a4", workers = None, chunksize = 10, language = "en", fonts = None) -> dict:
+    """
+    This function renders the wall calendars of many parishes and years with a process pool.
+    The parishes are checked before any calendar is written: a ValueError is raised if the fonts cannot print a name or the catalog of the language (see `Typesetter.check`), or if two parishes would be written to the same directory (see `slug`).
+
+    Args:
+        parishes (list of tuple): The (name, profile) of every parish, see `liturgicalyear.PROFILES`.
+        years (iterable of int): The calendar years (2 to 9998).
+        outdir (str): The output directory, the calendars are written to `<outdir>/<slug of the parish>/<year>.pdf`. Default is "calendars".
+        pagesize (str): The page size, see `PAGESIZES`. Default is "a4".
+        workers (int): The number of worker processes. Default is the number of CPUs.
+        chunksize (int): The number of years of one parish rendered by one task. Default is 10.
+        language (str): The language of the month, weekday and celebration names, see `localization.languages`. Default is "en".
+        fonts (tuple): (the regular, the bold) TrueType font files, see `loadfaces`. Default is None (found in `FONTDIRS`, else the standard Helvetica fonts).
+
+    Returns:
+        dict: The statistics of the batch: calendars, pages and seconds.
+    """
+    start = time.perf_counter()
+    years = list(years)
+    faces = loadfaces(None if fonts is None else tuple(fonts))
+    fonts = tuple(face.path for face in faces) if faces[0].path else () # Found once, not by every worker.
+    typesetter = Typesetter(faces)
+    messages = catalog(language)
+    for text in [*messages.months, *messages.weekdays, *messages.names.values(), *(translation for pattern, translation in messages.patterns)]:
+        for key in FONTKEYS: typesetter.check(text, key)
+    directories = {} # Slug -> name of the parish written to it.
+    for name, profile in parishes:
+        if profile not in PROFILES: raise ValueError(f"Unknown profile {profile!r} of {name!r}, expected one of {', '.join(PROFILES)}")
+        typesetter.check(name)
+        directory = slug(name)
+        if directory in directories: raise ValueError(f"The parishes {directories[directory]!r} and {name!r} would both be written to {os.path.join(outdir, directory)!r}, rename one of them")
+        directories[directory] = name
+    tasks = [(outdir, name, profile, years[index:index + chunksize], pagesize, language, fonts) for name, profile in parishes for index in range(0, len(years), chunksize)]
+    calendars = 0
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        for future in as_completed([executor.submit(_renderchunk, task) for task in tasks]):
+            calendars += len(future.result())
+    return {"calendars": calendars, "pages": 12 * calendars, "seconds": round(time.perf_counter() - start, 3)}
+
+def parishlist(values, path = None) -> list:
+    """
+    This function parses the parishes given on the command line as "name=profile" (the profile defaults to "gregorian"), and in a JSON file of [{"name": ..., "profile": ...}, ...].
+    """
+    parishes = []
+    if path is not None:
+        with open(path, encoding = "utf-8") as file:
+            parishes += [(entry["name"], entry.get("profile", "gregorian")) for entry in json.load(file)]
+    for value in values:
+        name, _, profile = value.rpartition("=") if "=" in value else (value, "", "gregorian")
+        parishes.append((name, profile))
+    return parishes
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Render printable PDF wall calendars for many parishes and years.")
+    parser.add_argument("--years", type = yearrange, default = yearrange(str(date.today().year)), help = "year or year range, e.g. 2025-2030 (default: this year)")
+    parser.add_argument("--parish", action = "append", default = [], help = "parish as 'name=profile', repeatable (default profile: gregorian)")
+    parser.add_argument("--parishes", default = None, help = "JSON file of [{\"name\": ..., \"profile\": ...}, ...]")
+    parser.add_argument("--pagesize", choices = list(PAGESIZES), default = "a4", help = "page size (default: a4)")
+    parser.add_argument("--language", choices = languages(), default = "en", help = "language of the month, weekday and celebration names (default: en)")
+    parser.add_argument("--font", default = None, help = "TrueType font file of the text (default: the first pair of FONTCANDIDATES found, else Helvetica)")
+    parser.add_argument("--boldfont", default = None, help = "TrueType font file of the bold text (default: --font)")
+    parser.add_argument("--out", default = "calendars", help = "output directory (default: calendars)")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default: number of CPUs)")
+    args = parser.parse_args()
+    parishes = parishlist(args.parish, args.parishes) or [("", "gregorian")]
+    fonts = (args.font, args.boldfont or args.font) if args.font else None
+    print(render(parishes, args.years, args.out, args.pagesize, args.workers, language = args.language, fonts = fonts))
@@ -0,0 +1,143 @@
+"""
+A Python module to find the penitential days of every year in a region: the days of fasting and abstinence, the Ember Days and the Rogation Days.
+
+Every day of a calendar year is one uint8 bitset of the kinds of `KINDS`:
+- FAST, ABSTINENCE: Ash Wednesday and Good Friday are days of fasting and abstinence (canon 1251), and every Friday is a day of abstinence unless a solemnity falls on it (canon 1251), including the Fridays of Lent.
+- PENANCE: A Friday outside Lent where the conference of bishops allows abstinence to be replaced by another penance (canon 1253), e.g. in the United States and Canada (see `FRIDAYS`).
+- EMBER: The Ember Days, the Wednesday, Friday and Saturday after the First Sunday of Lent, after Pentecost, after the Exaltation of the Holy Cross (14 September) and after Saint Lucy (13 December).
+- ROGATION: The Minor Rogation Days, the Monday, Tuesday and Wednesday before the Ascension (Thursday).
+- GREATROGATION: The Greater Rogation of Saint Mark (25 April), on the Tuesday after Easter if it falls on Easter Sunday.
+The regions are those of `holydays.REGIONS` (with their transfer flags, e.g. of Epiphany that may fall on a Friday). The bitsets of every year and region are computed once with the day-number functions of the season modules and cached, and the range queries look them up.
+
+Usage:
+    penitentialdays(date(2025, 1, 1), date(2025, 12, 31), FAST)
+"""
+
+from datetime import date
+from functools import lru_cache
+import numpy as np
+from daynumber import rd, todate, weekday
+from lent import lentrd, eastertiderd
+from liturgicalyear import LiturgicalYear
+from holydays import REGIONS
+from store import PRECEDENCE
+
+FAST = 1
+ABSTINENCE = 2
+PENANCE = 4
+EMBER = 8
+ROGATION = 16
+GREATROGATION = 32
+KINDS = {"fast": FAST, "abstinence": ABSTINENCE, "penance": PENANCE, "ember": EMBER, "rogation": ROGATION, "greatrogation": GREATROGATION}
+
+# Region -> what the Fridays outside Lent are: ABSTINENCE, or PENANCE where the conference of bishops allows another penance.
+FRIDAYS = {"universal": ABSTINENCE, "usa": PENANCE, "canada": PENANCE}
+# The solemnities, which lift the Friday abstinence, and the solemnity missing from `LiturgicalYear.celebrations`.
+# All Souls shares the precedence of the solemnities but is not one, and does not lift the abstinence.
+SOLEMNITIES = {name for name, precedence in PRECEDENCE.items() if precedence == 3 and name != "All Souls"} | {"The Nativity of the Lord (Christmas)", "The Epiphany of the Lord", "Ascension of the Lord", "Pentecost Sunday", "Easter Sunday"}
+FIXEDSOLEMNITIES = [(6, 24)] # The Nativity of Saint John the Baptist
+
+def _after(number, day) -> int:
+    """
+    This function returns the Rata Die of the first given weekday (0 = Monday, ..., 6 = Sunday) strictly after a Rata Die.
+    """
+    return number + (day - weekday(number) - 1) % 7 + 1
+
+def emberrds(year, calendar = True) -> list:
+    """
+    This function lists the Rata Die of the 12 Ember Days of a calendar year, in chronological order.
+    """
+    lent = lentrd(year, calendar)
+    pentecost = eastertiderd(year, calendar)["pentecost"]
+    days = []
+    for wednesday in [_after(lent["FirstSunday"], 2), _after(pentecost, 2), _after(rd(year, 9, 14), 2), _after(rd(year, 12, 13), 2)]:
+        days += [wednesday, wednesday + 2, wednesday + 3] # Wednesday, Friday and Saturday
+    return days
+
+@lru_cache(maxsize = 1024)
+def yearbits(year, region = "universal") -> np.ndarray:
+    """
+    This function computes the penitential bitset of every day of a calendar year in a region, once per year and region.
+
+    Args:
+        year (int): The calendar year (1 to 9998).
+        region (str): The region, see `holydays.REGIONS`. Default is "universal".
+
+    Returns:
+        np.ndarray: The read-only uint8 bitsets of `KINDS`, index 0 is 1 January.
+    """
+    if region not in FRIDAYS: raise ValueError(f"Unknown region {region!r}, expected one of {', '.join(FRIDAYS)}")
+    flags = REGIONS[region][1]
+    start = rd(year, 1, 1)
+    bits = np.zeros(rd(year + 1, 1, 1) - start, dtype = np.uint8)
+    lent = lentrd(year, flags["calendar"])
+    easter = lent["EasterSunday"]
+    solemnities = {day.toordinal() for day, name, season in LiturgicalYear(year, **flags).celebrations if name in SOLEMNITIES}
+    solemnities |= {rd(year, month, day) for month, day in FIXEDSOLEMNITIES}
+    solemnities |= set(range(easter, easter + 8)) # The days of the Easter Octave are solemnities.
+    for friday in range(start + (4 - weekday(start)) % 7, start + len(bits), 7):
+        if friday in solemnities: continue
+        bits[friday - start] |= ABSTINENCE if lent["AshWednesday"] < friday < easter else FRIDAYS[region]
+    for number in [lent["AshWednesday"], lent["GoodFriday"]]:
+        bits[number - start] |= FAST | ABSTINENCE
+    for number in emberrds(year, flags["calendar"]): bits[number - start] |= EMBER
+    ascension = easter + 39 # The Thursday of the Ascension, as in the Roman Calendar before any transfer.
+    for number in range(ascension - 3, ascension): bits[number - start] |= ROGATION
+    mark = rd(year, 4, 25)
+    bits[(easter + 2 if mark == easter else mark) - start] |= GREATROGATION
+    bits.setflags(write = False)
+    return bits
+
+def rangebits(first, last, region = "universal") -> tuple:
+    """
+    This function returns the penitential bitsets of every day of a range of dates, from the cached bitsets of their years.
+
+    Args:
+        first (date): The first date.
+        last (date): The last date (included).
+        region (str): The region, see `holydays.REGIONS`. Default is "universal".
+
+    Returns:
+        tuple: (the Rata Die of the first date, the uint8 bitsets of every day of the range).
+    """
+    bits = np.concatenate([yearbits(year, region) for year in range(first.year, last.year + 1)])
+    offset = first.timetuple().tm_yday - 1
+    return first.toordinal(), bits[offset:offset + last.toordinal() - first.toordinal() + 1]
+
+def penitentialdays(first, last, kind = FAST | ABSTINENCE, region = "universal") -> list:
+    """
+    This function lists the days of a range of dates with any of the given kinds.
+
+    Args:
+        first (date): The first date.
+        last (date): The last date (included).
+        kind (int): The kinds of `KINDS`, combined with |. Default is FAST | ABSTINENCE.
+        region (str): The region, see `holydays.REGIONS`. Default is "universal".
+
+    Returns:
+        list: The dates, in chronological order.
+    """
+    start, bits = rangebits(first, last, region)
+    return [todate(start + int(index)) for index in np.flatnonzero(bits & kind)]
+
+def countdays(first, last, kind = FAST | ABSTINENCE, region = "universal") -> int:
+    """
+    This function counts the days of a range of dates with any of the given kinds, see `penitentialdays`.
+    """
+    return int(np.count_nonzero(rangebits(first, last, region)[1] & kind))
+
+def kinds(day, region = "universal") -> list:
+    """
+    This function lists the names of the kinds of `KINDS` of a day.
+    """
+    bits = int(yearbits(day.year, region)[day.timetuple().tm_yday - 1])
+    return [name for name, kind in KINDS.items() if bits & kind]
+
+if __name__ == "__main__":
+    # Testing program, printing the days of fasting, the Ember Days and the Rogation Days of a given year, and counting the Fridays of abstinence.
+    year = 2025
+    first, last = date(year, 1, 1), date(year, 12, 31)
+    for region in FRIDAYS:
+        print(f"--- {REGIONS[region][0]}: {countdays(first, last, ABSTINENCE, region)} days of abstinence, {countdays(first, last, PENANCE, region)} Fridays of penance ---")
+    for day in penitentialdays(first, last, FAST | EMBER | ROGATION | GREATROGATION):
+        print(f"{day:%a %d %b}: {', '.join(kinds(day))}")
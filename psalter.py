@@ -0,0 +1,110 @@
+"""
+A Python module to find the week of the four-week psalter of the Liturgy of the Hours (I to IV) of every day, and the proper office that overrides it.
+
+The psalter week follows the weeks of the seasons (see `classify.classify`), restarting with week I at the first Sunday of Advent, Lent and Easter:
+- Advent, Lent, Easter and Ordinary Time: Week n of the season takes the psalter week ((n - 1) mod 4) + 1, so the days after Ash Wednesday (week 0 of Lent) take week IV, Holy Week takes week II, and Ordinary Time resumes after Pentecost with the week of `OrdinaryTime`.
+- Christmastide: Week I from the Sunday after Christmas, then II, ... until the Baptism of the Lord.
+- The Paschal Triduum is in Holy Week (week II).
+The office of the solemnities and feasts, of the Paschal Triduum and of the Octaves of Christmas (to 1 January) and Easter (to the Second Sunday of Easter) is proper, and is returned as an override of the psalter (see `PROPERS`).
+The psalter of every calendar year and profile is computed once with `classify.classify` and the celebrations of `LiturgicalYear`, and cached, so a column of dates is looked up in the tables of its years.
+
+Usage:
+    week, proper = psalterweek(date(2025, 7, 14))
+"""
+
+from datetime import date
+from functools import lru_cache
+import numpy as np
+from daynumber import rd, sunday
+from easter import easterrd
+from liturgicalyear import LiturgicalYear, PROFILES
+from classify import classify, todaynumbers, EPOCH, CHRISTMAS, TRIDUUM
+from store import PRECEDENCE
+
+PSALTERWEEKS = ["I", "II", "III", "IV"] # Psalter week n is PSALTERWEEKS[n - 1].
+# Proper office id -> name, 0 is the psalter. The Sundays and Ash Wednesday (precedence 2 and 6) keep the psalter.
+PROPERS = ["", "Christmas Octave", "Easter Octave"] + [name for name, precedence in PRECEDENCE.items() if precedence not in [2, 6]] + ["The Nativity of the Lord (Christmas)", "The Epiphany of the Lord", "Ascension of the Lord", "Pentecost Sunday"]
+PROPERIDS = {name: id for id, name in enumerate(PROPERS)}
+CHRISTMASOCTAVE = PROPERIDS["Christmas Octave"]
+EASTEROCTAVE = PROPERIDS["Easter Octave"]
+
+@lru_cache(maxsize = 1024)
+def yeartable(year, profile = "gregorian") -> tuple:
+    """
+    This function computes the psalter of every day of a calendar year, once per year and profile.
+
+    Args:
+        year (int): The calendar year (1 to 9998).
+        profile (str): The profile, see `liturgicalyear.PROFILES`. Default is "gregorian".
+
+    Returns:
+        tuple: (the read-only uint8 psalter weeks (1 to 4), the read-only uint8 proper office ids of `PROPERS`), index 0 is 1 January.
+    """
+    flags = PROFILES[profile]
+    start = rd(year, 1, 1)
+    numbers = np.arange(start, rd(year + 1, 1, 1), dtype = np.int64)
+    seasons, weeks, years = classify((numbers - EPOCH).astype("datetime64[D]"), flags["calendar"], flags["epiphany_on_jan6th"])
+    psalter = (weeks.astype(np.int64) - 1) % 4 + 1
+    propers = np.zeros(numbers.shape, dtype = np.uint8)
+    # Christmastide: from the Sunday after the Christmas of the previous year (January) or of this year (December).
+    christmastide = seasons == CHRISTMAS
+    december = numbers >= rd(year, 12, 1)
+    anchor = np.where(december, sunday(rd(year, 12, 26)), sunday(rd(year - 1, 12, 26)))
+    psalter[christmastide] = ((numbers - anchor) // 7 % 4 + 1)[christmastide]
+    octave = christmastide & (numbers < np.where(december, rd(year + 1, 1, 2), rd(year, 1, 2)))
+    psalter[octave & (numbers < anchor)] = 1 # Before the Sunday after Christmas.
+    propers[octave] = CHRISTMASOCTAVE
+    psalter[seasons == TRIDUUM] = 2 # Holy Week
+    easter = easterrd(year, flags["calendar"])
+    propers[(numbers >= easter) & (numbers <= easter + 7)] = EASTEROCTAVE # Up to the octave day, the Second Sunday of Easter.
+    for day, name, season in LiturgicalYear(year, **flags).celebrations:
+        if name in PROPERIDS: propers[day.toordinal() - start] = PROPERIDS[name]
+    psalter = psalter.astype(np.uint8)
+    psalter.setflags(write = False)
+    propers.setflags(write = False)
+    return psalter, propers
+
+def psalterweek(day, profile = "gregorian") -> tuple:
+    """
+    This function returns the psalter week of a day, and its proper office if any.
+
+    Args:
+        day (date): The date (years 1 to 9998).
+        profile (str): The profile, see `liturgicalyear.PROFILES`. Default is "gregorian".
+
+    Returns:
+        tuple: (the psalter week, 1 to 4, the name of the proper office or None).
+    """
+    psalter, propers = yeartable(day.year, profile)
+    index = day.timetuple().tm_yday - 1
+    return int(psalter[index]), PROPERS[propers[index]] or None
+
+def psalterweeks(dates, profile = "gregorian") -> tuple:
+    """
+    This function is the batch variant of `psalterweek` for a column of dates (see `classify.classify`), looking every date up in the cached table of its year.
+
+    Returns:
+        tuple: (uint8 psalter weeks, 1 to 4, uint8 proper office ids of `PROPERS`), parallel to the dates, 0 and 0 for NaT.
+    """
+    days = np.asarray(dates, dtype = "datetime64[D]")
+    numbers, missing = todaynumbers(days)
+    weeks = np.zeros(days.shape, dtype = np.uint8)
+    propers = np.zeros(days.shape, dtype = np.uint8)
+    if missing.all(): return weeks, propers
+    valid = numbers[~missing]
+    years = days[~missing].astype("datetime64[Y]").astype(np.int64) + 1970
+    uniqueyears = np.unique(years)
+    tables = [yeartable(int(year), profile) for year in uniqueyears]
+    offsets = np.cumsum([0] + [len(psalter) for psalter, proper in tables])[:-1]
+    starts = np.array([rd(int(year), 1, 1) for year in uniqueyears], dtype = np.int64)
+    position = np.searchsorted(uniqueyears, years)
+    index = offsets[position] + valid - starts[position]
+    weeks[~missing] = np.concatenate([psalter for psalter, proper in tables])[index]
+    propers[~missing] = np.concatenate([proper for psalter, proper in tables])[index]
+    return weeks, propers
+
+if __name__ == "__main__":
+    # Testing program, printing the psalter week of the first days of a few seasons.
+    for day in [date(2024, 12, 1), date(2024, 12, 26), date(2024, 12, 29), date(2025, 1, 8), date(2025, 1, 13), date(2025, 3, 6), date(2025, 3, 9), date(2025, 4, 14), date(2025, 4, 18), date(2025, 4, 22), date(2025, 4, 27), date(2025, 6, 9), date(2025, 7, 14)]:
+        week, proper = psalterweek(day)
+        print(f"{day:%a %d %b %Y}: week {PSALTERWEEKS[week - 1]}" + (f" ({proper})" if proper else ""))
@@ -0,0 +1,176 @@
+"""
+A Python module to answer calendar coincidence questions over the years 1 to 9999, such as "all years where the Annunciation moves after Easter", "Christmas on a Sunday", "Saint Joseph transferred to Saturday" or "Easter on 25 April".
+
+The features of every year are computed once from the season classes of `lent.py` into a feature table (one column per feature), and every feature has an inverted index (value -> sorted list of years), so a query intersects a few lists and the next or previous occurrence is a binary search, without scanning the years.
+
+Weekdays are numbered as `date.weekday()`: 0 = Monday, ..., 5 = Saturday, 6 = Sunday. Dates are (month, day) tuples.
+
+Features:
+- easter: The date of Easter (converted to the Gregorian calendar as in `easterdate`).
+- ashwednesday: The date of Ash Wednesday.
+- christmasweekday: The weekday of Christmas (25 December).
+- josephweekday, josephtransferred: The weekday of Saint Joseph, and whether it is moved from 19 March.
+- annunciationweekday, annunciationtransferred, annunciationaftereaster: The weekday of the Annunciation, whether it is moved from 25 March, and whether it is moved after Easter.
+- easterscoincide: Whether the Gregorian and Julian Easter fall on the same day.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from easter import easterdate
+from lent import Lent, LentenEastertide_Holidays
+
+FIRSTYEAR = 1
+LASTYEAR = 9999
+
+class FeatureTable:
+    """
+    This class holds the feature table and the inverted indexes of the years 1 to 9999 (or a range of them).
+    """
+    def __init__(self, calendar = True, first = FIRSTYEAR, last = LASTYEAR):
+        """
+        This method initializes the FeatureTable class, computing the features of every year.
+
+        Args:
+            calendar (bool): Whether to return the date in the Gregorian calendar. Default is True (Gregorian calendar, but Julian Easter if before 1583).
+            first (int): The first year of the table. Default is 1.
+            last (int): The last year of the table. Default is 9999.
+        """
+        self.calendar = calendar
+        self.first = first
+        self.last = last
+        self.columns = {name: [] for name in ["easter", "ashwednesday", "christmasweekday", "josephweekday", "josephtransferred", "annunciationweekday", "annunciationtransferred", "annunciationaftereaster", "easterscoincide"]}
+        for year in range(first, last + 1):
+            lent = Lent(year, calendar)
+            holidays = LentenEastertide_Holidays(year, calendar)
+            joseph = holidays.SaintJoseph
+            annunciation = holidays.Annunciation
+            row = {
+                "easter": (lent.easter.month, lent.easter.day),
+                "ashwednesday": (lent.AshWednesday.month, lent.AshWednesday.day),
+                "christmasweekday": date(year, 12, 25).weekday(),
+                "josephweekday": joseph.weekday(),
+                "josephtransferred": joseph != date(year, 3, 19),
+                "annunciationweekday": annunciation.weekday(),
+                "annunciationtransferred": annunciation != date(year, 3, 25),
+                "annunciationaftereaster": annunciation > lent.easter,
+                "easterscoincide": lent.easter == easterdate(year, False),
+            }
+            for name, value in row.items(): self.columns[name].append(value)
+        self.indexes = {}
+    def feature(self, name, year):
+        """
+        This method returns the value of a feature of a given year.
+        """
+        return self.columns[name][year - self.first]
+    def index(self, name) -> dict:
+        """
+        This method returns the inverted index of a feature (value -> sorted tuple of years), building it on first use.
+        """
+        if name not in self.columns: raise KeyError(f"Unknown feature {name!r}, expected one of {', '.join(self.columns)}")
+        index = self.indexes.get(name)
+        if index is None:
+            lists = {}
+            for year, value in enumerate(self.columns[name], self.first):
+                lists.setdefault(value, []).append(year)
+            index = self.indexes[name] = {value: tuple(years) for value, years in lists.items()} # Tuples, so no caller can change the cached index.
+        return index
+    def _sequences(self, name, value) -> list:
+        """
+        This method returns the sorted tuples of years of the inverted index where a feature matches a filter value, or a predicate of the value (a callable), which is tested on the distinct values of the index only.
+        """
+        index = self.index(name)
+        if not callable(value): return [index.get(value, ())]
+        return [years for key, years in index.items() if value(key)]
+    def _matches(self, name, value) -> list:
+        """
+        This method returns the sorted years where a feature matches a filter value or predicate, see `_sequences`.
+        """
+        sequences = self._sequences(name, value)
+        if len(sequences) == 1: return list(sequences[0])
+        return sorted(year for years in sequences for year in years)
+    def years(self, **filters) -> list:
+        """
+        This method finds the years matching all the filters.
+
+        Args:
+            **filters: Feature name = value, or feature name = predicate of the value, e.g. christmasweekday = 6 or easter = lambda day: day >= (4, 20).
+
+        Returns:
+            list: The sorted matching years.
+        """
+        if not filters: return list(range(self.first, self.last + 1))
+        matches = sorted((self._matches(name, value) for name, value in filters.items()), key = len)
+        if len(matches) == 1: return matches[0] # A new list, never the cached index.
+        others = [set(years) for years in matches[1:]]
+        return [year for year in matches[0] if all(year in other for other in others)]
+    def count(self, **filters) -> int:
+        """
+        This method counts the years matching all the filters, see `years`.
+        """
+        return len(self.years(**filters))
+    def _search(self, year, filters, forward) -> int:
+        """
+        This method finds the nearest year after (forward) or before a given year matching all the filters, by binary searches in the cached inverted indexes, without building the list of matching years.
+        """
+        if not filters:
+            candidate = max(year + 1, self.first) if forward else min(year - 1, self.last)
+            return candidate if self.first <= candidate <= self.last else None
+        # The filter with the fewest years gives the candidates, the others are checked by binary search.
+        sequences = sorted((self._sequences(name, value) for name, value in filters.items()), key = lambda sequences: sum(len(years) for years in sequences))
+        def contains(years, candidate):
+            position = bisect_left(years, candidate)
+            return position < len(years) and years[position] == candidate
+        while True:
+            if forward:
+                candidates = [years[position] for years in sequences[0] for position in [bisect_right(years, year)] if position < len(years)]
+                year = min(candidates, default = None)
+            else:
+                candidates = [years[position - 1] for years in sequences[0] for position in [bisect_left(years, year)] if position > 0]
+                year = max(candidates, default = None)
+            if year is None or all(any(contains(years, year) for years in others) for others in sequences[1:]): return year
+    def next(self, year, **filters) -> int:
+        """
+        This method finds the first year after a given year matching all the filters, or None if there is none until the last year of the table.
+        """
+        return self._search(year, filters, True)
+    def previous(self, year, **filters) -> int:
+        """
+        This method finds the last year before a given year matching all the filters, or None if there is none since the first year of the table.
+        """
+        return self._search(year, filters, False)
+
+_tables = {}
+
+def table(calendar = True) -> FeatureTable:
+    """
+    This function returns the shared FeatureTable of the years 1 to 9999, computing it on first use.
+    """
+    if calendar not in _tables: _tables[calendar] = FeatureTable(calendar)
+    return _tables[calendar]
+
+def years(calendar = True, **filters) -> list:
+    """
+    This function finds the years from 1 to 9999 matching all the filters, see `FeatureTable.years`.
+    """
+    return table(calendar).years(**filters)
+
+def nextyear(year, calendar = True, **filters) -> int:
+    """
+    This function finds the first year after a given year matching all the filters, see `FeatureTable.next`.
+    """
+    return table(calendar).next(year, **filters)
+
+def previousyear(year, calendar = True, **filters) -> int:
+    """
+    This function finds the last year before a given year matching all the filters, see `FeatureTable.previous`.
+    """
+    return table(calendar).previous(year, **filters)
+
+if __name__ == "__main__":
+    # Testing program, answering a few coincidence questions around a given year.
+    year = 2025
+    print(f"Annunciation after Easter: {previousyear(year, annunciationaftereaster = True)} (previous), {nextyear(year, annunciationaftereaster = True)} (next), {len(years(annunciationaftereaster = True))} years in 1-9999.")
+    print(f"Christmas on a Sunday: next in {nextyear(year, christmasweekday = 6)}.")
+    print(f"Saint Joseph transferred to Saturday: next in {nextyear(year, josephtransferred = True, josephweekday = 5)}.")
+    print(f"Easter on 25 April: {', '.join(map(str, years(easter = (4, 25))[-5:]))} (last 5), next in {nextyear(year, easter = (4, 25))}.")
+    print(f"Gregorian and Julian Easter coincide with Easter in April 20 or later: next in {nextyear(year, easterscoincide = True, easter = lambda day: day >= (4, 20))}.")
@@ -0,0 +1,229 @@
+"""
+A Python module to give the historical civil date (Julian or Gregorian) of any day, country by country, alongside the proleptic Gregorian date used by the rest of the library.
+
+The rest of the library gives the civil date alongside the proleptic Gregorian one on request, through `dual` and `dualdays`: `easter.easterdate(year, country = ...)`, the `dualdates` method of the season classes and `LiturgicalYear.dualcelebrations`.
+
+Every country switched from the Julian to the Gregorian calendar on its own date (Rome on 15 October 1582, Britain on 14 September 1752, Russia on 14 February 1918, ...), and the reform is decided by date, not by year:
+- The computus of a year is Gregorian if the reform is in force on 21 March (the ecclesiastical equinox) of that year, so Easter 1582 is Julian in Rome (`easter` uses `year > 1582`).
+- The moon of Christmas is Gregorian if the reform is in force on 25 December, so Christmas 1582 is Gregorian in Rome (`Kalenda.ChristmasMoon` uses `year >= 1582`, see `epact.moonage`).
+- A year has the Julian dominical letter(s) before the reform and the Gregorian one(s) after it, so 1582 is GC in Rome (`YearInfo.dominicalletter`).
+The Orthodox churches kept the Julian Paschalion after the civil reform of their countries, so Easter stays Julian there.
+
+Days are counted as Rata Die (see `daynumber.py`), so the conversions work for any year. Years are astronomical (0 is 1 BC), and the civil year is taken to begin on 1 January (not 25 March, as in England before 1752).
+
+Usage:
+    python reform.py --country britain --years 1700-1800 --out history
+"""
+
+import argparse
+import os
+from daynumber import rd, fromrd, todate, weekday
+from easter import easterrd
+from weekday import dominicalletter as _dominicalletter, isleap as _isleap
+from liturgicalyear import yearrange
+
+# Country -> (name, first day of the Gregorian calendar, whether the church of the country adopted the Gregorian computus).
+REFORMS = {
+    "rome": ("Papal States, Italy, Spain, Portugal, Poland", (1582, 10, 15), True),
+    "france": ("France", (1582, 12, 20), True),
+    "austria": ("Austria, Bohemia, Moravia", (1584, 1, 17), True),
+    "hungary": ("Hungary", (1587, 11, 1), True),
+    "prussia": ("Duchy of Prussia", (1610, 9, 2), True),
+    "germany": ("Protestant Germany, Denmark, Norway", (1700, 3, 1), True),
+    "britain": ("Great Britain, Ireland and the colonies", (1752, 9, 14), True),
+    "sweden": ("Sweden, Finland", (1753, 3, 1), True),
+    "bulgaria": ("Bulgaria", (1916, 4, 14), False),
+    "russia": ("Russia", (1918, 2, 14), False),
+    "serbia": ("Serbia, Yugoslavia", (1919, 1, 28), False),
+    "romania": ("Romania", (1919, 4, 14), False),
+    "greece": ("Greece", (1923, 3, 1), False),
+}
+MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+
+def julianrd(year, month, day) -> int:
+    """
+    This function returns the Rata Die of a date in the Julian calendar.
+
+    Args:
+        year (int): The astronomical year (0 is 1 BC).
+        month (int): The month (1 to 12).
+        day (int): The day of the month.
+    """
+    y = year - 1
+    correction = 0 if month <= 2 else (-1 if year % 4 == 0 else -2)
+    return -2 + 365 * y + y // 4 + (367 * month - 362) // 12 + correction + day # 3 January 1 (Julian) is 1 January 1 (Gregorian), RD 1.
+
+def fromjulianrd(number) -> tuple:
+    """
+    This function converts a Rata Die to a date in the Julian calendar, as (year, month, day).
+    """
+    year = (4 * (number + 1) + 1464) // 1461
+    priordays = number - julianrd(year, 1, 1)
+    correction = 0 if number < julianrd(year, 3, 1) else (1 if year % 4 == 0 else 2)
+    month = (12 * (priordays + correction) + 373) // 367
+    return (year, month, number - julianrd(year, month, 1) + 1)
+
+# Country -> Rata Die of the first Gregorian day.
+REFORMRD = {country: rd(*reform[1]) for country, reform in REFORMS.items()}
+
+def isgregorian(number, country = "rome") -> bool:
+    """
+    This function checks if a given day (Rata Die) is counted in the Gregorian calendar in a country.
+    """
+    return number >= REFORMRD[country]
+
+def civildate(number, country = "rome") -> tuple:
+    """
+    This function returns the historical civil date of a given day (Rata Die) in a country.
+
+    Returns:
+        tuple: (year, month, day, gregorian), where gregorian tells whether the date is in the Gregorian (New Style) or Julian (Old Style) calendar.
+    """
+    if isgregorian(number, country): return (*fromrd(number), True)
+    return (*fromjulianrd(number), False)
+
+def fromcivildate(year, month, day, country = "rome") -> int:
+    """
+    This function returns the Rata Die of a historical civil date in a country, raising ValueError for the days dropped by the reform.
+    """
+    gregorian = rd(year, month, day)
+    if isgregorian(gregorian, country): return gregorian
+    julian = julianrd(year, month, day)
+    if isgregorian(julian, country): raise ValueError(f"{day} {MONTHS[month - 1]} {year} was dropped by the reform in {REFORMS[country][0]}")
+    return julian
+
+def formatdate(year, month, day) -> str:
+    """
+    This function formats a date as e.g. "14 September 1752".
+    """
+    return f"{day} {MONTHS[month - 1]} {year}"
+
+def dualdate(number, country = "rome") -> str:
+    """
+    This function formats a day (Rata Die) as its historical civil date alongside its proleptic Gregorian date, e.g. "2 September 1752 O.S. (13 September 1752 proleptic Gregorian)".
+    """
+    year, month, day, gregorian = civildate(number, country)
+    if gregorian: return f"{formatdate(year, month, day)} N.S."
+    return f"{formatdate(year, month, day)} O.S. ({formatdate(*fromrd(number))} proleptic Gregorian)"
+
+def dual(number, country = "rome") -> tuple:
+    """
+    This function returns a day (Rata Die) as its proleptic Gregorian date alongside its historical civil date in a country.
+
+    Returns:
+        tuple: (the proleptic Gregorian date, the civil date (year, month, day, gregorian), see `civildate`).
+    """
+    return todate(number), civildate(number, country)
+
+def dualdays(days, country = "rome") -> dict:
+    """
+    This function is the variant of `dual` for a dictionary of Rata Die, as returned by the day-number functions of the season modules (`lentrd`, `adventrd`, ...), keeping None as None.
+    """
+    return {name: None if number is None else dual(number, country) for name, number in days.items()}
+
+def eastercalendar(year, country = "rome") -> bool:
+    """
+    This function returns the `calendar` flag of the season classes for the historical Easter of a year in a country: True if the church of the country uses the Gregorian computus on 21 March of that year.
+    """
+    return REFORMS[country][2] and isgregorian(rd(year, 3, 21), country)
+
+def christmasgregorian(year, country = "rome") -> bool:
+    """
+    This function checks if Christmas of a year is counted in the Gregorian calendar in a country (for the moon of Christmas of the Kalenda).
+    """
+    return isgregorian(fromcivildate(year, 12, 25, country), country)
+
+def easter(year, country = "rome") -> dict:
+    """
+    This function calculates the historical Easter of a year in a country.
+
+    Returns:
+        dict: rd (the Rata Die), proleptic (the proleptic Gregorian date) and civil (the historical civil date, see `civildate`).
+    """
+    number = easterrd(year, eastercalendar(year, country))
+    return {"rd": number, "proleptic": fromrd(number), "civil": civildate(number, country)}
+
+def dominicalletter(year, country = "rome") -> str:
+    """
+    This function returns the historical dominical letter(s) of a year in a country: the Julian letter(s) of the days before the reform followed by the Gregorian letter(s) of the days after it (e.g. GC for 1582 in Rome, EDA for 1752 in Britain).
+    """
+    first = julianrd(year, 1, 1)
+    last = rd(year, 12, 31)
+    if isgregorian(first, country): return _dominicalletter(year, True)
+    if not isgregorian(last, country): return _dominicalletter(year, False)
+    reform = REFORMRD[country]
+    julian = _dominicalletter(year, False)
+    gregorian = _dominicalletter(year, True)
+    if _isleap(year, False) and julianrd(year, 2, 25) >= reform: julian = julian[0] # The leap day is after the reform.
+    if _isleap(year, True) and rd(year, 2, 25) <= reform: gregorian = gregorian[-1] # The leap day is before the reform.
+    return julian + gregorian
+
+def yearcalendar(year, country = "rome") -> list:
+    """
+    This function lists the days of a historical civil year (1 January to 31 December) in a country.
+
+    Returns:
+        list: (Rata Die, civil date) for every day, see `civildate`; the days dropped by the reform are missing.
+    """
+    first = julianrd(year, 1, 1)
+    if isgregorian(first, country): first = rd(year, 1, 1)
+    last = rd(year, 12, 31)
+    if not isgregorian(last, country): last = julianrd(year, 12, 31)
+    return [(number, civildate(number, country)) for number in range(first, last + 1)]
+
+def formatyear(year, country = "rome") -> str:
+    """
+    This function formats a historical civil year as a text calendar of 12 months, weeks starting on Monday.
+    """
+    months = {}
+    for number, (y, month, day, gregorian) in yearcalendar(year, country):
+        months.setdefault(month, []).append((number, day))
+    lines = [f"{year} ({REFORMS[country][0]})".center(20)]
+    for month, days in months.items():
+        lines += ["", f"{MONTHS[month - 1]} {year}".center(20), "Mo Tu We Th Fr Sa Su"]
+        cells = ["  "] * weekday(days[0][0]) + [f"{day:2d}" for number, day in days]
+        lines += [" ".join(cells[week:week + 7]) for week in range(0, len(cells), 7)]
+    return "\n".join(lines) + "\n"
+
+def historicalcalendars(years, country = "rome", directory = None) -> list:
+    """
+    This function generates the historical calendars of a country for many years, optionally writing them as text files.
+
+    Args:
+        years (iterable of int): The years.
+        country (str): The country, see `REFORMS`. Default is "rome".
+        directory (str): The directory to write `<country>/<year>.txt` to. Default is None (no files).
+
+    Returns:
+        list: One dictionary per year with the keys year, days (the number of days of the civil year), style ("julian", "gregorian" or "reform"), dominicalletter and easter (the historical civil date).
+    """
+    if directory is not None: os.makedirs(os.path.join(directory, country), exist_ok = True)
+    rows = []
+    for year in years:
+        days = yearcalendar(year, country)
+        styles = {days[0][1][3], days[-1][1][3]}
+        rows.append({
+            "year": year,
+            "days": len(days),
+            "style": "reform" if len(styles) == 2 else ("gregorian" if True in styles else "julian"),
+            "dominicalletter": dominicalletter(year, country),
+            "easter": easter(year, country)["civil"],
+        })
+        if directory is not None:
+            with open(os.path.join(directory, country, f"{year}.txt"), "w", encoding = "utf-8") as file:
+                file.write(formatyear(year, country))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Generate the historical civil calendars of a country.")
+    parser.add_argument("--country", default = "britain", choices = list(REFORMS), help = "country (default: britain)")
+    parser.add_argument("--years", type = yearrange, default = None, help = "year or year range (default: the reform year)")
+    parser.add_argument("--out", default = None, help = "directory of the text calendars (default: print the reform year only)")
+    args = parser.parse_args()
+    reformyear = REFORMS[args.country][1][0]
+    years = args.years or range(reformyear, reformyear + 1)
+    for row in historicalcalendars(years, args.country, args.out):
+        y, month, day, gregorian = row["easter"]
+        print(f"{row['year']}: {row['days']} days ({row['style']}), dominical letter {row['dominicalletter']}, Easter {formatdate(y, month, day)} {'N.S.' if gregorian else 'O.S.'}")
+    if args.out is None: print(formatyear(reformyear, args.country))
+    print(f"Last Julian day: {dualdate(REFORMRD[args.country] - 1, args.country)}, first Gregorian day: {dualdate(REFORMRD[args.country], args.country)}")
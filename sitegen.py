@@ -0,0 +1,241 @@
+"""
+A Python module to generate the static calendar pages (the calendar with the proclamations, the Lenten calendar, the Advent calendar and the printable year) for many years and profiles, from the library's own output.
+
+The pages are rendered from the `string.Template` files of the `templates` directory by a process pool.
+The build is incremental: the content hash of every page (its template and its data) is kept in `.manifest.json` of the output directory, and a page is only rewritten if its hash changed (or its file is gone).
+
+Usage:
+    python sitegen.py --years 1583-2082 --profiles all --out site
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, timedelta
+from functools import lru_cache
+from html import escape
+from string import Template
+from YearInfo import YearInfo
+from Noveritis import Noveritis
+from Kalenda import Kalenda
+from Exsultet import ExsultetText
+from lent import Lent
+from advent import Advent
+from liturgicalyear import LiturgicalYear, PROFILES, yearrange
+from colors import colorarray, COLORHEX, COLORNAMES, REDGREEN, RED, GREEN, WHITE, YELLOW, ROSE
+
+TEMPLATEDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+MANIFEST = ".manifest.json"
+MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+LIGHTCOLORS = {WHITE, YELLOW, ROSE} # Background colors that need dark text.
+
+def _background(color) -> str:
+    """
+    This function returns the CSS background of a liturgical color code, Red+Green is drawn as two halves.
+    """
+    if color == REDGREEN: return f"background: linear-gradient({COLORHEX[RED]} 50%, {COLORHEX[GREEN]} 50%); color: white;"
+    return f"background: {COLORHEX[color]}; color: {'#1f2937' if color in LIGHTCOLORS else 'white'};"
+
+def _daycells(first, last, colors, names, indent = "        ") -> str:
+    """
+    This function renders the days from `first` to `last` (inclusive) as cells of a 7-column grid starting on Sunday.
+    """
+    newyear = date(first.year, 1, 1)
+    cells = [f'{indent}<div></div>'] * ((first.weekday() + 1) % 7) # Empty cells before the first day.
+    day = first
+    while day <= last:
+        color = int(colors[(day - newyear).days])
+        name = names.get(day, "")
+        cells.append(f'{indent}<div class="day"><span class="swatch" style="{_background(color)}" title="{COLORNAMES[color]}"></span>{day:%a} {day.day} {MONTHS[day.month - 1][:3]}<br><span class="name">{escape(name)}</span></div>')
+        day += timedelta(days = 1)
+    return "\n".join(cells)
+
+def calendarpage(year, profile) -> dict:
+    """
+    This function returns the data of the calendar page: the year info, the feasts and Sundays, and the three proclamations.
+    """
+    flags = PROFILES[profile]
+    info = YearInfo(year, flags["calendar"]).asdict()
+    celebrations = LiturgicalYear(year, **flags).celebrations
+    return {
+        "year": str(year),
+        "profile": profile,
+        "yearinfo": "\n".join(f"                <tr><td>{escape(key)}:</td><td><b>{escape(value)}</b></td></tr>" for key, value in info.items()),
+        "celebrations": "\n".join(f'                <tr class="season-{season}"><td>{escape(name)}</td><td>{day:%A}, {MONTHS[day.month - 1]} {day.day}</td></tr>' for day, name, season in celebrations),
+        "noveritis": escape(Noveritis(year, flags["calendar"], flags["ascensionThursday"], flags["corpusChristionThursday"]).text),
+        "exsultet": escape(ExsultetText()),
+        "kalenda": escape(Kalenda(year).text),
+    }
+
+def lentpage(year, profile) -> dict:
+    """
+    This function returns the data of the Lenten calendar page: every day from Ash Wednesday to Easter Sunday.
+    """
+    flags = PROFILES[profile]
+    lent = Lent(year, flags["calendar"])
+    names = {day: name for day, name, season in LiturgicalYear(year, **flags).celebrations}
+    return {
+        "year": str(year),
+        "profile": profile,
+        "ashwednesday": f"{MONTHS[lent.AshWednesday.month - 1]} {lent.AshWednesday.day}",
+        "easter": f"{MONTHS[lent.easter.month - 1]} {lent.easter.day}",
+        "days": _daycells(lent.AshWednesday, lent.easter, colorarray(year, **flags), names),
+    }
+
+def adventpage(year, profile) -> dict:
+    """
+    This function returns the data of the Advent calendar page: every day from the First Sunday of Advent to Christmas Eve, and the 24 doors.
+    """
+    flags = PROFILES[profile]
+    firstsunday = Advent(year + 1).firstSunday # Advent of this calendar year is of the next liturgical year.
+    names = {day: name for day, name, season in LiturgicalYear(year, **flags).celebrations}
+    return {
+        "year": str(year),
+        "profile": profile,
+        "firstsunday": f"{MONTHS[firstsunday.month - 1]} {firstsunday.day}",
+        "days": _daycells(firstsunday, date(year, 12, 24), colorarray(year, **flags), names),
+        "doors": "\n".join(f'        <div class="door">{day}</div>' for day in range(1, 25)),
+    }
+
+def yearpage(year, profile) -> dict:
+    """
+    This function returns the data of the printable year page: 12 month grids colored by the liturgical color of the day, with the year info as header.
+    """
+    flags = PROFILES[profile]
+    colors = colorarray(year, **flags)
+    names = {day: name for day, name, season in LiturgicalYear(year, **flags).celebrations}
+    info = YearInfo(year, flags["calendar"]).asdict()
+    newyear = date(year, 1, 1)
+    months = []
+    for month in range(1, 13):
+        first = date(year, month, 1)
+        last = date(year + 1, 1, 1) - timedelta(days = 1) if month == 12 else date(year, month + 1, 1) - timedelta(days = 1)
+        cells = ["<td></td>"] * ((first.weekday() + 1) % 7)
+        for dom in range(1, last.day + 1):
+            day = date(year, month, dom)
+            name = names.get(day)
+            label = f'<b title="{escape(name)}">{dom}</b>' if name else str(dom)
+            cells.append(f'<td style="{_background(int(colors[(day - newyear).days]))}">{label}</td>')
+        rows = ["<tr>" + "".join(cells[week:week + 7]) + "</tr>" for week in range(0, len(cells), 7)]
+        months.append(f'        <div><h2>{MONTHS[month - 1]}</h2><table><tr><th>Su</th><th>Mo</th><th>Tu</th><th>We</th><th>Th</th><th>Fr</th><th>Sa</th></tr>{"".join(rows)}</table></div>')
+    return {
+        "year": str(year),
+        "profile": profile,
+        "yearinfo": " &middot; ".join(f"{escape(key)}: <b>{escape(value)}</b>" for key, value in info.items()),
+        "months": "\n".join(months),
+    }
+
+# Page name -> data function, the template of a page is `templates/<page>.html`.
+PAGES = {
+    "calendar": calendarpage,
+    "lent": lentpage,
+    "advent": adventpage,
+    "year": yearpage,
+}
+
+@lru_cache(maxsize = None)
+def _template(templatedir, page) -> Template:
+    """
+    This function loads a page template once per process.
+    """
+    with open(os.path.join(templatedir, f"{page}.html"), encoding = "utf-8") as file:
+        return Template(file.read())
+
+def _templatehashes(templatedir, pages) -> dict:
+    """
+    This function returns the content hash of every page template.
+    """
+    hashes = {}
+    for page in pages:
+        with open(os.path.join(templatedir, f"{page}.html"), "rb") as file:
+            hashes[page] = hashlib.sha256(file.read()).hexdigest()
+    return hashes
+
+def _buildchunk(task) -> tuple:
+    """
+    This function renders the pages of a chunk of years of one profile in a worker process.
+    A page is only written if the hash of its template and data differs from the previous build (or its file is missing).
+
+    Args:
+        task (tuple): (outdir, templatedir, profile, years, pages, templatehashes, previous), where previous maps the relative paths of the pages to their hashes in the previous build.
+
+    Returns:
+        tuple: (hashes, written), the hashes of all the pages of the chunk and the number of pages written.
+    """
+    outdir, templatedir, profile, years, pages, templatehashes, previous = task
+    hashes = {}
+    written = 0
+    for year in years:
+        for page in pages:
+            relpath = f"{profile}/{year}/{page}.html"
+            data = PAGES[page](year, profile)
+            digest = hashlib.sha256((templatehashes[page] + json.dumps(data, sort_keys = True)).encode()).hexdigest()
+            hashes[relpath] = digest
+            path = os.path.join(outdir, relpath)
+            if previous.get(relpath) == digest and os.path.exists(path): continue
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+            with open(path, "w", encoding = "utf-8") as file:
+                file.write(_template(templatedir, page).substitute(data))
+            written += 1
+    return hashes, written
+
+def build(years, profiles = None, outdir = "site", templatedir = TEMPLATEDIR, pages = None, workers = None, chunksize = 25, force = False) -> dict:
+    """
+    This function builds the pages of many years and profiles incrementally with a process pool.
+
+    Args:
+        years (iterable of int): The calendar years to build (2 to 9998).
+        profiles (list of str): The profiles to build, see `liturgicalyear.PROFILES`. Default is all profiles.
+        outdir (str): The output directory, the pages are written to `<outdir>/<profile>/<year>/<page>.html`. Default is "site".
+        templatedir (str): The directory of the page templates. Default is the `templates` directory next to this module.
+        pages (list of str): The pages to build, see `PAGES`. Default is all pages.
+        workers (int): The number of worker processes. Default is the number of CPUs.
+        chunksize (int): The number of years of one profile rendered by one task. Default is 25.
+        force (bool): Whether to rewrite every page of the build regardless of its hash in the manifest (the hashes of the other pages are kept). Default is False.
+
+    Returns:
+        dict: The statistics of the build: pages, written, skipped and seconds.
+    """
+    start = time.perf_counter()
+    years = list(years)
+    profiles = list(PROFILES) if profiles is None else list(profiles)
+    pages = list(PAGES) if pages is None else list(pages)
+    manifestpath = os.path.join(outdir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifestpath): # Also when forced, so the pages outside this build keep their hashes.
+        with open(manifestpath, encoding = "utf-8") as file:
+            manifest = json.load(file)
+    templatehashes = _templatehashes(templatedir, pages)
+    tasks = []
+    for profile in profiles:
+        for index in range(0, len(years), chunksize):
+            chunk = years[index:index + chunksize]
+            previous = {f"{profile}/{year}/{page}.html": None if force else manifest.get(f"{profile}/{year}/{page}.html") for year in chunk for page in pages}
+            tasks.append((outdir, templatedir, profile, chunk, pages, templatehashes, previous))
+    written = 0
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        for future in as_completed([executor.submit(_buildchunk, task) for task in tasks]):
+            hashes, count = future.result()
+            manifest.update(hashes)
+            written += count
+    os.makedirs(outdir, exist_ok = True)
+    with open(manifestpath + ".tmp", "w", encoding = "utf-8") as file:
+        json.dump(manifest, file, sort_keys = True)
+    os.replace(manifestpath + ".tmp", manifestpath) # Atomic, so an interrupted build never leaves a broken manifest.
+    total = len(years) * len(profiles) * len(pages)
+    return {"pages": total, "written": written, "skipped": total - written, "seconds": round(time.perf_counter() - start, 3)}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Generate the static calendar pages for many years and profiles.")
+    parser.add_argument("--years", type = yearrange, default = yearrange(str(date.today().year)), help = "year or year range, e.g. 1583-2082 (default: this year)")
+    parser.add_argument("--profiles", default = "all", help = f"comma-separated profiles or 'all' (available: {', '.join(PROFILES)})")
+    parser.add_argument("--pages", default = ",".join(PAGES), help = "comma-separated pages (default: all)")
+    parser.add_argument("--out", default = "site", help = "output directory (default: site)")
+    parser.add_argument("--workers", type = int, default = None, help = "number of worker processes (default: number of CPUs)")
+    parser.add_argument("--force", action = "store_true", help = "rebuild every page")
+    args = parser.parse_args()
+    profiles = None if args.profiles == "all" else args.profiles.split(",")
+    print(build(args.years, profiles, args.out, pages = args.pages.split(","), workers = args.workers, force = args.force))
@@ -0,0 +1,239 @@
+"""
+A Python module to keep the daily calendar of many years and many profiles in memory as a compact struct-of-arrays, for servers keeping centuries of calendars hot.
+
+Every day of every profile is stored as a few small integers in parallel NumPy arrays (one row per profile, one column per day from 1 January of the first year), instead of Python objects:
+- season (uint8): The season code of `classify.SEASONS`.
+- week (uint8): The week of the season, see `classify.classify`.
+- celebration (uint16): The id of the celebration of the day in the fixed interned name table `NAMES` (0 for none).
+- color (uint8): The color code of `colors.COLORNAMES`.
+- rank (uint8): The precedence of the day in the Table of Liturgical Days (1 = the Paschal Triduum, ..., 13 = the weekdays of Ordinary Time), see `RANKS`.
+So a day costs BYTESPERDAY = 6 bytes per profile, about 2.2 kB per year and 7 MB for 200 years of the 16 profiles, plus the name table (`NAMES`, shared by every profile and every process).
+`Day` objects are only created on access, as `__slots__` views of one column of the arrays.
+
+Usage:
+    store = CalendarStore(1900, 2100)
+    store.day(date(2025, 4, 20), "gregorian").celebration
+"""
+
+import sys
+from datetime import date
+import numpy as np
+from daynumber import rd, todate
+from liturgicalyear import LiturgicalYear, PROFILES
+from colors import colorarray, COLORNAMES
+from classify import classify, EPOCH, SEASONS, ADVENT, CHRISTMAS, LENT, TRIDUUM, EASTER
+
+BYTESPERDAY = 6 # season + week + celebration + color + rank, per profile.
+FIELDS = {"season": np.uint8, "week": np.uint8, "celebration": np.uint16, "color": np.uint8, "rank": np.uint8}
+
+# Precedence -> description, from the Table of Liturgical Days (only the levels used by the calendar).
+RANKS = {
+    1: "Paschal Triduum",
+    2: "Christmas, Epiphany, Ascension and Pentecost, Sundays of Advent, Lent and Easter, Ash Wednesday, weekdays of Holy Week, days of the Easter Octave",
+    3: "Solemnities, All Souls",
+    5: "Feasts of the Lord",
+    6: "Sundays of Christmastide and Ordinary Time",
+    9: "Weekdays of Advent from 17 December, days of the Christmas Octave, weekdays of Lent",
+    13: "Other weekdays",
+}
+# Celebration -> precedence, the Sundays of Ordinary Time are 6.
+PRECEDENCE = {
+    "Maundy Thursday": 1, "Good Friday": 1, "Holy Saturday": 1, "Easter Sunday": 1,
+    "The Nativity of the Lord (Christmas)": 2, "The Epiphany of the Lord": 2, "Ascension of the Lord": 2, "Pentecost Sunday": 2, "Ash Wednesday": 2,
+    "First Sunday of Advent": 2, "Second Sunday of Advent": 2, "Third Sunday of Advent (Gaudete)": 2, "Fourth Sunday of Advent": 2,
+    "First Sunday of Lent": 2, "Second Sunday of Lent": 2, "Third Sunday of Lent": 2, "Fourth Sunday of Lent (Laetare)": 2, "Fifth Sunday of Lent": 2, "Palm Sunday of the Passion of the Lord": 2,
+    "Divine Mercy Sunday": 2, "Third Sunday of Easter": 2, "Fourth Sunday of Easter": 2, "Fifth Sunday of Easter": 2, "Sixth Sunday of Easter": 2, "Seventh Sunday of Easter": 2,
+    "Solemnity of Mary, Mother of God": 3, "Saint Joseph, Spouse of the Blessed Virgin Mary": 3, "The Annunciation of the Lord": 3, "The Most Holy Trinity": 3, "Corpus Christi": 3, "The Most Sacred Heart of Jesus": 3,
+    "Saints Peter and Paul, Apostles": 3, "The Assumption of the Blessed Virgin Mary": 3, "All Saints": 3, "All Souls": 3, "Our Lord Jesus Christ, King of the Universe": 3, "Immaculate Conception": 3,
+    "The Baptism of the Lord": 5, "The Presentation of the Lord": 5, "The Transfiguration of the Lord": 5, "The Exaltation of the Holy Cross": 5, "The Dedication of the Lateran Basilica": 5, "The Holy Family": 5,
+    "Second Sunday after Christmas": 6,
+}
+# Celebration id -> name, 0 is no celebration. The table is fixed, so the ids are the same in every process.
+NAMES = [sys.intern(name) for name in [""] + list(PRECEDENCE) + [f"Sunday {week} of Ordinary Time" for week in range(2, 34)]]
+NAMEIDS = {name: id for id, name in enumerate(NAMES)}
+
+def dayranks(numbers, seasons, weeks) -> np.ndarray:
+    """
+    This function calculates the precedence of days without a celebration from their season, see `RANKS`.
+
+    Args:
+        numbers (np.ndarray): The Rata Die of the days.
+        seasons, weeks (np.ndarray): Their seasons and weeks, see `classify.classify`.
+    """
+    dates = (numbers - EPOCH).astype("datetime64[D]")
+    monthday = (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
+    december = (dates.astype("datetime64[M]").astype(np.int64) % 12) == 11
+    sunday = (numbers - 1) % 7 == 6
+    ranks = np.full(numbers.shape, 13, dtype = np.uint8)
+    ranks[(seasons == ADVENT) & december & (monthday >= 17)] = 9
+    ranks[(seasons == CHRISTMAS) & december & (monthday >= 26)] = 9 # Christmas Octave
+    ranks[seasons == LENT] = 9
+    ranks[(seasons == LENT) & (weeks == 6)] = 2 # Holy Week
+    ranks[(seasons == EASTER) & (weeks == 1)] = 2 # Easter Octave
+    ranks[seasons == TRIDUUM] = 1
+    ranks[sunday] = np.where(np.isin(seasons[sunday], [ADVENT, LENT, EASTER]), 2, 6)
+    return ranks
+
+def computedays(first, last, flags, out):
+    """
+    This function computes the daily calendar of a range of calendar years of one profile into preallocated arrays.
+
+    Args:
+        first (int): The first calendar year (from 1).
+        last (int): The last calendar year (included, up to 9998).
+        flags (dict): The flags of the profile, see `liturgicalyear.PROFILES`.
+        out (dict): field -> 1-D array of the days from 1 January of the first year to 31 December of the last year, for every field of `FIELDS` (e.g. one row of a `CalendarStore`, or a slice of a shared memory block).
+    """
+    start = rd(first, 1, 1)
+    numbers = np.arange(start, rd(last + 1, 1, 1), dtype = np.int64)
+    seasons, weeks, years = classify((numbers - EPOCH).astype("datetime64[D]"), flags["calendar"], flags["epiphany_on_jan6th"])
+    out["season"][:] = seasons
+    out["week"][:] = weeks
+    out["rank"][:] = dayranks(numbers, seasons, weeks)
+    out["celebration"][:] = 0
+    for year in range(first, last + 1):
+        offset = rd(year, 1, 1) - start
+        yearcolors = colorarray(year, **flags)
+        out["color"][offset:offset + len(yearcolors)] = yearcolors
+        best = {} # index -> (precedence, name), the celebration of highest precedence of every day.
+        for day, name, season in LiturgicalYear(year, **flags).celebrations:
+            index = day.toordinal() - start
+            precedence = PRECEDENCE.get(name, 6) # Sundays of Ordinary Time
+            if index not in best or precedence < best[index][0]: best[index] = (precedence, name)
+        for index, (precedence, name) in best.items():
+            out["celebration"][index] = NAMEIDS[name]
+            out["rank"][index] = precedence
+
+class Day:
+    """
+    This class is a lightweight view of one day of a `CalendarStore`, created on access only.
+    """
+    __slots__ = ("store", "row", "index")
+    def __init__(self, store, row, index):
+        """
+        This method initializes the Day class.
+
+        Args:
+            store (CalendarStore): The store.
+            row (int): The row of the profile in the arrays.
+            index (int): The column of the day in the arrays.
+        """
+        self.store = store
+        self.row = row
+        self.index = index
+    @property
+    def date(self) -> date:
+        """
+        This property returns the date of the day.
+        """
+        return todate(self.store.start + self.index)
+    @property
+    def profile(self) -> str:
+        """
+        This property returns the profile of the day, see `liturgicalyear.PROFILES`.
+        """
+        return self.store.profiles[self.row]
+    @property
+    def season(self) -> str:
+        """
+        This property returns the season of the day, see `classify.SEASONS`.
+        """
+        return SEASONS[self.store.season[self.row, self.index]]
+    @property
+    def week(self) -> int:
+        """
+        This property returns the week of the season of the day.
+        """
+        return int(self.store.week[self.row, self.index])
+    @property
+    def celebration(self) -> str:
+        """
+        This property returns the celebration of the day, or None.
+        """
+        return self.store.names[self.store.celebration[self.row, self.index]] or None
+    @property
+    def color(self) -> str:
+        """
+        This property returns the liturgical color of the day, see `colors.COLORNAMES`.
+        """
+        return COLORNAMES[self.store.color[self.row, self.index]]
+    @property
+    def rank(self) -> int:
+        """
+        This property returns the precedence of the day, see `RANKS`.
+        """
+        return int(self.store.rank[self.row, self.index])
+    def asdict(self) -> dict:
+        """
+        This method returns the fields of the day as a dictionary.
+        """
+        return {"date": self.date, "profile": self.profile, "season": self.season, "week": self.week, "celebration": self.celebration, "color": self.color, "rank": self.rank}
+    def __repr__(self) -> str:
+        """
+        This method returns the representation of the day.
+        """
+        return f"Day({self.date}, {self.profile}, {self.season} {self.week}, {self.celebration}, {self.color}, rank {self.rank})"
+
+class CalendarStore:
+    """
+    This class keeps the daily calendar of a range of years and profiles as a struct-of-arrays.
+    """
+    def __init__(self, first, last, profiles = None):
+        """
+        This method initializes the CalendarStore class, computing every day of every profile.
+
+        Args:
+            first (int): The first calendar year (from 1).
+            last (int): The last calendar year (included, up to 9998).
+            profiles (list of str): The profiles, see `liturgicalyear.PROFILES`. Default is all profiles.
+        """
+        self.first = first
+        self.last = last
+        self.profiles = list(PROFILES) if profiles is None else list(profiles)
+        self.rows = {profile: row for row, profile in enumerate(self.profiles)}
+        self.start = rd(first, 1, 1)
+        self.days = rd(last + 1, 1, 1) - self.start
+        self.names = NAMES
+        for field, dtype in FIELDS.items(): setattr(self, field, np.zeros((len(self.profiles), self.days), dtype = dtype))
+        for row, profile in enumerate(self.profiles):
+            computedays(first, last, PROFILES[profile], {field: getattr(self, field)[row] for field in FIELDS})
+    @property
+    def nbytes(self) -> int:
+        """
+        This property returns the memory used by the arrays, BYTESPERDAY per day and profile.
+        """
+        return sum(getattr(self, field).nbytes for field in FIELDS)
+    def day(self, day, profile = "gregorian") -> Day:
+        """
+        This method returns the view of a day of a profile.
+
+        Args:
+            day (date): The date, from 1 January of the first year to 31 December of the last year.
+            profile (str): The profile, see `liturgicalyear.PROFILES`. Default is "gregorian".
+        """
+        index = day.toordinal() - self.start
+        if not 0 <= index < self.days: raise ValueError(f"{day} is not in the years {self.first} to {self.last}")
+        return Day(self, self.rows[profile], index)
+    def year(self, year, profile = "gregorian"):
+        """
+        This method yields the views of every day of a calendar year of a profile, one at a time.
+        """
+        if not self.first <= year <= self.last: raise ValueError(f"{year} is not in the years {self.first} to {self.last}")
+        row = self.rows[profile]
+        for index in range(rd(year, 1, 1) - self.start, rd(year + 1, 1, 1) - self.start):
+            yield Day(self, row, index)
+    def celebrations(self, year, profile = "gregorian") -> list:
+        """
+        This method lists the days of a calendar year with a celebration, as the (date, name) tuples of the highest precedence celebration of every day.
+        """
+        row = self.rows[profile]
+        begin = rd(year, 1, 1) - self.start
+        ids = self.celebration[row, begin:rd(year + 1, 1, 1) - self.start]
+        return [(todate(self.start + begin + int(index)), self.names[ids[index]]) for index in np.flatnonzero(ids)]
+
+if __name__ == "__main__":
+    # Testing program, building a store of a century and printing its memory budget and a few days.
+    store = CalendarStore(2000, 2099)
+    print(f"{len(store.profiles)} profiles x {store.days} days: {store.nbytes} bytes ({store.nbytes / (len(store.profiles) * store.days):.0f} bytes per day), {len(store.names) - 1} names")
+    for day in [date(2025, 1, 1), date(2025, 3, 5), date(2025, 4, 18), date(2025, 4, 20), date(2025, 7, 14), date(2025, 12, 20)]:
+        print(store.day(day))
@@ -0,0 +1,195 @@
+"""
+A Python module to find the weekday of any date, the doomsday and the dominical letter(s) of any year, in the Gregorian or Julian calendar, by table lookup.
+
+The weekdays repeat every 400 years in the Gregorian calendar (146097 days = 20871 weeks) and every 28 years in the Julian calendar (10227 days = 1461 weeks), so the weekday of 1 January of every year of both cycles is precomputed once, and every answer is O(1) for any year (including years before 1 and after 9999).
+As in `YearInfo`, years after 1582 are Gregorian and years up to 1582 are Julian unless `gregorian` is given, and weekdays are numbered 0 = Sunday, 1 = Monday, ..., 6 = Saturday.
+The batch variants take NumPy arrays of years (and months and days) and use the same tables. The scalar functions (and `YearInfo`) work without NumPy.
+"""
+
+try:
+    import numpy as np
+except ImportError: # Only the batch functions need NumPy.
+    np = None
+
+REFORMYEAR = 1582 # The last year counted in the Julian calendar, as in `easter` and `YearInfo`.
+BUDDHISTERA = 543 # Thai Buddhist Era year = Gregorian year + 543.
+
+# Days before the first day of each month (index 1 to 12), in common and leap years.
+MONTHSTART = [
+    [0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334],
+    [0, 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335],
+]
+
+def _newyeartable(cycle, leap) -> list:
+    """
+    This function counts the weekday of 1 January of every year of a calendar cycle, starting from year 0 of the cycle.
+    1 January of year 0 (1 BC) is a Saturday in the proleptic Gregorian calendar and a Thursday in the Julian calendar.
+    """
+    weekday = 6 if cycle == 400 else 4
+    table = []
+    for year in range(cycle):
+        table.append(weekday)
+        weekday = (weekday + 366 if leap(year) else weekday + 365) % 7
+    return table
+
+GREGORIANLEAP = [year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) for year in range(400)]
+JULIANLEAP = [year % 4 == 0 for year in range(28)]
+GREGORIANNEWYEAR = _newyeartable(400, lambda year: GREGORIANLEAP[year])
+JULIANNEWYEAR = _newyeartable(28, lambda year: JULIANLEAP[year])
+# The doomsday is the weekday of the last day of February, i.e. 1 January + 58 days (+ 1 in leap years).
+GREGORIANDOOMSDAY = [(weekday + 58 + leap) % 7 for weekday, leap in zip(GREGORIANNEWYEAR, GREGORIANLEAP)]
+JULIANDOOMSDAY = [(weekday + 58 + leap) % 7 for weekday, leap in zip(JULIANNEWYEAR, JULIANLEAP)]
+# The dominical letter of a common year whose 1 January falls on each weekday (A is 1 January, B is 2 January, ...).
+LETTERS = ["A", "G", "F", "E", "D", "C", "B"]
+
+def _gregorian(year, gregorian) -> bool:
+    """
+    This function decides whether a year is counted in the Gregorian calendar.
+    """
+    return year > REFORMYEAR if gregorian is None else gregorian
+
+def isleap(year, gregorian = None) -> bool:
+    """
+    This function checks if a given year is a leap year.
+
+    Args:
+        year (int): The year to check.
+        gregorian (bool): Whether the year is counted in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    return GREGORIANLEAP[year % 400] if _gregorian(year, gregorian) else JULIANLEAP[year % 28]
+
+def newyear(year, gregorian = None) -> int:
+    """
+    This function returns the weekday of 1 January of a given year (0 = Sunday).
+
+    Args:
+        year (int): The year.
+        gregorian (bool): Whether the year is counted in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    return GREGORIANNEWYEAR[year % 400] if _gregorian(year, gregorian) else JULIANNEWYEAR[year % 28]
+
+def weekday(year, month, day, gregorian = None) -> int:
+    """
+    This function returns the weekday of a given date (0 = Sunday).
+
+    Args:
+        year (int): The year of the date.
+        month (int): The month of the date (1 to 12).
+        day (int): The day of the month.
+        gregorian (bool): Whether the date is in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    gregorian = _gregorian(year, gregorian)
+    return (newyear(year, gregorian) + MONTHSTART[isleap(year, gregorian)][month] + day - 1) % 7
+
+def doomsday(year, gregorian = None) -> int:
+    """
+    This function returns the doomsday of a given year (0 = Sunday), the weekday of the last day of February, March 14, April 4, May 9, June 6, July 11, August 8, September 5, October 10, November 7 and December 12.
+
+    Args:
+        year (int): The year.
+        gregorian (bool): Whether the year is counted in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    return GREGORIANDOOMSDAY[year % 400] if _gregorian(year, gregorian) else JULIANDOOMSDAY[year % 28]
+
+def dominicalletter(year, gregorian = None) -> str:
+    """
+    This function returns the dominical letter(s) of a given year, the letter of the first Sunday of the year when 1 January is A, 2 January is B, etc.
+    Leap years have two letters: the second one is used after the leap day (24 February).
+    The reform year 1582 (when gregorian is None) also has two letters: the Julian letter until 4 October and the Gregorian letter from 15 October, i.e. "GC".
+
+    Args:
+        year (int): The year.
+        gregorian (bool): Whether the year is counted in the Gregorian calendar. Default is None (Gregorian after 1582, Julian until 1582).
+    """
+    if gregorian is None and year == REFORMYEAR:
+        return LETTERS[newyear(year, False)] + LETTERS[newyear(year, True)]
+    first = newyear(year, gregorian)
+    if isleap(year, gregorian): return LETTERS[first] + LETTERS[(first + 1) % 7]
+    return LETTERS[first]
+
+def thaidoomsday(be) -> int:
+    """
+    This function returns the doomsday of a given Thai (Buddhist Era) year, e.g. BE 2568 = AD 2025.
+
+    Args:
+        be (int): The Buddhist Era year.
+    """
+    return doomsday(be - BUDDHISTERA)
+
+def _batch(years, gregorian) -> tuple:
+    """
+    This function returns the years as an int64 array and the mask of the years counted in the Gregorian calendar.
+    """
+    years = np.asarray(years, dtype = np.int64)
+    if gregorian is None: return years, years > REFORMYEAR
+    return years, np.full(years.shape, bool(gregorian))
+
+if np is not None:
+    _GREGORIANNEWYEAR = np.array(GREGORIANNEWYEAR, dtype = np.int8)
+    _JULIANNEWYEAR = np.array(JULIANNEWYEAR, dtype = np.int8)
+    _GREGORIANLEAP = np.array(GREGORIANLEAP, dtype = np.int8)
+    _JULIANLEAP = np.array(JULIANLEAP, dtype = np.int8)
+    _GREGORIANDOOMSDAY = np.array(GREGORIANDOOMSDAY, dtype = np.int8)
+    _JULIANDOOMSDAY = np.array(JULIANDOOMSDAY, dtype = np.int8)
+    _MONTHSTART = np.array(MONTHSTART, dtype = np.int16)
+    _LETTERS = np.array(LETTERS)
+
+def isleaps(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `isleap` for an array of years.
+    """
+    years, mask = _batch(years, gregorian)
+    return np.where(mask, _GREGORIANLEAP[years % 400], _JULIANLEAP[years % 28]).astype(bool)
+
+def newyears(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `newyear` for an array of years.
+    """
+    years, mask = _batch(years, gregorian)
+    return np.where(mask, _GREGORIANNEWYEAR[years % 400], _JULIANNEWYEAR[years % 28])
+
+def weekdays(years, months, days, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `weekday` for arrays of years, months and days (broadcast together).
+    """
+    years, mask = _batch(years, gregorian)
+    leap = np.where(mask, _GREGORIANLEAP[years % 400], _JULIANLEAP[years % 28])
+    first = np.where(mask, _GREGORIANNEWYEAR[years % 400], _JULIANNEWYEAR[years % 28])
+    return ((first + _MONTHSTART[leap, np.asarray(months)] + np.asarray(days) - 1) % 7).astype(np.int8)
+
+def doomsdays(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `doomsday` for an array of years.
+    """
+    years, mask = _batch(years, gregorian)
+    return np.where(mask, _GREGORIANDOOMSDAY[years % 400], _JULIANDOOMSDAY[years % 28])
+
+def dominicalletters(years, gregorian = None) -> "np.ndarray":
+    """
+    This function is the batch variant of `dominicalletter` for an array of years, returning an array of strings.
+    """
+    years, mask = _batch(years, gregorian)
+    first = np.where(mask, _GREGORIANNEWYEAR[years % 400], _JULIANNEWYEAR[years % 28])
+    leap = np.where(mask, _GREGORIANLEAP[years % 400], _JULIANLEAP[years % 28]).astype(bool)
+    letters = np.where(leap, np.char.add(_LETTERS[first], _LETTERS[(first + 1) % 7]), _LETTERS[first])
+    if gregorian is None:
+        reform = years == REFORMYEAR
+        letters[reform] = dominicalletter(REFORMYEAR)
+    return letters
+
+def thaidoomsdays(be) -> "np.ndarray":
+    """
+    This function is the batch variant of `thaidoomsday` for an array of Buddhist Era years.
+    """
+    return doomsdays(np.asarray(be, dtype = np.int64) - BUDDHISTERA)
+
+if __name__ == "__main__":
+    # Testing program, printing the weekday information of a given year.
+    year = 2025
+    days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+    print(f"New Year {year} is on {days[newyear(year)]}.")
+    print(f"The Doomsday of the year {year} is {days[doomsday(year)]}.")
+    print(f"The Dominical Letter of the year {year} is {dominicalletter(year)}.")
+    print(f"The Doomsday of the Thai year BE {year + BUDDHISTERA} is {days[thaidoomsday(year + BUDDHISTERA)]}.")
+    print(f"Christmas {year} is on {days[weekday(year, 12, 25)]}.")
+    print(f"Dominical Letters of {year} to {year + 9}: {' '.join(dominicalletters(np.arange(year, year + 10)))}")